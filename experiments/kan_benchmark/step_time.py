@@ -0,0 +1,83 @@
+import time
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+import torch
+
+from neuralforecast import NeuralForecast
+from neuralforecast.models import KAN
+from neuralforecast.models.kan import KANLinear
+
+logging.getLogger("pytorch_lightning").setLevel(logging.ERROR)
+
+
+def layer_step_time(batch_size, in_features, out_features, n_steps):
+    # Forward and backward pass of a single KANLinear layer
+    layer = KANLinear(in_features, out_features)
+    x = torch.randn(batch_size, in_features)
+    for _ in range(10):
+        layer(x).sum().backward()
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        layer(x).sum().backward()
+    return (time.perf_counter() - start) / n_steps
+
+
+def model_step_time(n_series, horizon, n_steps):
+    # Training step of the full KAN model, the fit with a single step
+    # is subtracted to remove the trainer setup overhead
+    rng = np.random.default_rng(0)
+    n_obs = 10 * horizon
+    Y_df = pd.DataFrame(
+        {
+            "unique_id": np.repeat(np.arange(n_series), n_obs),
+            "ds": np.tile(np.arange(n_obs), n_series),
+            "y": rng.normal(size=n_series * n_obs).cumsum(),
+        }
+    )
+
+    def fit_time(max_steps):
+        model = KAN(
+            h=horizon,
+            input_size=2 * horizon,
+            max_steps=max_steps,
+            scaler_type="robust",
+            enable_progress_bar=False,
+            enable_model_summary=False,
+            logger=False,
+            enable_checkpointing=False,
+        )
+        nf = NeuralForecast(models=[model], freq=1)
+        start = time.perf_counter()
+        nf.fit(Y_df)
+        return time.perf_counter() - start
+
+    return (fit_time(n_steps + 1) - fit_time(1)) / n_steps
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_steps", type=int, default=200)
+    parser.add_argument("--n_series", type=int, default=1000)
+    parser.add_argument("--horizon", type=int, default=18)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    # Layer shapes of the default KAN for horizon 18
+    results = [
+        [
+            f"KANLinear({in_features}, {out_features}), batch 1024",
+            1000 * layer_step_time(1024, in_features, out_features, args.n_steps),
+        ]
+        for in_features, out_features in [(36, 512), (512, 18)]
+    ]
+    results.append(
+        [
+            f"KAN(h={args.horizon}), {args.n_series} series",
+            1000 * model_step_time(args.n_series, args.horizon, args.n_steps),
+        ]
+    )
+    results_df = pd.DataFrame(data=results, columns=["benchmark", "step time (ms)"])
+    print(results_df.to_string(index=False))
@@ -1,4 +1,5 @@
 __version__ = "1.7.4"
 __all__ = ['NeuralForecast']
 from .core import NeuralForecast
+from .core import ForecastArrays  # noqa: F401
 from .common._base_model import DistributedConfig  # noqa: F401
@@ -153,11 +153,24 @@ d = { 'settings': { 'branch': 'main',
                                      'neuralforecast.auto.AutoiTransformer.get_default_config': ( 'models.html#autoitransformer.get_default_config',
                                                                                                   'neuralforecast/auto.py')},
             'neuralforecast.compat': {},
-            'neuralforecast.core': { 'neuralforecast.core.NeuralForecast': ('core.html#neuralforecast', 'neuralforecast/core.py'),
+            'neuralforecast.core': { 'neuralforecast.core.ForecastArrays': ('core.html#forecastarrays', 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast': ('core.html#neuralforecast', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.__init__': ( 'core.html#neuralforecast.__init__',
                                                                                       'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._check_futr_df': ( 'core.html#neuralforecast._check_futr_df',
+                                                                                            'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._check_nan': ( 'core.html#neuralforecast._check_nan',
                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._fcsts_output': ( 'core.html#neuralforecast._fcsts_output',
+                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._fit_groups': ( 'core.html#neuralforecast._fit_groups',
+                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._fit_models_in_processes': ( 'core.html#neuralforecast._fit_models_in_processes',
+                                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._frame_output': ( 'core.html#neuralforecast._frame_output',
+                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._futr_rows': ( 'core.html#neuralforecast._futr_rows',
+                                                                                        'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._get_model_names': ( 'core.html#neuralforecast._get_model_names',
                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._get_needed_exog': ( 'core.html#neuralforecast._get_needed_exog',
@@ -166,14 +179,26 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._no_refit_cross_validation': ( 'core.html#neuralforecast._no_refit_cross_validation',
                                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._predict_dataset': ( 'core.html#neuralforecast._predict_dataset',
+                                                                                              'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._predict_distributed': ( 'core.html#neuralforecast._predict_distributed',
                                                                                                   'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._predict_insample_chunk': ( 'core.html#neuralforecast._predict_insample_chunk',
+                                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._predict_insample_chunks': ( 'core.html#neuralforecast._predict_insample_chunks',
+                                                                                                      'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit': ( 'core.html#neuralforecast._prepare_fit',
                                                                                           'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit_distributed': ( 'core.html#neuralforecast._prepare_fit_distributed',
                                                                                                       'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit_for_local_files': ( 'core.html#neuralforecast._prepare_fit_for_local_files',
                                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._prepare_fit_for_parquet': ( 'core.html#neuralforecast._prepare_fit_for_parquet',
+                                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._refit_cross_validation_in_processes': ( 'core.html#neuralforecast._refit_cross_validation_in_processes',
+                                                                                                                  'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._refit_cross_validation_windows': ( 'core.html#neuralforecast._refit_cross_validation_windows',
+                                                                                                             'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._reset_models': ( 'core.html#neuralforecast._reset_models',
                                                                                            'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._scalers_fit_transform': ( 'core.html#neuralforecast._scalers_fit_transform',
@@ -182,6 +207,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._scalers_transform': ( 'core.html#neuralforecast._scalers_transform',
                                                                                                 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._set_max_steps': ( 'core.html#neuralforecast._set_max_steps',
+                                                                                            'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._set_window_dataset': ( 'core.html#neuralforecast._set_window_dataset',
+                                                                                                 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.cross_validation': ( 'core.html#neuralforecast.cross_validation',
                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.fit': ('core.html#neuralforecast.fit', 'neuralforecast/core.py'),
@@ -194,9 +223,22 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.predict_insample': ( 'core.html#neuralforecast.predict_insample',
                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.predict_insample_iter': ( 'core.html#neuralforecast.predict_insample_iter',
+                                                                                                   'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.predict_iter': ( 'core.html#neuralforecast.predict_iter',
+                                                                                          'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.save': ('core.html#neuralforecast.save', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._block_tails_idxs': ('core.html#_block_tails_idxs', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._check_output': ('core.html#_check_output', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._concat_outputs': ('core.html#_concat_outputs', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._fit_models': ('core.html#_fit_models', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._fit_models_in_process': ( 'core.html#_fit_models_in_process',
+                                                                                     'neuralforecast/core.py'),
                                      'neuralforecast.core._id_as_idx': ('core.html#_id_as_idx', 'neuralforecast/core.py'),
                                      'neuralforecast.core._insample_times': ('core.html#_insample_times', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._ranges_idxs': ('core.html#_ranges_idxs', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._refit_cross_validation_in_process': ( 'core.html#_refit_cross_validation_in_process',
+                                                                                                 'neuralforecast/core.py'),
                                      'neuralforecast.core._warn_id_as_idx': ('core.html#_warn_id_as_idx', 'neuralforecast/core.py')},
             'neuralforecast.losses.numpy': { 'neuralforecast.losses.numpy._divide_no_nan': ( 'losses.numpy.html#_divide_no_nan',
                                                                                              'neuralforecast/losses/numpy.py'),
@@ -280,6 +322,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.DistributionLoss.get_distribution': ( 'losses.pytorch.html#distributionloss.get_distribution',
                                                                                                                     'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.DistributionLoss.get_quantiles': ( 'losses.pytorch.html#distributionloss.get_quantiles',
+                                                                                                                 'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.DistributionLoss.sample': ( 'losses.pytorch.html#distributionloss.sample',
                                                                                                           'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM': ( 'losses.pytorch.html#gmm',
@@ -290,6 +334,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.domain_map': ( 'losses.pytorch.html#gmm.domain_map',
                                                                                                  'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.GMM.get_quantiles': ( 'losses.pytorch.html#gmm.get_quantiles',
+                                                                                                    'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.neglog_likelihood': ( 'losses.pytorch.html#gmm.neglog_likelihood',
                                                                                                         'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.sample': ( 'losses.pytorch.html#gmm.sample',
@@ -378,6 +424,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                 'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.domain_map': ( 'losses.pytorch.html#nbmm.domain_map',
                                                                                                   'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.NBMM.get_quantiles': ( 'losses.pytorch.html#nbmm.get_quantiles',
+                                                                                                     'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.neglog_likelihood': ( 'losses.pytorch.html#nbmm.neglog_likelihood',
                                                                                                          'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.sample': ( 'losses.pytorch.html#nbmm.sample',
@@ -392,6 +440,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.domain_map': ( 'losses.pytorch.html#pmm.domain_map',
                                                                                                  'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.PMM.get_quantiles': ( 'losses.pytorch.html#pmm.get_quantiles',
+                                                                                                    'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.neglog_likelihood': ( 'losses.pytorch.html#pmm.neglog_likelihood',
                                                                                                         'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.sample': ( 'losses.pytorch.html#pmm.sample',
@@ -444,12 +494,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.Tweedie.variance': ( 'losses.pytorch.html#tweedie.variance',
                                                                                                    'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.Tweedie.zero_mass': ( 'losses.pytorch.html#tweedie.zero_mass',
+                                                                                                    'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch._betainc': ( 'losses.pytorch.html#_betainc',
+                                                                                           'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch._divide_no_nan': ( 'losses.pytorch.html#_divide_no_nan',
                                                                                                  'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch._integer_icdf': ( 'losses.pytorch.html#_integer_icdf',
+                                                                                                'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch._weighted_mean': ( 'losses.pytorch.html#_weighted_mean',
                                                                                                  'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.bernoulli_domain_map': ( 'losses.pytorch.html#bernoulli_domain_map',
                                                                                                        'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.bernoulli_quantiles': ( 'losses.pytorch.html#bernoulli_quantiles',
+                                                                                                      'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.bernoulli_scale_decouple': ( 'losses.pytorch.html#bernoulli_scale_decouple',
                                                                                                            'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.est_alpha': ( 'losses.pytorch.html#est_alpha',
@@ -466,14 +524,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.nbinomial_domain_map': ( 'losses.pytorch.html#nbinomial_domain_map',
                                                                                                        'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.nbinomial_quantiles': ( 'losses.pytorch.html#nbinomial_quantiles',
+                                                                                                      'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.nbinomial_scale_decouple': ( 'losses.pytorch.html#nbinomial_scale_decouple',
                                                                                                            'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.normal_domain_map': ( 'losses.pytorch.html#normal_domain_map',
                                                                                                     'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.normal_quantiles': ( 'losses.pytorch.html#normal_quantiles',
+                                                                                                   'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.normal_scale_decouple': ( 'losses.pytorch.html#normal_scale_decouple',
                                                                                                         'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.poisson_domain_map': ( 'losses.pytorch.html#poisson_domain_map',
                                                                                                      'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.poisson_quantiles': ( 'losses.pytorch.html#poisson_quantiles',
+                                                                                                    'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.poisson_scale_decouple': ( 'losses.pytorch.html#poisson_scale_decouple',
                                                                                                          'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.quantiles_to_outputs': ( 'losses.pytorch.html#quantiles_to_outputs',
@@ -492,10 +556,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.student_domain_map': ( 'losses.pytorch.html#student_domain_map',
                                                                                                      'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.student_quantiles': ( 'losses.pytorch.html#student_quantiles',
+                                                                                                    'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.student_scale_decouple': ( 'losses.pytorch.html#student_scale_decouple',
                                                                                                          'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.tweedie_domain_map': ( 'losses.pytorch.html#tweedie_domain_map',
                                                                                                      'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.tweedie_quantiles': ( 'losses.pytorch.html#tweedie_quantiles',
+                                                                                                    'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.tweedie_scale_decouple': ( 'losses.pytorch.html#tweedie_scale_decouple',
                                                                                                          'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.weighted_average': ( 'losses.pytorch.html#weighted_average',
@@ -756,6 +824,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'neuralforecast/models/hint.py'),
                                             'neuralforecast.models.hint.HINT.set_test_size': ( 'models.hint.html#hint.set_test_size',
                                                                                                'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._MinTraceP': ( 'models.hint.html#_mintracep',
+                                                                                       'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._MinTraceP._K_matvec': ( 'models.hint.html#_mintracep._k_matvec',
+                                                                                                 'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._MinTraceP._K_solve': ( 'models.hint.html#_mintracep._k_solve',
+                                                                                                'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._MinTraceP.__init__': ( 'models.hint.html#_mintracep.__init__',
+                                                                                                'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._MinTraceP.__matmul__': ( 'models.hint.html#_mintracep.__matmul__',
+                                                                                                  'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._sorted_quantiles': ( 'models.hint.html#_sorted_quantiles',
+                                                                                              'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._sparse_bottomup_P': ( 'models.hint.html#_sparse_bottomup_p',
+                                                                                               'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._sparse_mintrace_ols_P': ( 'models.hint.html#_sparse_mintrace_ols_p',
+                                                                                                   'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._sparse_mintrace_wls_P': ( 'models.hint.html#_sparse_mintrace_wls_p',
+                                                                                                   'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._sparse_rows': ( 'models.hint.html#_sparse_rows',
+                                                                                         'neuralforecast/models/hint.py'),
+                                            'neuralforecast.models.hint._to_sparse': ( 'models.hint.html#_to_sparse',
+                                                                                       'neuralforecast/models/hint.py'),
                                             'neuralforecast.models.hint.get_bottomup_P': ( 'models.hint.html#get_bottomup_p',
                                                                                            'neuralforecast/models/hint.py'),
                                             'neuralforecast.models.hint.get_identity_P': ( 'models.hint.html#get_identity_p',
@@ -804,8 +894,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                                           'neuralforecast/models/itransformer.py'),
                                                     'neuralforecast.models.itransformer.FullAttention.__init__': ( 'models.itransformer.html#fullattention.__init__',
                                                                                                                    'neuralforecast/models/itransformer.py'),
+                                                    'neuralforecast.models.itransformer.FullAttention._attend': ( 'models.itransformer.html#fullattention._attend',
+                                                                                                                  'neuralforecast/models/itransformer.py'),
                                                     'neuralforecast.models.itransformer.FullAttention.forward': ( 'models.itransformer.html#fullattention.forward',
                                                                                                                   'neuralforecast/models/itransformer.py'),
+                                                    'neuralforecast.models.itransformer.LinearAttention': ( 'models.itransformer.html#linearattention',
+                                                                                                            'neuralforecast/models/itransformer.py'),
+                                                    'neuralforecast.models.itransformer.LinearAttention.__init__': ( 'models.itransformer.html#linearattention.__init__',
+                                                                                                                     'neuralforecast/models/itransformer.py'),
+                                                    'neuralforecast.models.itransformer.LinearAttention.forward': ( 'models.itransformer.html#linearattention.forward',
+                                                                                                                    'neuralforecast/models/itransformer.py'),
                                                     'neuralforecast.models.itransformer.TriangularCausalMask': ( 'models.itransformer.html#triangularcausalmask',
                                                                                                                  'neuralforecast/models/itransformer.py'),
                                                     'neuralforecast.models.itransformer.TriangularCausalMask.__init__': ( 'models.itransformer.html#triangularcausalmask.__init__',
@@ -831,6 +929,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'neuralforecast/models/kan.py'),
                                            'neuralforecast.models.kan.KANLinear.__init__': ( 'models.kan.html#kanlinear.__init__',
                                                                                              'neuralforecast/models/kan.py'),
+                                           'neuralforecast.models.kan.KANLinear._load_from_state_dict': ( 'models.kan.html#kanlinear._load_from_state_dict',
+                                                                                                          'neuralforecast/models/kan.py'),
                                            'neuralforecast.models.kan.KANLinear.b_splines': ( 'models.kan.html#kanlinear.b_splines',
                                                                                               'neuralforecast/models/kan.py'),
                                            'neuralforecast.models.kan.KANLinear.curve2coeff': ( 'models.kan.html#kanlinear.curve2coeff',
@@ -844,7 +944,9 @@ d = { 'settings': { 'branch': 'main',
                                            'neuralforecast.models.kan.KANLinear.scaled_spline_weight': ( 'models.kan.html#kanlinear.scaled_spline_weight',
                                                                                                          'neuralforecast/models/kan.py'),
                                            'neuralforecast.models.kan.KANLinear.update_grid': ( 'models.kan.html#kanlinear.update_grid',
-                                                                                                'neuralforecast/models/kan.py')},
+                                                                                                'neuralforecast/models/kan.py'),
+                                           'neuralforecast.models.kan.KANLinear.update_spline_cache': ( 'models.kan.html#kanlinear.update_spline_cache',
+                                                                                                        'neuralforecast/models/kan.py')},
             'neuralforecast.models.lstm': { 'neuralforecast.models.lstm.LSTM': ('models.lstm.html#lstm', 'neuralforecast/models/lstm.py'),
                                             'neuralforecast.models.lstm.LSTM.__init__': ( 'models.lstm.html#lstm.__init__',
                                                                                           'neuralforecast/models/lstm.py'),
@@ -1084,12 +1186,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                    'neuralforecast/models/stemgnn.py'),
                                                'neuralforecast.models.stemgnn.StemGNN.self_graph_attention': ( 'models.stemgnn.html#stemgnn.self_graph_attention',
                                                                                                                'neuralforecast/models/stemgnn.py'),
+                                               'neuralforecast.models.stemgnn.StemGNN.sparse_graph_attention': ( 'models.stemgnn.html#stemgnn.sparse_graph_attention',
+                                                                                                                 'neuralforecast/models/stemgnn.py'),
+                                               'neuralforecast.models.stemgnn.StemGNN.sparse_latent_correlation_layer': ( 'models.stemgnn.html#stemgnn.sparse_latent_correlation_layer',
+                                                                                                                          'neuralforecast/models/stemgnn.py'),
                                                'neuralforecast.models.stemgnn.StockBlockLayer': ( 'models.stemgnn.html#stockblocklayer',
                                                                                                   'neuralforecast/models/stemgnn.py'),
                                                'neuralforecast.models.stemgnn.StockBlockLayer.__init__': ( 'models.stemgnn.html#stockblocklayer.__init__',
                                                                                                            'neuralforecast/models/stemgnn.py'),
                                                'neuralforecast.models.stemgnn.StockBlockLayer.forward': ( 'models.stemgnn.html#stockblocklayer.forward',
                                                                                                           'neuralforecast/models/stemgnn.py'),
+                                               'neuralforecast.models.stemgnn.StockBlockLayer.sparse_cheb_conv': ( 'models.stemgnn.html#stockblocklayer.sparse_cheb_conv',
+                                                                                                                   'neuralforecast/models/stemgnn.py'),
                                                'neuralforecast.models.stemgnn.StockBlockLayer.spe_seq_cell': ( 'models.stemgnn.html#stockblocklayer.spe_seq_cell',
                                                                                                                'neuralforecast/models/stemgnn.py')},
             'neuralforecast.models.tcn': { 'neuralforecast.models.tcn.TCN': ('models.tcn.html#tcn', 'neuralforecast/models/tcn.py'),
@@ -1217,20 +1325,36 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                    'neuralforecast/models/timellm.py'),
                                                'neuralforecast.models.timellm.TimeLLM': ( 'models.timellm.html#timellm',
                                                                                           'neuralforecast/models/timellm.py'),
+                                               'neuralforecast.models.timellm.TimeLLM.__deepcopy__': ( 'models.timellm.html#timellm.__deepcopy__',
+                                                                                                       'neuralforecast/models/timellm.py'),
                                                'neuralforecast.models.timellm.TimeLLM.__init__': ( 'models.timellm.html#timellm.__init__',
                                                                                                    'neuralforecast/models/timellm.py'),
+                                               'neuralforecast.models.timellm.TimeLLM._format_prompt': ( 'models.timellm.html#timellm._format_prompt',
+                                                                                                         'neuralforecast/models/timellm.py'),
+                                               'neuralforecast.models.timellm.TimeLLM._is_llm_key': ( 'models.timellm.html#timellm._is_llm_key',
+                                                                                                      'neuralforecast/models/timellm.py'),
                                                'neuralforecast.models.timellm.TimeLLM.calcute_lags': ( 'models.timellm.html#timellm.calcute_lags',
                                                                                                        'neuralforecast/models/timellm.py'),
                                                'neuralforecast.models.timellm.TimeLLM.forecast': ( 'models.timellm.html#timellm.forecast',
                                                                                                    'neuralforecast/models/timellm.py'),
                                                'neuralforecast.models.timellm.TimeLLM.forward': ( 'models.timellm.html#timellm.forward',
                                                                                                   'neuralforecast/models/timellm.py'),
+                                               'neuralforecast.models.timellm.TimeLLM.get_prompt_ids': ( 'models.timellm.html#timellm.get_prompt_ids',
+                                                                                                         'neuralforecast/models/timellm.py'),
+                                               'neuralforecast.models.timellm.TimeLLM.get_source_embeddings': ( 'models.timellm.html#timellm.get_source_embeddings',
+                                                                                                                'neuralforecast/models/timellm.py'),
+                                               'neuralforecast.models.timellm.TimeLLM.load_state_dict': ( 'models.timellm.html#timellm.load_state_dict',
+                                                                                                          'neuralforecast/models/timellm.py'),
+                                               'neuralforecast.models.timellm.TimeLLM.state_dict': ( 'models.timellm.html#timellm.state_dict',
+                                                                                                     'neuralforecast/models/timellm.py'),
                                                'neuralforecast.models.timellm.TokenEmbedding': ( 'models.timellm.html#tokenembedding',
                                                                                                  'neuralforecast/models/timellm.py'),
                                                'neuralforecast.models.timellm.TokenEmbedding.__init__': ( 'models.timellm.html#tokenembedding.__init__',
                                                                                                           'neuralforecast/models/timellm.py'),
                                                'neuralforecast.models.timellm.TokenEmbedding.forward': ( 'models.timellm.html#tokenembedding.forward',
-                                                                                                         'neuralforecast/models/timellm.py')},
+                                                                                                         'neuralforecast/models/timellm.py'),
+                                               'neuralforecast.models.timellm._load_pretrained_llm': ( 'models.timellm.html#_load_pretrained_llm',
+                                                                                                       'neuralforecast/models/timellm.py')},
             'neuralforecast.models.timemixer': { 'neuralforecast.models.timemixer.DFT_series_decomp': ( 'models.timemixer.html#dft_series_decomp',
                                                                                                         'neuralforecast/models/timemixer.py'),
                                                  'neuralforecast.models.timemixer.DFT_series_decomp.__init__': ( 'models.timemixer.html#dft_series_decomp.__init__',
@@ -1421,10 +1545,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.from_data_directories': ( 'tsdataset.html#localfilestimeseriesdataset.from_data_directories',
                                                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.ParquetTimeSeriesDataset': ( 'tsdataset.html#parquettimeseriesdataset',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.ParquetTimeSeriesDataset.__init__': ( 'tsdataset.html#parquettimeseriesdataset.__init__',
+                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.ParquetTimeSeriesDataset.__iter__': ( 'tsdataset.html#parquettimeseriesdataset.__iter__',
+                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.ParquetTimeSeriesDataset._iter_blocks': ( 'tsdataset.html#parquettimeseriesdataset._iter_blocks',
+                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.ParquetTimeSeriesDataset._iter_items': ( 'tsdataset.html#parquettimeseriesdataset._iter_items',
+                                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.ParquetTimeSeriesDataset._shuffle_items': ( 'tsdataset.html#parquettimeseriesdataset._shuffle_items',
+                                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.ParquetTimeSeriesDataset._with_shuffle': ( 'tsdataset.html#parquettimeseriesdataset._with_shuffle',
+                                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.ParquetTimeSeriesDataset.from_parquet': ( 'tsdataset.html#parquettimeseriesdataset.from_parquet',
+                                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule': ( 'tsdataset.html#timeseriesdatamodule',
                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.__init__': ( 'tsdataset.html#timeseriesdatamodule.__init__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule._loader_dataset': ( 'tsdataset.html#timeseriesdatamodule._loader_dataset',
+                                                                                                             'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.predict_dataloader': ( 'tsdataset.html#timeseriesdatamodule.predict_dataloader',
                                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.train_dataloader': ( 'tsdataset.html#timeseriesdatamodule.train_dataloader',
@@ -1441,6 +1583,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__repr__': ( 'tsdataset.html#timeseriesdataset.__repr__',
                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._align_rows': ( 'tsdataset.html#timeseriesdataset._align_rows',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._select_series': ( 'tsdataset.html#timeseriesdataset._select_series',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._slice_series': ( 'tsdataset.html#timeseriesdataset._slice_series',
+                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._trim_indices': ( 'tsdataset.html#timeseriesdataset._trim_indices',
+                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.align': ( 'tsdataset.html#timeseriesdataset.align',
                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.append': ( 'tsdataset.html#timeseriesdataset.append',
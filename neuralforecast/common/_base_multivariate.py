@@ -506,6 +506,15 @@ class BaseMultivariate(BaseModel):
                     distr_args, (len(windows["temporal"]), self.h, -1)
                 )
                 y_hat = torch.concat((y_hat, distr_args), axis=2)
+        elif len(self.loss.output_names) > 1:
+            # IQLoss with several quantiles returns [Ws, H, n_series * Q]
+            output = output.reshape(*output.shape[:2], self.n_series, -1)
+            y_hat, _, _ = self._inv_normalization(
+                y_hat=output.movedim(-1, 0),
+                temporal_cols=batch["temporal_cols"],
+                y_idx=y_idx,
+            )
+            y_hat = y_hat.movedim(0, -1)  # [Ws, H, n_series, Q]
         else:
             y_hat, _, _ = self._inv_normalization(
                 y_hat=output, temporal_cols=batch["temporal_cols"], y_idx=y_idx
@@ -597,7 +606,9 @@ class BaseMultivariate(BaseModel):
         fcsts = trainer.predict(self, datamodule=datamodule)
         fcsts = torch.vstack(fcsts).numpy()
 
-        fcsts = np.transpose(fcsts, (2, 0, 1))
+        fcsts = np.moveaxis(
+            fcsts, 2, 0
+        )  # Series first, keeping any output dimension last
         fcsts = fcsts.flatten()
         fcsts = fcsts.reshape(-1, len(self.loss.output_names))
         return fcsts
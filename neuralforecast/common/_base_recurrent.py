@@ -411,16 +411,17 @@ class BaseRecurrent(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
-
+            # The mean and quantiles are only computed when the validation loss uses them
             if str(type(self.valid_loss)) in [
                 "<class 'neuralforecast.losses.pytorch.sCRPS'>",
                 "<class 'neuralforecast.losses.pytorch.MQLoss'>",
             ]:
+                _, quants = self.loss.get_quantiles(distr_args=distr_args)
                 output = quants
             elif str(type(self.valid_loss)) in [
                 "<class 'neuralforecast.losses.pytorch.relMSE'>"
             ]:
+                sample_mean, _ = self.loss.get_quantiles(distr_args=distr_args)
                 output = torch.unsqueeze(sample_mean, dim=-1)  # [N,H,1] -> [N,H]
 
         else:
@@ -489,7 +490,7 @@ class BaseRecurrent(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+            sample_mean, quants = self.loss.get_quantiles(distr_args=distr_args)
             y_hat = torch.concat((sample_mean, quants), axis=2)
             y_hat = y_hat.view(B, T, H, -1)
 
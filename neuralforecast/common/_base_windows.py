@@ -11,6 +11,7 @@ import pytorch_lightning as pl
 
 from ._base_model import BaseModel
 from ._scalers import TemporalNorm
+from ..losses.pytorch import IQLoss
 from ..tsdataset import TimeSeriesDataModule
 from ..utils import get_indexer_raise_missing
 
@@ -391,12 +392,16 @@ class BaseWindows(BaseModel):
             stat_exog,
         )
 
-    def training_step(self, batch, batch_idx):
+    def _train_windows(self, batch):
         # Create and normalize windows [Ws, L+H, C]
         windows = self._create_windows(batch, step="train")
         y_idx = batch["y_idx"]
         original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, y_idx])
         windows = self._normalization(windows=windows, y_idx=y_idx)
+        return windows, original_outsample_y
+
+    def _train_loss(self, batch, windows, original_outsample_y):
+        y_idx = batch["y_idx"]
 
         # Parse windows
         (
@@ -437,11 +442,15 @@ class BaseWindows(BaseModel):
             print("outsample_y", torch.isnan(outsample_y).sum())
             print("output", torch.isnan(output).sum())
             raise Exception("Loss is NaN, training stopped.")
+        return loss
 
+    def training_step(self, batch, batch_idx):
+        windows, original_outsample_y = self._train_windows(batch)
+        loss = self._train_loss(batch, windows, original_outsample_y)
         self.log(
             "train_loss",
             loss.item(),
-            batch_size=outsample_y.size(0),
+            batch_size=original_outsample_y.size(0),
             prog_bar=True,
             on_epoch=True,
         )
@@ -458,16 +467,17 @@ class BaseWindows(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
-
+            # The mean and quantiles are only computed when the validation loss uses them
             if str(type(self.valid_loss)) in [
                 "<class 'neuralforecast.losses.pytorch.sCRPS'>",
                 "<class 'neuralforecast.losses.pytorch.MQLoss'>",
             ]:
+                _, quants = self.loss.get_quantiles(distr_args=distr_args)
                 output = quants
             elif str(type(self.valid_loss)) in [
                 "<class 'neuralforecast.losses.pytorch.relMSE'>"
             ]:
+                sample_mean, _ = self.loss.get_quantiles(distr_args=distr_args)
                 output = torch.unsqueeze(sample_mean, dim=-1)  # [N,H,1] -> [N,H]
 
         # Validation Loss evaluation
@@ -484,10 +494,7 @@ class BaseWindows(BaseModel):
             )
         return valid_loss
 
-    def validation_step(self, batch, batch_idx):
-        if self.val_size == 0:
-            return np.nan
-
+    def _valid_windows(self, batch):
         # TODO: Hack to compute number of windows
         windows = self._create_windows(batch, step="val")
         n_windows = len(windows["temporal"])
@@ -499,8 +506,6 @@ class BaseWindows(BaseModel):
             windows_batch_size = n_windows
         n_batches = int(np.ceil(n_windows / windows_batch_size))
 
-        valid_losses = []
-        batch_sizes = []
         for i in range(n_batches):
             # Create and normalize windows [Ws, L+H, C]
             w_idxs = np.arange(
@@ -509,37 +514,51 @@ class BaseWindows(BaseModel):
             windows = self._create_windows(batch, step="val", w_idxs=w_idxs)
             original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, y_idx])
             windows = self._normalization(windows=windows, y_idx=y_idx)
+            yield windows, original_outsample_y
 
-            # Parse windows
-            (
-                insample_y,
-                insample_mask,
-                _,
-                outsample_mask,
-                hist_exog,
-                futr_exog,
-                stat_exog,
-            ) = self._parse_windows(batch, windows)
+    def _valid_loss(self, batch, windows, original_outsample_y):
+        # Parse windows
+        (
+            insample_y,
+            insample_mask,
+            _,
+            outsample_mask,
+            hist_exog,
+            futr_exog,
+            stat_exog,
+        ) = self._parse_windows(batch, windows)
 
-            windows_batch = dict(
-                insample_y=insample_y,  # [Ws, L]
-                insample_mask=insample_mask,  # [Ws, L]
-                futr_exog=futr_exog,  # [Ws, L + h, F]
-                hist_exog=hist_exog,  # [Ws, L, X]
-                stat_exog=stat_exog,
-            )  # [Ws, S]
+        windows_batch = dict(
+            insample_y=insample_y,  # [Ws, L]
+            insample_mask=insample_mask,  # [Ws, L]
+            futr_exog=futr_exog,  # [Ws, L + h, F]
+            hist_exog=hist_exog,  # [Ws, L, X]
+            stat_exog=stat_exog,
+        )  # [Ws, S]
 
-            # Model Predictions
-            output_batch = self(windows_batch)
-            valid_loss_batch = self._compute_valid_loss(
-                outsample_y=original_outsample_y,
-                output=output_batch,
-                outsample_mask=outsample_mask,
-                temporal_cols=batch["temporal_cols"],
-                y_idx=batch["y_idx"],
+        # Model Predictions
+        output_batch = self(windows_batch)
+        valid_loss_batch = self._compute_valid_loss(
+            outsample_y=original_outsample_y,
+            output=output_batch,
+            outsample_mask=outsample_mask,
+            temporal_cols=batch["temporal_cols"],
+            y_idx=batch["y_idx"],
+        )
+        return valid_loss_batch, len(output_batch)
+
+    def validation_step(self, batch, batch_idx):
+        if self.val_size == 0:
+            return np.nan
+
+        valid_losses = []
+        batch_sizes = []
+        for windows, original_outsample_y in self._valid_windows(batch):
+            valid_loss_batch, batch_size = self._valid_loss(
+                batch, windows, original_outsample_y
             )
             valid_losses.append(valid_loss_batch)
-            batch_sizes.append(len(output_batch))
+            batch_sizes.append(batch_size)
 
         valid_loss = torch.stack(valid_losses)
         batch_sizes = torch.tensor(batch_sizes, device=valid_loss.device)
@@ -610,7 +629,7 @@ class BaseWindows(BaseModel):
                 distr_args = self.loss.scale_decouple(
                     output=output_batch, loc=y_loc, scale=y_scale
                 )
-                _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+                sample_mean, quants = self.loss.get_quantiles(distr_args=distr_args)
                 y_hat = torch.concat((sample_mean, quants), axis=2)
 
                 if self.loss.return_params:
@@ -740,3 +759,223 @@ class BaseWindows(BaseModel):
         fcsts = trainer.predict(self, datamodule=datamodule)
         self.decompose_forecast = False  # Default decomposition back to false
         return torch.vstack(fcsts).numpy()
+
+# %% ../../nbs/common.base_windows.ipynb 7
+def _draws_random_numbers(model):
+    """Whether training or validating the model draws random numbers, e.g. for dropout.
+    In a group they would shift the random state, and thus the batches, of the other models.
+    """
+    if isinstance(model.loss, IQLoss):
+        # the quantiles are sampled for every training window
+        return True
+    if (
+        model.loss.is_distribution_output
+        and not model.valid_loss.is_distribution_output
+    ):
+        # the validation quantiles may be estimated by sampling
+        return True
+    for module in model.modules():
+        if getattr(module, "random_forward", False):
+            return True
+        if isinstance(module, nn.modules.dropout._DropoutNd) and module.p > 0:
+            return True
+        if (
+            isinstance(module, nn.RNNBase)
+            and module.dropout > 0
+            and module.num_layers > 1
+        ):
+            return True
+    return False
+
+
+def _windows_group_key(model):
+    """Models with the same key sample and normalize the same training and validation windows.
+    Returns None for models that can only be trained on their own, including the ones that
+    draw random numbers, so that grouped models end up as if they were fitted separately.
+    """
+    if not isinstance(model, BaseWindows) or model.scaler.scaler_type == "revin":
+        return None
+    if model.early_stop_patience_steps > 0 or _draws_random_numbers(model):
+        return None
+    for method in [
+        "training_step",
+        "validation_step",
+        "_create_windows",
+        "_normalization",
+        "on_fit_start",
+        "on_validation_epoch_end",
+    ]:
+        if getattr(type(model), method) is not getattr(BaseWindows, method):
+            return None
+    return (
+        model.input_size,
+        model.h,
+        model.step_size,
+        model.start_padding_enabled,
+        model.scaler.scaler_type,
+        tuple(sorted(set(model.hist_exog_list + model.futr_exog_list))),
+        model.batch_size,
+        model.valid_batch_size,
+        model.windows_batch_size,
+        model.num_workers_loader,
+        model.drop_last_loader,
+        model.max_steps,
+        model.val_check_steps,
+        model.random_seed,
+        repr(sorted(model.trainer_kwargs.items())),
+    )
+
+
+class _WindowsGroup(pl.LightningModule):
+    """Trains models with the same `_windows_group_key` in lockstep.
+
+    Every batch is windowed and normalized once by the first model and fed to all
+    the models, each one with its own optimizer and learning rate scheduler.
+    """
+
+    def __init__(self, models, gradient_clip_val=None, gradient_clip_algorithm=None):
+        super().__init__()
+        self.group_models = nn.ModuleList(models)
+        self.gradient_clip_val = gradient_clip_val
+        self.gradient_clip_algorithm = gradient_clip_algorithm
+        self.automatic_optimization = False
+
+    def _model_windows(self, i, windows):
+        # Models share the scaler statistics of the first one, and all but the
+        # last one work on a copy of the windows in case they modify them
+        leader, model = self.group_models[0], self.group_models[i]
+        model.scaler.x_shift, model.scaler.x_scale = (
+            leader.scaler.x_shift,
+            leader.scaler.x_scale,
+        )
+        if i < len(self.group_models) - 1:
+            windows = {**windows, "temporal": windows["temporal"].clone()}
+        return windows
+
+    def on_fit_start(self):
+        self.group_models[0].on_fit_start()
+
+    def configure_optimizers(self):
+        optimizers, lr_schedulers = [], []
+        for model in self.group_models:
+            optimization = model.configure_optimizers()
+            optimizers.append(optimization["optimizer"])
+            lr_schedulers.append(optimization["lr_scheduler"])
+        return optimizers, lr_schedulers
+
+    def training_step(self, batch, batch_idx):
+        # The trainer counts the optimizer steps of every model
+        step = self.global_step // len(self.group_models)
+        windows, original_outsample_y = self.group_models[0]._train_windows(batch)
+        for i, (model, optimizer, lr_scheduler) in enumerate(
+            zip(self.group_models, self.optimizers(), self.lr_schedulers())
+        ):
+            loss = model._train_loss(
+                batch, self._model_windows(i, windows), original_outsample_y
+            )
+            optimizer.zero_grad()
+            self.manual_backward(loss)
+            if self.gradient_clip_val is not None:
+                self.clip_gradients(
+                    optimizer,
+                    gradient_clip_val=self.gradient_clip_val,
+                    gradient_clip_algorithm=self.gradient_clip_algorithm,
+                )
+            optimizer.step()
+            lr_scheduler.step()
+            self.log(
+                f"model{i}/train_loss",
+                loss.item(),
+                batch_size=original_outsample_y.size(0),
+                on_epoch=True,
+            )
+            model.train_trajectories.append((step, loss.item()))
+
+    def validation_step(self, batch, batch_idx):
+        if self.group_models[0].val_size == 0:
+            return np.nan
+
+        valid_losses = [[] for _ in self.group_models]
+        batch_sizes = []
+        for windows, original_outsample_y in self.group_models[0]._valid_windows(batch):
+            for i, model in enumerate(self.group_models):
+                valid_loss_batch, batch_size = model._valid_loss(
+                    batch, self._model_windows(i, windows), original_outsample_y
+                )
+                valid_losses[i].append(valid_loss_batch)
+            batch_sizes.append(batch_size)
+
+        batch_sizes = torch.tensor(batch_sizes, device=valid_loss_batch.device)
+        batch_size = torch.sum(batch_sizes)
+        for i, model in enumerate(self.group_models):
+            valid_loss = (
+                torch.sum(torch.stack(valid_losses[i]) * batch_sizes) / batch_size
+            )
+            if torch.isnan(valid_loss):
+                raise Exception("Loss is NaN, training stopped.")
+            self.log(
+                f"model{i}/valid_loss",
+                valid_loss.item(),
+                batch_size=batch_size,
+                on_epoch=True,
+            )
+            model.validation_step_outputs.append(valid_loss)
+
+    def on_validation_epoch_end(self):
+        if self.group_models[0].val_size == 0:
+            return
+        step = self.global_step // len(self.group_models)
+        for i, model in enumerate(self.group_models):
+            losses = torch.stack(model.validation_step_outputs)
+            avg_loss = losses.mean().item()
+            self.log(
+                f"model{i}/ptl/val_loss",
+                avg_loss,
+                batch_size=losses.size(0),
+                sync_dist=True,
+            )
+            model.valid_trajectories.append((step, avg_loss))
+            model.validation_step_outputs.clear()
+
+
+def _fit_windows_group(models, dataset, val_size=0, test_size=0):
+    """Fit models with the same `_windows_group_key` in lockstep, see `_WindowsGroup`."""
+    leader = models[0]
+    for model in models:
+        model._check_exog(dataset)
+        model.val_size = val_size
+        model.test_size = test_size
+        model.trainer_kwargs["val_check_interval"] = int(
+            min(model.val_check_steps, model.max_steps)
+        )
+        model.trainer_kwargs["check_val_every_n_epoch"] = None
+    leader._restart_seed(None)
+    datamodule = TimeSeriesDataModule(
+        dataset=dataset,
+        batch_size=leader.batch_size,
+        valid_batch_size=leader.valid_batch_size,
+        num_workers=leader.num_workers_loader,
+        drop_last=leader.drop_last_loader,
+        shuffle_train=True,
+    )
+
+    # Lightning only clips the gradients of automatically optimized modules
+    trainer_kwargs = {
+        **leader.trainer_kwargs,
+        "max_steps": leader.max_steps * len(models),
+    }
+    group = _WindowsGroup(
+        models,
+        gradient_clip_val=trainer_kwargs.pop("gradient_clip_val", None),
+        gradient_clip_algorithm=trainer_kwargs.pop("gradient_clip_algorithm", None),
+    )
+    trainer = pl.Trainer(**trainer_kwargs)
+    trainer.fit(group, datamodule=datamodule)
+    for i, model in enumerate(models):
+        prefix = f"model{i}/"
+        model.metrics = {
+            name[len(prefix) :]: value
+            for name, value in trainer.callback_metrics.items()
+            if name.startswith(prefix)
+        }
+    return models
@@ -1,14 +1,17 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/core.ipynb.
 
 # %% auto 0
-__all__ = ['NeuralForecast']
+__all__ = ['ForecastArrays', 'NeuralForecast']
 
 # %% ../nbs/core.ipynb 4
 import os
 import pickle
 import warnings
-from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy, deepcopy
+from dataclasses import dataclass
 from itertools import chain
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 import fsspec
@@ -28,11 +31,13 @@ from utilsforecast.compat import DataFrame, Series, pl_DataFrame, pl_Series
 from utilsforecast.validation import validate_freq
 
 from .common._base_model import DistributedConfig
+from .common._base_windows import _fit_windows_group, _windows_group_key
 from .compat import SparkDataFrame
 from neuralforecast.tsdataset import (
     _FilesDataset,
     TimeSeriesDataset,
     LocalFilesTimeSeriesDataset,
+    ParquetTimeSeriesDataset,
 )
 from neuralforecast.models import (
     GRU,
@@ -127,6 +132,23 @@ def _insample_times(
     out = ufp.assign_columns(out, "cutoff", actual_cutoffs)
     return out
 
+
+def _block_tails_idxs(sizes: np.ndarray, block_size: int) -> np.ndarray:
+    # indices of the last `sizes[i]` rows of the i-th block, where the blocks are
+    # consecutive and have `block_size` rows each
+    # polars counts are unsigned, which numpy would mix with signed ints into floats
+    sizes = sizes.astype(np.int64, copy=False)
+    indptr = np.append(0, sizes.cumsum())
+    starts = np.arange(1, sizes.size + 1) * block_size - sizes
+    return np.repeat(starts - indptr[:-1], sizes) + np.arange(indptr[-1])
+
+
+def _ranges_idxs(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    # indices of the consecutive ranges [starts[i], ends[i])
+    sizes = ends - starts
+    indptr = np.append(0, sizes.cumsum())
+    return np.repeat(starts - indptr[:-1], sizes) + np.arange(indptr[-1])
+
 # %% ../nbs/core.ipynb 7
 MODEL_FILENAME_DICT = {
     "autoformer": Autoformer,
@@ -214,7 +236,96 @@ def _warn_id_as_idx():
         category=FutureWarning,
     )
 
+
+def _fit_models(models, dataset, val_size, distributed_config=None):
+    # Several models are a group trained on shared windows
+    if len(models) > 1:
+        return _fit_windows_group(models, dataset, val_size=val_size)
+    return [
+        models[0].fit(dataset, val_size=val_size, distributed_config=distributed_config)
+    ]
+
+
+def _fit_models_in_process(models, dataset, val_size, num_threads):
+    torch.set_num_threads(num_threads)
+    return _fit_models(models, dataset, val_size=val_size)
+
+
+def _refit_cross_validation_in_process(
+    nf,
+    full_dataset,
+    uids,
+    ds,
+    last_dates,
+    windows,
+    val_size,
+    verbose,
+    num_threads,
+    data_kwargs,
+):
+    torch.set_num_threads(num_threads)
+    results = nf._refit_cross_validation_windows(
+        full_dataset=full_dataset,
+        uids=uids,
+        ds=ds,
+        last_dates=last_dates,
+        windows=windows,
+        val_size=val_size,
+        refit_steps=None,
+        independent_refits=False,
+        verbose=verbose,
+        **data_kwargs
+    )
+    return results, nf.models, nf.scalers_
+
 # %% ../nbs/core.ipynb 10
+@dataclass
+class ForecastArrays:
+    """Forecasts as numpy arrays, returned by the predict methods of `NeuralForecast` with `output='numpy'`.
+
+    Row `i` of `values` holds the predictions, named by `columns`, for serie `uids[i]` at time `ds[i]`.
+    `cutoff` and `y` are only set by `cross_validation` and `predict_insample`.
+    """
+
+    uids: np.ndarray
+    ds: np.ndarray
+    values: np.ndarray
+    columns: List[str]
+    cutoff: Optional[np.ndarray] = None
+    y: Optional[np.ndarray] = None
+
+
+def _check_output(output: str) -> None:
+    if output not in ("dataframe", "arrow", "numpy"):
+        raise ValueError(
+            f"`output` must be 'dataframe', 'arrow' or 'numpy', got: {output}"
+        )
+
+
+def _concat_outputs(outputs):
+    first = outputs[0]
+    if isinstance(first, ForecastArrays):
+
+        def concat(attr):
+            if getattr(first, attr) is None:
+                return None
+            return np.concatenate([getattr(out, attr) for out in outputs])
+
+        return ForecastArrays(
+            uids=concat("uids"),
+            ds=concat("ds"),
+            values=concat("values"),
+            columns=first.columns,
+            cutoff=concat("cutoff"),
+            y=concat("y"),
+        )
+    if isinstance(first, (pd.DataFrame, pl_DataFrame)):
+        return ufp.vertical_concat(outputs)
+    import pyarrow as pa
+
+    return pa.concat_tables(outputs)
+
+# %% ../nbs/core.ipynb 11
 class NeuralForecast:
 
     def __init__(
@@ -272,14 +383,19 @@ class NeuralForecast:
             self.scalers_[col] = _type2scaler[self.local_scaler_type]().fit(ga)
             dataset.temporal[:, i] = torch.from_numpy(self.scalers_[col].transform(ga))
 
-    def _scalers_transform(self, dataset: TimeSeriesDataset) -> None:
+    def _scalers_transform(
+        self, dataset: TimeSeriesDataset, indptr: Optional[np.ndarray] = None
+    ) -> None:
+        # `indptr` overrides the one of the dataset, e.g. to locate a block of series
         if not self.scalers_:
             return None
+        if indptr is None:
+            indptr = dataset.indptr
         for i, col in enumerate(dataset.temporal_cols):
             scaler = self.scalers_.get(col, None)
             if scaler is None:
                 continue
-            ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
+            ga = GroupedArray(dataset.temporal[:, i].numpy(), indptr)
             dataset.temporal[:, i] = torch.from_numpy(scaler.transform(ga))
 
     def _scalers_target_inverse_transform(
@@ -287,10 +403,11 @@ class NeuralForecast:
     ) -> np.ndarray:
         if not self.scalers_:
             return data
-        for i in range(data.shape[1]):
-            ga = GroupedArray(data[:, i], indptr)
-            data[:, i] = self.scalers_[self.target_col].inverse_transform(ga)
-        return data
+        # the scalers are elementwise within each serie, so the rows of a serie are
+        # flattened together and all the columns are transformed in a single call
+        n_cols = data.shape[1]
+        ga = GroupedArray(data.reshape(-1), indptr * n_cols)
+        return self.scalers_[self.target_col].inverse_transform(ga).reshape(data.shape)
 
     def _prepare_fit(
         self, df, static_df, sort_df, predict_only, id_col, time_col, target_col
@@ -423,9 +540,41 @@ class NeuralForecast:
             target_col=target_col,
         )
 
+    def _prepare_fit_for_parquet(
+        self,
+        path: Union[str, Path],
+        static_df: Optional[DataFrame],
+        sort_df: bool,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+    ):
+        if self.local_scaler_type is not None:
+            raise ValueError(
+                "Historic scaling isn't supported when the dataset is streamed from parquet files. "
+                "Please open an issue if this would be valuable to you."
+            )
+
+        self.id_col = id_col
+        self.time_col = time_col
+        self.target_col = target_col
+        self.scalers_ = {}
+        self.sort_df = sort_df
+
+        exogs = self._get_needed_exog()
+        return ParquetTimeSeriesDataset.from_parquet(
+            path=path,
+            static_df=static_df,
+            sort_df=sort_df,
+            exogs=exogs,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+
     def fit(
         self,
-        df: Optional[Union[DataFrame, SparkDataFrame, Sequence[str]]] = None,
+        df: Optional[Union[DataFrame, SparkDataFrame, Sequence[str], str, Path]] = None,
         static_df: Optional[Union[DataFrame, SparkDataFrame]] = None,
         val_size: Optional[int] = 0,
         sort_df: bool = True,
@@ -435,6 +584,8 @@ class NeuralForecast:
         time_col: str = "ds",
         target_col: str = "y",
         distributed_config: Optional[DistributedConfig] = None,
+        n_jobs: int = 1,
+        share_windows: bool = False,
     ) -> None:
         """Fit the core.NeuralForecast.
 
@@ -443,8 +594,10 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas, polars or spark DataFrame, or a list of parquet files containing the series, optional (default=None)
+        df : pandas, polars or spark DataFrame, a list of parquet files containing the series, or a path to a parquet dataset, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
+            A path to a parquet file or (hive partitioned) directory is streamed during training,
+            its files must be sorted by [`unique_id`, `ds`] and hold each serie entirely.
             If None, a previously stored dataset is required.
         static_df : pandas, polars or spark DataFrame, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
@@ -464,6 +617,14 @@ class NeuralForecast:
             Column that contains the target.
         distributed_config : neuralforecast.DistributedConfig
             Configuration to use for DDP training. Currently only spark is supported.
+        n_jobs : int (default=1)
+            Number of models fitted concurrently, each in its own process with an even share of the CPU threads.
+            Use -1 to use all the cores.
+        share_windows : bool (default=False)
+            Train windows-based models with the same windows, scaler, exogenous and training settings together,
+            creating and normalizing every window batch once for all of them. Each model keeps its own optimizer.
+            Models that draw random numbers while training, e.g. with dropout, are trained on their own,
+            so every model ends up as if it was fitted separately.
 
         Returns
         -------
@@ -480,6 +641,13 @@ class NeuralForecast:
         ):
             raise Exception("Set val_size>0 if early stopping is enabled.")
 
+        if n_jobs != 1 and distributed_config is not None:
+            raise ValueError("`n_jobs` is not supported with `distributed_config`.")
+        if share_windows and distributed_config is not None:
+            raise ValueError(
+                "`share_windows` is not supported with `distributed_config`."
+            )
+
         # Process and save new dataset (in self)
         if isinstance(df, (pd.DataFrame, pl_DataFrame)):
             validate_freq(df[time_col], self.freq)
@@ -507,6 +675,17 @@ class NeuralForecast:
                 target_col=target_col,
                 distributed_config=distributed_config,
             )
+        elif isinstance(df, (str, Path)):
+            self.dataset = self._prepare_fit_for_parquet(
+                path=df,
+                static_df=static_df,
+                sort_df=sort_df,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+            self.uids = self.dataset.indices
+            self.last_dates = self.dataset.last_times
         elif isinstance(df, Sequence):
             if not all(isinstance(val, str) for val in df):
                 raise ValueError(
@@ -527,7 +706,7 @@ class NeuralForecast:
                 print("Using stored dataset.")
         else:
             raise ValueError(
-                f"`df` must be a pandas, polars or spark DataFrame, or a list of parquet files containing the series, or `None`, got: {type(df)}"
+                f"`df` must be a pandas, polars or spark DataFrame, a list of parquet files containing the series, a path to a parquet dataset, or `None`, got: {type(df)}"
             )
 
         if val_size is not None:
@@ -540,13 +719,61 @@ class NeuralForecast:
         if use_init_models:
             self._reset_models()
 
-        for i, model in enumerate(self.models):
-            self.models[i] = model.fit(
-                self.dataset, val_size=val_size, distributed_config=distributed_config
+        groups = self._fit_groups(share_windows)
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs > 1 and len(groups) > 1:
+            self._fit_models_in_processes(
+                groups=groups, val_size=val_size, n_jobs=n_jobs
             )
+        else:
+            for group in groups:
+                fitted_models = _fit_models(
+                    [self.models[i] for i in group],
+                    self.dataset,
+                    val_size=val_size,
+                    distributed_config=distributed_config,
+                )
+                for i, model in zip(group, fitted_models):
+                    self.models[i] = model
 
         self._fitted = True
 
+    def _fit_groups(self, share_windows):
+        # Indices of the models trained together, see `_windows_group_key`
+        if not share_windows:
+            return [[i] for i in range(len(self.models))]
+        groups = {}
+        for i, model in enumerate(self.models):
+            key = _windows_group_key(model)
+            groups.setdefault(i if key is None else key, []).append(i)
+        return list(groups.values())
+
+    def _fit_models_in_processes(self, groups, val_size, n_jobs):
+        # The dataset tensors are moved to shared memory once, so every worker maps them
+        # instead of receiving a copy. The fitted models come back the same way.
+        if isinstance(self.dataset, TimeSeriesDataset):
+            self.dataset.temporal.share_memory_()
+            if self.dataset.static is not None:
+                self.dataset.static.share_memory_()
+        n_jobs = min(n_jobs, len(groups))
+        num_threads = max(1, torch.get_num_threads() // n_jobs)
+        mp_context = torch.multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=n_jobs, mp_context=mp_context) as executor:
+            futures = [
+                executor.submit(
+                    _fit_models_in_process,
+                    [self.models[i] for i in group],
+                    self.dataset,
+                    val_size,
+                    num_threads,
+                )
+                for group in groups
+            ]
+            for group, future in zip(groups, futures):
+                for i, model in zip(group, future.result()):
+                    self.models[i] = model
+
     def make_future_dataframe(self, df: Optional[DataFrame] = None) -> DataFrame:
         """Create a dataframe with all ids and future times in the forecasting horizon.
 
@@ -779,6 +1006,7 @@ class NeuralForecast:
         sort_df: bool = True,
         verbose: bool = False,
         engine=None,
+        output: str = "dataframe",
         **data_kwargs,
     ):
         """Predict with core.NeuralForecast.
@@ -800,42 +1028,39 @@ class NeuralForecast:
             Print processing steps.
         engine : spark session
             Distributed engine for inference. Only used if df is a spark dataframe or if fit was called on a spark dataframe.
+        output : str (default='dataframe')
+            Format of the forecasts. 'dataframe' returns a pandas or polars DataFrame,
+            'arrow' a pyarrow Table and 'numpy' a `ForecastArrays`, which are built from the predictions without intermediate DataFrames.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
         Returns
         -------
-        fcsts_df : pandas or polars DataFrame
+        fcsts_df : pandas or polars DataFrame, pyarrow Table or ForecastArrays
             DataFrame with insample `models` columns for point predictions and probabilistic
             predictions for all fitted `models`.
         """
         if df is None and not hasattr(self, "dataset"):
             raise Exception("You must pass a DataFrame or have one stored.")
+        _check_output(output)
 
         if not self._fitted:
             raise Exception("You must fit the model before predicting.")
 
-        needed_futr_exog = self._get_needed_futr_exog()
-        if needed_futr_exog:
-            if futr_df is None:
-                raise ValueError(
-                    f"Models require the following future exogenous features: {needed_futr_exog}. "
-                    "Please provide them through the `futr_df` argument."
-                )
-            else:
-                missing = needed_futr_exog - set(futr_df.columns)
-                if missing:
-                    raise ValueError(
-                        f"The following features are missing from `futr_df`: {missing}"
-                    )
+        self._check_futr_df(futr_df)
 
         # distributed df or NeuralForecast instance was trained with a distributed input and no df is provided
         # we assume the user wants to perform distributed inference as well
         is_files_dataset = isinstance(getattr(self, "dataset", None), _FilesDataset)
         is_dataset_local_files = isinstance(
-            getattr(self, "dataset", None), LocalFilesTimeSeriesDataset
+            getattr(self, "dataset", None),
+            (LocalFilesTimeSeriesDataset, ParquetTimeSeriesDataset),
         )
         if isinstance(df, SparkDataFrame) or (df is None and is_files_dataset):
+            if output != "dataframe":
+                raise ValueError(
+                    "Distributed inference only supports `output='dataframe'`."
+                )
             return self._predict_distributed(
                 df=df,
                 static_df=static_df,
@@ -867,7 +1092,169 @@ class NeuralForecast:
             if verbose:
                 print("Using stored dataset.")
 
-        cols = self._get_model_names()
+        fcsts_df = self._predict_dataset(
+            dataset=dataset,
+            uids=uids,
+            last_dates=last_dates,
+            futr_df=futr_df,
+            stored_dataset=df is None,
+            output=output,
+            **data_kwargs,
+        )
+        if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
+            _warn_id_as_idx()
+            fcsts_df = fcsts_df.set_index(self.id_col)
+        return fcsts_df
+
+    def predict_iter(
+        self,
+        df: Optional[DataFrame] = None,
+        static_df: Optional[DataFrame] = None,
+        futr_df: Optional[DataFrame] = None,
+        chunk_series: int = 1_000,
+        sort_df: bool = True,
+        verbose: bool = False,
+        output: str = "dataframe",
+        **data_kwargs,
+    ):
+        """Predict with core.NeuralForecast, a block of series at a time.
+
+        Generator version of `predict`, the future dataset, the forecasts and the output
+        DataFrame only hold the series of one block at a time.
+
+        Parameters
+        ----------
+        df : pandas or polars DataFrame, optional (default=None)
+            DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
+            If a DataFrame is passed, it is used to generate forecasts.
+        static_df : pandas or polars DataFrame, optional (default=None)
+            DataFrame with columns [`unique_id`] and static exogenous.
+        futr_df : pandas or polars DataFrame, optional (default=None)
+            DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
+        chunk_series : int (default=1_000)
+            Number of series predicted and yielded at a time. Multivariate models always use all the series.
+        sort_df : bool (default=True)
+            Sort `df` before fitting.
+        verbose : bool (default=False)
+            Print processing steps.
+        output : str (default='dataframe')
+            Format of the forecasts. 'dataframe' returns a pandas or polars DataFrame,
+            'arrow' a pyarrow Table and 'numpy' a `ForecastArrays`, which are built from the predictions without intermediate DataFrames.
+        data_kwargs : kwargs
+            Extra arguments to be passed to the dataset within each model.
+
+        Returns
+        -------
+        fcsts_dfs : generator of pandas or polars DataFrame, pyarrow Table or ForecastArrays
+            DataFrames with the forecasts of all fitted `models`, one for each block of series.
+        """
+        if df is None and not hasattr(self, "dataset"):
+            raise Exception("You must pass a DataFrame or have one stored.")
+        _check_output(output)
+        if not self._fitted:
+            raise Exception("You must fit the model before predicting.")
+        if isinstance(df, SparkDataFrame) or (
+            df is None and not isinstance(self.dataset, TimeSeriesDataset)
+        ):
+            raise ValueError(
+                "`predict_iter` only supports pandas or polars DataFrames, use `predict` instead."
+            )
+        self._check_futr_df(futr_df)
+
+        if df is not None:
+            validate_freq(df[self.time_col], self.freq)
+            dataset, uids, last_dates, _ = self._prepare_fit(
+                df=df,
+                static_df=static_df,
+                sort_df=sort_df,
+                predict_only=True,
+                id_col=self.id_col,
+                time_col=self.time_col,
+                target_col=self.target_col,
+            )
+        else:
+            dataset = self.dataset
+            uids = self.uids
+            last_dates = self.last_dates
+            if verbose:
+                print("Using stored dataset.")
+
+        n_series = dataset.n_groups
+        if any(model.SAMPLING_TYPE == "multivariate" for model in self.models):
+            chunk_series = n_series
+        if futr_df is not None:
+            # sorted once, so the rows of each serie are contiguous and the ones of each block
+            # are too when futr_df has the same series. Otherwise every serie's rows are
+            # located through the position of its id, series missing from futr_df have none.
+            futr_df = ufp.sort(futr_df, by=[self.id_col, self.time_col])
+            futr_counts = ufp.counts_by_id(futr_df, self.id_col)
+            futr_indptr = np.append(
+                0, futr_counts["counts"].to_numpy().cumsum()
+            ).astype(np.int64)
+            futr_ids = futr_counts[self.id_col].to_numpy()
+            futr_aligned = (
+                len(futr_ids) == n_series and (futr_ids == uids.to_numpy()).all()
+            )
+            if not futr_aligned:
+                futr_pos = pd.Index(futr_ids).get_indexer(uids.to_numpy())
+        for start in range(0, n_series, chunk_series):
+            end = min(start + chunk_series, n_series)
+            if futr_df is None:
+                block_futr_df = None
+            elif futr_aligned:
+                block_futr_df = ufp.take_rows(
+                    futr_df, np.arange(futr_indptr[start], futr_indptr[end])
+                )
+            else:
+                pos = futr_pos[start:end]
+                pos = pos[pos >= 0]
+                block_futr_df = ufp.take_rows(
+                    futr_df, _ranges_idxs(futr_indptr[pos], futr_indptr[pos + 1])
+                )
+            fcsts_df = self._predict_dataset(
+                dataset=TimeSeriesDataset._slice_series(dataset, start, end),
+                uids=uids[start:end],
+                last_dates=last_dates[start:end],
+                futr_df=block_futr_df,
+                stored_dataset=df is None,
+                start=start,
+                n_series=n_series,
+                output=output,
+                **data_kwargs,
+            )
+            if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
+                _warn_id_as_idx()
+                fcsts_df = fcsts_df.set_index(self.id_col)
+            yield fcsts_df
+
+    def _check_futr_df(self, futr_df):
+        needed_futr_exog = self._get_needed_futr_exog()
+        if needed_futr_exog:
+            if futr_df is None:
+                raise ValueError(
+                    f"Models require the following future exogenous features: {needed_futr_exog}. "
+                    "Please provide them through the `futr_df` argument."
+                )
+            else:
+                missing = needed_futr_exog - set(futr_df.columns)
+                if missing:
+                    raise ValueError(
+                        f"The following features are missing from `futr_df`: {missing}"
+                    )
+
+    def _predict_dataset(
+        self,
+        dataset,
+        uids,
+        last_dates,
+        futr_df,
+        stored_dataset,
+        start=0,
+        n_series=None,
+        output="dataframe",
+        **data_kwargs,
+    ):
+        # `start` and `n_series` locate the series of `dataset` within the ones the scalers were fitted on
 
         # Placeholder dataframe for predictions with unique_id and ds
         fcsts_df = ufp.make_future_dataframe(
@@ -881,67 +1268,144 @@ class NeuralForecast:
 
         # Update and define new forecasting dataset
         if futr_df is None:
-            futr_df = fcsts_df
+            futr_dataset = dataset._align_rows(None, None, self.h)
         else:
-            futr_orig_rows = futr_df.shape[0]
-            futr_df = ufp.join(futr_df, fcsts_df, on=[self.id_col, self.time_col])
-            if futr_df.shape[0] < fcsts_df.shape[0]:
-                if df is None:
-                    expected_cmd = "make_future_dataframe()"
-                    missing_cmd = "get_missing_future(futr_df)"
-                else:
-                    expected_cmd = "make_future_dataframe(df)"
-                    missing_cmd = "get_missing_future(futr_df, df)"
-                raise ValueError(
-                    "There are missing combinations of ids and times in `futr_df`.\n"
-                    f"You can run the `{expected_cmd}` method to get the expected combinations or "
-                    f"the `{missing_cmd}` method to get the missing combinations."
-                )
-            if futr_orig_rows > futr_df.shape[0]:
-                dropped_rows = futr_orig_rows - futr_df.shape[0]
-                warnings.warn(f"Dropped {dropped_rows:,} unused rows from `futr_df`.")
-            if any(ufp.is_none(futr_df[col]).any() for col in needed_futr_exog):
+            rows = self._futr_rows(fcsts_df, futr_df, uids, stored_dataset)
+            futr_dataset = dataset._align_rows(futr_df, rows, self.h)
+            needed_idxs = dataset.temporal_cols.get_indexer(
+                list(self._get_needed_futr_exog())
+            )
+            needed_idxs = needed_idxs[needed_idxs >= 0]
+            if futr_dataset.temporal[:, needed_idxs].isnan().any():
                 raise ValueError("Found null values in `futr_df`")
-        futr_dataset = dataset.align(
-            futr_df,
-            id_col=self.id_col,
-            time_col=self.time_col,
-            target_col=self.target_col,
+        # the scalers hold the statistics of every serie, the ones outside the block are empty
+        pad = (start, (n_series or len(uids)) - start - len(uids))
+        self._scalers_transform(
+            futr_dataset, indptr=np.pad(futr_dataset.indptr, pad, mode="edge")
         )
-        self._scalers_transform(futr_dataset)
         dataset = dataset.append(futr_dataset)
 
-        col_idx = 0
-        fcsts = np.full(
-            (self.h * len(uids), len(cols)), fill_value=np.nan, dtype=np.float32
-        )
+        # The number of outputs of IQLoss models depends on the requested quantiles,
+        # so the predictions are stacked after all models have predicted
+        fcsts_list = []
         for model in self.models:
             old_test_size = model.get_test_size()
             model.set_test_size(self.h)  # To predict h steps ahead
-            model_fcsts = model.predict(dataset=dataset, **data_kwargs)
-            # Append predictions in memory placeholder
-            output_length = len(model.loss.output_names)
-            fcsts[:, col_idx : col_idx + output_length] = model_fcsts
-            col_idx += output_length
+            fcsts_list.append(model.predict(dataset=dataset, **data_kwargs))
             model.set_test_size(old_test_size)  # Set back to original value
+        fcsts = np.hstack(fcsts_list, dtype=np.float32)
         if self.scalers_:
-            indptr = np.append(0, np.full(len(uids), self.h).cumsum())
+            indptr = np.pad(
+                np.append(0, np.full(len(uids), self.h).cumsum()), pad, mode="edge"
+            )
             fcsts = self._scalers_target_inverse_transform(fcsts, indptr)
 
-        # Declare predictions pd.DataFrame
         cols = (
             self._get_model_names()
         )  # Needed for IQLoss as column names may have changed during the call to .predict()
+        return self._fcsts_output(fcsts_df, fcsts, cols, output)
+
+    def _futr_rows(self, fcsts_df, futr_df, uids, stored_dataset):
+        # Rows of `futr_df` with the ids and times of `fcsts_df`, None when they're already in order.
+        # They are located with the position of each id and the rank of each time, without joins.
+        expected_ids = fcsts_df[self.id_col].to_numpy()
+        expected_times = fcsts_df[self.time_col].to_numpy()
+        futr_ids = futr_df[self.id_col].to_numpy()
+        futr_times = futr_df[self.time_col].to_numpy()
+        n_rows = expected_ids.size
+        if (
+            futr_ids.size == n_rows
+            and (futr_times == expected_times).all()
+            and (futr_ids == expected_ids).all()
+        ):
+            return None
+        series = pd.Index(uids.to_numpy()).get_indexer(futr_ids)
+        times, time_ranks = np.unique(
+            np.concatenate([expected_times, futr_times]), return_inverse=True
+        )
+        # the expected keys are sorted, by serie and then by time
+        expected_keys = (
+            np.repeat(np.arange(len(uids)), self.h) * times.size + time_ranks[:n_rows]
+        )
+        futr_keys = series * times.size + time_ranks[n_rows:]
+        pos = np.minimum(np.searchsorted(expected_keys, futr_keys), n_rows - 1)
+        found = (series >= 0) & (expected_keys[pos] == futr_keys)
+        counts = np.bincount(pos[found], minlength=n_rows)
+        if (counts == 0).any():
+            if stored_dataset:
+                expected_cmd = "make_future_dataframe()"
+                missing_cmd = "get_missing_future(futr_df)"
+            else:
+                expected_cmd = "make_future_dataframe(df)"
+                missing_cmd = "get_missing_future(futr_df, df)"
+            raise ValueError(
+                "There are missing combinations of ids and times in `futr_df`.\n"
+                f"You can run the `{expected_cmd}` method to get the expected combinations or "
+                f"the `{missing_cmd}` method to get the missing combinations."
+            )
+        if (counts > 1).any():
+            raise ValueError(
+                "Found duplicated combinations of ids and times in `futr_df`."
+            )
+        dropped_rows = futr_ids.size - n_rows
+        if dropped_rows:
+            warnings.warn(f"Dropped {dropped_rows:,} unused rows from `futr_df`.")
+        rows = np.empty(n_rows, dtype=np.int64)
+        rows[pos[found]] = np.flatnonzero(found)
+        return rows
+
+    def _fcsts_output(self, fcsts_df, fcsts, cols, output, y=None):
+        # Attaches the predictions, and the target `y` after them, to the ids and times in `fcsts_df`
+        if output == "numpy":
+            return ForecastArrays(
+                uids=fcsts_df[self.id_col].to_numpy(),
+                ds=fcsts_df[self.time_col].to_numpy(),
+                values=fcsts,
+                columns=list(cols),
+                cutoff=(
+                    fcsts_df["cutoff"].to_numpy()
+                    if "cutoff" in fcsts_df.columns
+                    else None
+                ),
+                y=y,
+            )
+        if output == "arrow":
+            import pyarrow as pa
+
+            if isinstance(fcsts_df, pl_DataFrame):
+                table = fcsts_df.to_arrow()
+            else:
+                table = pa.Table.from_pandas(fcsts_df, preserve_index=False)
+            # one contiguous copy of the transposed predictions, so each arrow column is a cheap row view
+            values = np.ascontiguousarray(fcsts.T)
+            for col, col_values in zip(cols, values):
+                table = table.append_column(col, pa.array(col_values))
+            if y is not None:
+                table = table.append_column(self.target_col, pa.array(y))
+            return table
         if isinstance(fcsts_df, pl_DataFrame):
             fcsts = pl_DataFrame(dict(zip(cols, fcsts.T)))
         else:
             fcsts = pd.DataFrame(fcsts, columns=cols)
         fcsts_df = ufp.horizontal_concat([fcsts_df, fcsts])
-        if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
-            _warn_id_as_idx()
-            fcsts_df = fcsts_df.set_index(self.id_col)
+        if y is not None:
+            fcsts_df = ufp.assign_columns(fcsts_df, self.target_col, y)
         return fcsts_df
 
+    def _frame_output(self, fcsts_df, output):
+        # The refit cross validation builds its forecasts as a DataFrame
+        if output == "dataframe":
+            return fcsts_df
+        index_cols = [self.id_col, self.time_col, "cutoff"]
+        cols = [c for c in fcsts_df.columns if c not in index_cols + [self.target_col]]
+        return self._fcsts_output(
+            fcsts_df[index_cols],
+            ufp.to_numpy(fcsts_df[cols]).astype(np.float32, copy=False),
+            cols,
+            output,
+            y=fcsts_df[self.target_col].to_numpy(),
+        )
+
     def _reset_models(self):
         self.models = [deepcopy(model) for model in self.models_init]
         if self._fitted:
@@ -960,6 +1424,7 @@ class NeuralForecast:
         id_col: str,
         time_col: str,
         target_col: str,
+        output: str,
         **data_kwargs,
     ) -> DataFrame:
         if (df is None) and not (hasattr(self, "dataset")):
@@ -988,15 +1453,6 @@ class NeuralForecast:
                     "Validation and test sets are larger than the shorter time-series."
                 )
 
-        cols = []
-        count_names = {"model": 0}
-        for model in self.models:
-            model_name = repr(model)
-            count_names[model_name] = count_names.get(model_name, -1) + 1
-            if count_names[model_name] > 0:
-                model_name += str(count_names[model_name])
-            cols += [model_name + n for n in model.loss.output_names]
-
         fcsts_df = ufp.cv_times(
             times=self.ds,
             uids=self.uids,
@@ -1010,63 +1466,41 @@ class NeuralForecast:
         # the cv_times is sorted by window and then id
         fcsts_df = ufp.sort(fcsts_df, [id_col, "cutoff", time_col])
 
-        col_idx = 0
-        fcsts = np.full(
-            (self.dataset.n_groups * self.h * n_windows, len(cols)),
-            np.nan,
-            dtype=np.float32,
-        )
-
+        fcsts_list = []
         for model in self.models:
             model.fit(dataset=self.dataset, val_size=val_size, test_size=test_size)
-            model_fcsts = model.predict(
-                self.dataset, step_size=step_size, **data_kwargs
+            fcsts_list.append(
+                model.predict(self.dataset, step_size=step_size, **data_kwargs)
             )
-
-            # Append predictions in memory placeholder
-            output_length = len(model.loss.output_names)
-            fcsts[:, col_idx : (col_idx + output_length)] = model_fcsts
-            col_idx += output_length
+        fcsts = np.hstack(fcsts_list, dtype=np.float32)
+        cols = self._get_model_names()
         # we may have allocated more space than needed
         # each serie can produce at most (serie.size - 1) // self.h CV windows
         effective_sizes = ufp.counts_by_id(fcsts_df, id_col)["counts"].to_numpy()
-        needs_trim = effective_sizes.sum() != fcsts.shape[0]
-        if self.scalers_ or needs_trim:
-            indptr = np.arange(
-                0,
-                n_windows * self.h * (self.dataset.n_groups + 1),
-                n_windows * self.h,
-                dtype=np.int32,
-            )
-            if self.scalers_:
-                fcsts = self._scalers_target_inverse_transform(fcsts, indptr)
-            if needs_trim:
-                # we keep only the effective samples of each serie from the cv results
-                trimmed = np.empty_like(
-                    fcsts, shape=(effective_sizes.sum(), fcsts.shape[1])
-                )
-                cv_indptr = np.append(0, effective_sizes).cumsum(dtype=np.int32)
-                for i in range(fcsts.shape[1]):
-                    ga = GroupedArray(fcsts[:, i], indptr)
-                    trimmed[:, i] = ga._tails(cv_indptr)
-                fcsts = trimmed
+        cv_indptr = np.append(0, effective_sizes).cumsum(dtype=np.int32)
+        # we keep only the effective samples of each serie, the last rows of its block
+        rows_per_serie = n_windows * self.h
+        keep = _block_tails_idxs(effective_sizes, rows_per_serie)
+        if keep.size != fcsts.shape[0]:
+            fcsts = fcsts[keep]
+        fcsts = self._scalers_target_inverse_transform(fcsts, cv_indptr)
 
         self._fitted = True
 
-        # Add predictions to forecasts DataFrame
-        if isinstance(self.uids, pl_Series):
-            fcsts = pl_DataFrame(dict(zip(cols, fcsts.T)))
+        # Add original input df's y to the forecasts, each row is located
+        # in the sorted series from its serie, window and horizon
+        serie, row = np.divmod(keep, rows_per_serie)
+        window, step = np.divmod(row, self.h)
+        pos = self.dataset.indptr[serie + 1] - test_size + window * step_size + step
+        if df is not None:
+            sort_idxs = ufp.maybe_compute_sort_indices(df, id_col, time_col)
+            if sort_idxs is not None:
+                pos = sort_idxs[pos]
+            y = df[target_col].to_numpy()[pos]
         else:
-            fcsts = pd.DataFrame(fcsts, columns=cols)
-        fcsts_df = ufp.horizontal_concat([fcsts_df, fcsts])
-
-        # Add original input df's y to forecasts DataFrame
-        fcsts_df = ufp.join(
-            fcsts_df,
-            df[[id_col, time_col, target_col]],
-            how="left",
-            on=[id_col, time_col],
-        )
+            y = self.dataset.temporal[pos, self.dataset.y_idx].numpy()[:, None]
+            y = self._scalers_target_inverse_transform(y, cv_indptr)[:, 0]
+        fcsts_df = self._fcsts_output(fcsts_df, fcsts, cols, output, y=y)
         if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
             _warn_id_as_idx()
             fcsts_df = fcsts_df.set_index(id_col)
@@ -1084,11 +1518,15 @@ class NeuralForecast:
         use_init_models: bool = False,
         verbose: bool = False,
         refit: Union[bool, int] = False,
+        refit_steps: Optional[int] = None,
+        independent_refits: bool = False,
+        n_jobs: int = 1,
         id_col: str = "unique_id",
         time_col: str = "ds",
         target_col: str = "y",
+        output: str = "dataframe",
         **data_kwargs,
-    ) -> DataFrame:
+    ):
         """Temporal Cross-Validation with core.NeuralForecast.
 
         `core.NeuralForecast`'s cross-validation efficiently fits a list of NeuralForecast
@@ -1119,21 +1557,38 @@ class NeuralForecast:
             Retrain model for each cross validation window.
             If False, the models are trained at the beginning and then used to predict each window.
             If positive int, the models are retrained every `refit` windows.
+        refit_steps : int, optional (default=None)
+            Number of training steps of every refit after the first window.
+            The models are fine-tuned starting from the weights of the previous window.
+            If None, each refit trains for the models' `max_steps`.
+        independent_refits : bool (default=False)
+            If True, every refit starts from the models at the beginning of the cross validation,
+            otherwise it continues training the models of the previous window.
+            Only used when `refit!=False`.
+        n_jobs : int (default=1)
+            Number of processes used to run the windows between refits in parallel, -1 means all CPUs.
+            Requires `independent_refits=True`, so the forecasts don't depend on `n_jobs`.
+            Only used when `refit!=False`.
         id_col : str (default='unique_id')
             Column that identifies each serie.
         time_col : str (default='ds')
             Column that identifies each timestep, its values can be timestamps or integers.
         target_col : str (default='y')
             Column that contains the target.
+        output : str (default='dataframe')
+            Format of the forecasts. 'dataframe' returns a pandas or polars DataFrame,
+            'arrow' a pyarrow Table and 'numpy' a `ForecastArrays`, which are built from the predictions without intermediate DataFrames.
+            With `refit!=False` the forecasts of the windows are DataFrames that are converted at the end.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
         Returns
         -------
-        fcsts_df : pandas or polars DataFrame
+        fcsts_df : pandas or polars DataFrame, pyarrow Table or ForecastArrays
             DataFrame with insample `models` columns for point predictions and probabilistic
             predictions for all fitted `models`.
         """
+        _check_output(output)
         h = self.h
         if n_windows is None and test_size is None:
             raise Exception("you must define `n_windows` or `test_size`.")
@@ -1167,11 +1622,32 @@ class NeuralForecast:
                 id_col=id_col,
                 time_col=time_col,
                 target_col=target_col,
+                output=output,
                 **data_kwargs,
             )
         if df is None:
             raise ValueError("Must specify `df` with `refit!=False`.")
+        if independent_refits and refit_steps is not None:
+            raise ValueError(
+                "`refit_steps` is not supported with `independent_refits=True`."
+            )
+        if n_jobs != 1 and not independent_refits:
+            raise ValueError("`n_jobs!=1` requires `independent_refits=True`.")
         validate_freq(df[time_col], self.freq)
+        # The dataset is built once and trimmed to the training span of each window
+        self.id_col = id_col
+        self.time_col = time_col
+        self.target_col = target_col
+        self._check_nan(df, static_df, id_col, time_col, target_col)
+        full_dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(
+            df=df,
+            static_df=static_df,
+            sort_df=sort_df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+        self.sort_df = sort_df
         splits = ufp.backtest_splits(
             df,
             n_windows=n_windows,
@@ -1182,39 +1658,41 @@ class NeuralForecast:
             step_size=step_size,
             input_size=None,
         )
-        results = []
-        for i_window, (cutoffs, train, test) in enumerate(splits):
+        # Each group starts with a refit and holds the windows predicted with its models
+        groups: List[List[tuple]] = []
+        for i_window, (cutoffs, _, test) in enumerate(splits):
+            right_trim = test_size - i_window * step_size
             should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
             if should_fit:
-                self.fit(
-                    df=train,
-                    static_df=static_df,
-                    val_size=val_size,
-                    sort_df=sort_df,
-                    use_init_models=False,
-                    verbose=verbose,
-                )
-                predict_df: Optional[DataFrame] = None
-            else:
-                predict_df = train
-            needed_futr_exog = self._get_needed_futr_exog()
-            if needed_futr_exog:
-                futr_df: Optional[DataFrame] = test
-            else:
-                futr_df = None
-            preds = self.predict(
-                df=predict_df,
-                static_df=static_df,
-                futr_df=futr_df,
-                sort_df=sort_df,
+                groups.append([])
+            groups[-1].append((i_window, right_trim, should_fit, cutoffs, test))
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs > 1 and len(groups) > 1:
+            results = self._refit_cross_validation_in_processes(
+                full_dataset=full_dataset,
+                uids=uids,
+                ds=ds,
+                last_dates=last_dates,
+                groups=groups,
+                val_size=val_size,
+                n_jobs=n_jobs,
                 verbose=verbose,
                 **data_kwargs,
             )
-            preds = ufp.join(preds, cutoffs, on=id_col, how="left")
-            fold_result = ufp.join(
-                preds, test[[id_col, time_col, target_col]], on=[id_col, time_col]
+        else:
+            results = self._refit_cross_validation_windows(
+                full_dataset=full_dataset,
+                uids=uids,
+                ds=ds,
+                last_dates=last_dates,
+                windows=list(chain.from_iterable(groups)),
+                val_size=val_size,
+                refit_steps=refit_steps,
+                independent_refits=independent_refits,
+                verbose=verbose,
+                **data_kwargs,
             )
-            results.append(fold_result)
         out = ufp.vertical_concat(results, match_categories=False)
         out = ufp.drop_index_if_pandas(out)
         # match order of cv with no refit
@@ -1224,12 +1702,155 @@ class NeuralForecast:
         ]
         cols_order = first_out_cols + remaining_cols + [target_col]
         out = ufp.sort(out[cols_order], by=[id_col, "cutoff", time_col])
+        out = self._frame_output(out, output)
         if isinstance(out, pd.DataFrame) and _id_as_idx():
             _warn_id_as_idx()
             out = out.set_index(id_col)
         return out
 
-    def predict_insample(self, step_size: int = 1):
+    def _set_window_dataset(self, full_dataset, uids, ds, last_dates, right_trim):
+        # Series without rows before the cutoff are left out of the window,
+        # backtest_splits already warns about them
+        keep = np.diff(full_dataset.indptr) > right_trim
+        if not keep.all():
+            full_dataset, rows = TimeSeriesDataset._select_series(full_dataset, keep)
+            series_idxs = np.flatnonzero(keep)
+            uids = ufp.take_rows(uids, series_idxs)
+            ds = ds[rows]
+            last_dates = ufp.take_rows(last_dates, series_idxs)
+        self.dataset = TimeSeriesDataset.trim_dataset(
+            full_dataset, right_trim=right_trim
+        )
+        idxs, _ = TimeSeriesDataset._trim_indices(
+            full_dataset.indptr, right_trim=right_trim
+        )
+        self.uids = uids
+        self.ds = ds[idxs]
+        self.last_dates = ufp.offset_times(last_dates, self.freq, -right_trim)
+
+    def _refit_cross_validation_windows(
+        self,
+        full_dataset,
+        uids,
+        ds,
+        last_dates,
+        windows,
+        val_size,
+        refit_steps,
+        independent_refits,
+        verbose,
+        **data_kwargs,
+    ):
+        if independent_refits:
+            start_models = deepcopy(self.models)
+        results = []
+        for i_window, right_trim, should_fit, cutoffs, test in windows:
+            self._set_window_dataset(full_dataset, uids, ds, last_dates, right_trim)
+            if should_fit:
+                self._scalers_fit_transform(self.dataset)
+                if independent_refits and i_window > 0:
+                    self.models = deepcopy(start_models)
+                # Later refits fine-tune the weights of the previous window
+                fine_tune = i_window > 0 and refit_steps is not None
+                if fine_tune:
+                    max_steps = self._set_max_steps([refit_steps] * len(self.models))
+                try:
+                    self.fit(
+                        df=None,
+                        val_size=val_size,
+                        use_init_models=False,
+                        verbose=verbose,
+                    )
+                finally:
+                    if fine_tune:
+                        self._set_max_steps(max_steps)
+            else:
+                self._scalers_transform(self.dataset)
+            needed_futr_exog = self._get_needed_futr_exog()
+            if needed_futr_exog:
+                futr_df: Optional[DataFrame] = test
+            else:
+                futr_df = None
+            preds = self.predict(futr_df=futr_df, verbose=verbose, **data_kwargs)
+            preds = ufp.join(preds, cutoffs, on=self.id_col, how="left")
+            fold_result = ufp.join(
+                preds,
+                test[[self.id_col, self.time_col, self.target_col]],
+                on=[self.id_col, self.time_col],
+            )
+            results.append(fold_result)
+        return results
+
+    def _refit_cross_validation_in_processes(
+        self,
+        full_dataset,
+        uids,
+        ds,
+        last_dates,
+        groups,
+        val_size,
+        n_jobs,
+        verbose,
+        **data_kwargs,
+    ):
+        # Tensors sent to the pool share memory with the sender, so every worker gets its
+        # own copy of the current models. The windows are trimmed from the shared full
+        # dataset, the stored one isn't sent.
+        full_dataset.temporal.share_memory_()
+        if full_dataset.static is not None:
+            full_dataset.static.share_memory_()
+        self.dataset = None
+        self.ds = None
+        n_jobs = min(n_jobs, len(groups))
+        num_threads = max(1, torch.get_num_threads() // n_jobs)
+        mp_context = torch.multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=n_jobs, mp_context=mp_context) as executor:
+            futures = []
+            for windows in groups:
+                nf = copy(self)
+                nf.models = deepcopy(self.models)
+                futures.append(
+                    executor.submit(
+                        _refit_cross_validation_in_process,
+                        nf,
+                        full_dataset,
+                        uids,
+                        ds,
+                        last_dates,
+                        windows,
+                        val_size,
+                        verbose,
+                        num_threads,
+                        data_kwargs,
+                    )
+                )
+            outputs = [future.result() for future in futures]
+        # Keep the state of the last window, as the serial loop does
+        results = list(chain.from_iterable(out[0] for out in outputs))
+        self.models, self.scalers_ = outputs[-1][1:]
+        self._set_window_dataset(full_dataset, uids, ds, last_dates, groups[-1][-1][1])
+        self._scalers_transform(self.dataset)
+        self._fitted = True
+        return results
+
+    def _set_max_steps(self, max_steps):
+        # Returns the previous values, auto models keep tuning with their own config
+        prev_max_steps = []
+        for model, steps in zip(self.models, max_steps):
+            if isinstance(model, BaseAuto) or steps is None:
+                prev_max_steps.append(None)
+                continue
+            prev_max_steps.append(model.max_steps)
+            model.max_steps = steps
+            model.trainer_kwargs["max_steps"] = steps
+        return prev_max_steps
+
+    def predict_insample(
+        self,
+        step_size: int = 1,
+        chunk_series: Optional[int] = None,
+        output: str = "dataframe",
+    ):
         """Predict insample with core.NeuralForecast.
 
         `core.NeuralForecast`'s `predict_insample` uses stored fitted `models`
@@ -1239,12 +1860,66 @@ class NeuralForecast:
         ----------
         step_size : int (default=1)
             Step size between each window.
+        chunk_series : int, optional (default=None)
+            Number of series predicted at a time, which bounds the memory used by the windows.
+            If None, all the series are predicted at once. Multivariate models always use all the series.
+        output : str (default='dataframe')
+            Format of the forecasts. 'dataframe' returns a pandas or polars DataFrame,
+            'arrow' a pyarrow Table and 'numpy' a `ForecastArrays`, which are built from the predictions without intermediate DataFrames.
 
         Returns
         -------
-        fcsts_df : pandas.DataFrame
+        fcsts_df : pandas.DataFrame, pyarrow Table or ForecastArrays
             DataFrame with insample predictions for all fitted `models`.
         """
+        _check_output(output)
+        fcsts_dfs = list(
+            self._predict_insample_chunks(
+                step_size=step_size, chunk_series=chunk_series, output=output
+            )
+        )
+        fcsts_df = _concat_outputs(fcsts_dfs) if len(fcsts_dfs) > 1 else fcsts_dfs[0]
+        if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
+            _warn_id_as_idx()
+            fcsts_df = fcsts_df.set_index(self.id_col)
+        return fcsts_df
+
+    def predict_insample_iter(
+        self,
+        step_size: int = 1,
+        chunk_series: int = 1_000,
+        output: str = "dataframe",
+    ):
+        """Predict insample with core.NeuralForecast, a few series at a time.
+
+        Generator version of `predict_insample`, the memory used is bounded by the
+        number of series in each chunk instead of the total number of windows.
+
+        Parameters
+        ----------
+        step_size : int (default=1)
+            Step size between each window.
+        chunk_series : int (default=1_000)
+            Number of series predicted and yielded at a time. Multivariate models always use all the series.
+        output : str (default='dataframe')
+            Format of the forecasts. 'dataframe' returns a pandas or polars DataFrame,
+            'arrow' a pyarrow Table and 'numpy' a `ForecastArrays`, which are built from the predictions without intermediate DataFrames.
+
+        Returns
+        -------
+        fcsts_dfs : generator of pandas.DataFrame, pyarrow Table or ForecastArrays
+            DataFrames with insample predictions for all fitted `models`, one for each chunk of series.
+        """
+        _check_output(output)
+        for fcsts_df in self._predict_insample_chunks(
+            step_size=step_size, chunk_series=chunk_series, output=output
+        ):
+            if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
+                _warn_id_as_idx()
+                fcsts_df = fcsts_df.set_index(self.id_col)
+            yield fcsts_df
+
+    def _predict_insample_chunks(self, step_size, chunk_series, output):
         if not self._fitted:
             raise Exception(
                 "The models must be fitted first with `fit` or `cross_validation`."
@@ -1273,34 +1948,54 @@ class NeuralForecast:
         # Remove test set from dataset and last dates
         test_size = self.models[0].get_test_size()
 
-        # trim the forefront period to ensure `test_size - h` should be module `step_size
-        # Note: current constraint imposes that all series lengths are equal, so we can take the first series length as sample
-        series_length = self.dataset.indptr[1] - self.dataset.indptr[0]
-        _, forefront_offset = np.divmod((series_length - test_size - self.h), step_size)
+        # trim the forefront period of each serie to ensure `size - test_size - h` is a multiple of `step_size`
+        sizes = np.diff(self.dataset.indptr)
+        forefront_offset = (sizes - test_size - self.h) % step_size
 
-        if test_size > 0 or forefront_offset > 0:
+        if test_size > 0 or forefront_offset.any():
             trimmed_dataset = TimeSeriesDataset.trim_dataset(
                 dataset=self.dataset, right_trim=test_size, left_trim=forefront_offset
             )
-            new_idxs = np.hstack(
-                [
-                    np.arange(
-                        self.dataset.indptr[i] + forefront_offset,
-                        self.dataset.indptr[i + 1] - test_size,
-                    )
-                    for i in range(self.dataset.n_groups)
-                ]
+            new_idxs, _ = TimeSeriesDataset._trim_indices(
+                self.dataset.indptr, left_trim=forefront_offset, right_trim=test_size
             )
             times = self.ds[new_idxs]
         else:
             trimmed_dataset = self.dataset
             times = self.ds
 
+        n_series = trimmed_dataset.n_groups
+        if chunk_series is None or any(
+            model.SAMPLING_TYPE == "multivariate" for model in self.models
+        ):
+            chunk_series = n_series
+        for start in range(0, n_series, chunk_series):
+            yield self._predict_insample_chunk(
+                dataset=trimmed_dataset,
+                times=times,
+                start=start,
+                end=min(start + chunk_series, n_series),
+                cols=cols,
+                step_size=step_size,
+                test_size=test_size,
+                output=output,
+            )
+
+    def _predict_insample_chunk(
+        self, dataset, times, start, end, cols, step_size, test_size, output
+    ):
+        # predicts the windows of the series [start:end] of the trimmed dataset
+        if start > 0 or end < dataset.n_groups:
+            chunk = TimeSeriesDataset._slice_series(dataset, start, end)
+        else:
+            chunk = dataset
+        times = times[dataset.indptr[start] : dataset.indptr[end]]
+
         # Generate dates
         fcsts_df = _insample_times(
             times=times,
-            uids=self.uids,
-            indptr=trimmed_dataset.indptr,
+            uids=self.uids[start:end],
+            indptr=chunk.indptr,
             h=self.h,
             freq=self.freq,
             step_size=step_size,
@@ -1308,50 +2003,43 @@ class NeuralForecast:
             time_col=self.time_col,
         )
 
-        col_idx = 0
-        fcsts = np.full((len(fcsts_df), len(cols)), np.nan, dtype=np.float32)
+        # the series are padded to the longest one, so each serie produces the same
+        # number of windows and only its last ones are inside the serie
+        windows_per_serie = (np.diff(chunk.indptr) - self.h) // step_size + 1
+        n_windows = (chunk.max_size - self.h) // step_size + 1
+        if (windows_per_serie < n_windows).any():
+            keep = _block_tails_idxs(windows_per_serie * self.h, n_windows * self.h)
+        else:
+            keep = slice(None)
 
+        # the last column holds the original y
+        fcsts = np.empty((len(fcsts_df), len(cols) + 1), dtype=np.float32)
+        col_idx = 0
         for model in self.models:
             # Test size is the number of periods to forecast (full size of trimmed dataset)
-            model.set_test_size(test_size=trimmed_dataset.max_size)
-
-            # Predict
-            model_fcsts = model.predict(trimmed_dataset, step_size=step_size)
-            # Append predictions in memory placeholder
+            model.set_test_size(test_size=chunk.max_size)
+            model_fcsts = model.predict(chunk, step_size=step_size)
             output_length = len(model.loss.output_names)
-            fcsts[:, col_idx : (col_idx + output_length)] = model_fcsts
+            fcsts[:, col_idx : (col_idx + output_length)] = model_fcsts[keep]
             col_idx += output_length
             model.set_test_size(test_size=test_size)  # Set original test_size
 
-        # original y
-        original_y = {
-            self.id_col: ufp.repeat(self.uids, np.diff(self.dataset.indptr)),
-            self.time_col: self.ds,
-            self.target_col: self.dataset.temporal[:, 0].numpy(),
-        }
-
-        # Add predictions to forecasts DataFrame
-        if isinstance(self.uids, pl_Series):
-            fcsts = pl_DataFrame(dict(zip(cols, fcsts.T)))
-            Y_df = pl_DataFrame(original_y)
-        else:
-            fcsts = pd.DataFrame(fcsts, columns=cols)
-            Y_df = pd.DataFrame(original_y).reset_index(drop=True)
-        fcsts_df = ufp.horizontal_concat([fcsts_df, fcsts])
-
-        # Add original input df's y to forecasts DataFrame
-        fcsts_df = ufp.join(fcsts_df, Y_df, how="left", on=[self.id_col, self.time_col])
+        # original y, from the start of each window and the horizon
+        total_windows = windows_per_serie.sum()
+        windows_indptr = np.append(0, windows_per_serie.cumsum())
+        window_starts = np.repeat(
+            chunk.indptr[:-1] - step_size * windows_indptr[:-1], windows_per_serie
+        )
+        window_starts += step_size * np.arange(total_windows)
+        pos = (window_starts[:, None] + np.arange(self.h)).reshape(-1)
+        fcsts[:, -1] = chunk.temporal[pos, chunk.y_idx].numpy()
         if self.scalers_:
-            sizes = ufp.counts_by_id(fcsts_df, self.id_col)["counts"].to_numpy()
-            indptr = np.append(0, sizes.cumsum())
-            invert_cols = cols + [self.target_col]
-            fcsts_df[invert_cols] = self._scalers_target_inverse_transform(
-                fcsts_df[invert_cols].to_numpy(), indptr
-            )
-        if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
-            _warn_id_as_idx()
-            fcsts_df = fcsts_df.set_index(self.id_col)
-        return fcsts_df
+            # the series outside the chunk are empty
+            indptr = np.append(0, (windows_per_serie * self.h).cumsum())
+            indptr = np.pad(indptr, (start, dataset.n_groups - end), mode="edge")
+            fcsts = self._scalers_target_inverse_transform(fcsts, indptr)
+
+        return self._fcsts_output(fcsts_df, fcsts[:, :-1], cols, output, y=fcsts[:, -1])
 
     # Save list of models with pytorch lightning save_checkpoint function
     def save(
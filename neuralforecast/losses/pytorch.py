@@ -6,7 +6,7 @@ __all__ = ['BasePointLoss', 'MAE', 'MSE', 'RMSE', 'MAPE', 'SMAPE', 'MASE', 'relM
            'Accuracy', 'sCRPS']
 
 # %% ../../nbs/losses.pytorch.ipynb 4
-from typing import Optional, Union, Tuple
+from typing import List, Optional, Union, Tuple
 
 import math
 import numpy as np
@@ -702,9 +702,15 @@ class IQLoss(QuantileLoss):
             concentration0=concentration0, concentration1=concentration1
         )
 
-    def update_quantile(self, q: float = 0.5):
-        self.q = q
-        self.output_names = [f"_ql{q}"]
+    def update_quantile(self, q: Union[float, List[float]] = 0.5):
+        """
+        Sets the quantile(s) returned at prediction time. A list of quantiles
+        is predicted in a single pass, with one output column per quantile.
+        """
+        self.prediction_quantiles = list(q) if isinstance(q, (list, tuple)) else [q]
+        if len(self.prediction_quantiles) == 1:
+            self.q = self.prediction_quantiles[0]
+        self.output_names = [f"_ql{q}" for q in self.prediction_quantiles]
         self.has_predicted = True
 
     def domain_map(self, y_hat):
@@ -716,24 +722,30 @@ class IQLoss(QuantileLoss):
         base_windows: y_hat = [B, h, 1]
         base_multivariate: y_hat = [B, h, n_series]
         base_recurrent: y_hat = [B, seq_len, h, n_series]
+
+        When predicting Q quantiles the last dimension of `y_hat` is expanded
+        to `n_series * Q`, with the quantiles of each series contiguous.
         """
-        if self.eval() and self.has_predicted:
-            quantiles = torch.full(
-                size=y_hat.shape,
-                fill_value=self.q,
-                device=y_hat.device,
-                dtype=y_hat.dtype,
+        if not self.training and self.has_predicted:
+            # The quantile embedding does not depend on y_hat, so each
+            # requested quantile is embedded once and broadcast over y_hat.
+            quantiles = torch.tensor(
+                self.prediction_quantiles, device=y_hat.device, dtype=y_hat.dtype
             )
-            quantiles = quantiles.unsqueeze(-1)
+            emb_taus = self.quantile_layer(quantiles.unsqueeze(-1))  # [Q, 1]
+            emb_inputs = y_hat.unsqueeze(-1) * (1.0 + emb_taus.squeeze(-1))
+            emb_outputs = self.output_layer(emb_inputs.unsqueeze(-1)).squeeze(-1)
+            if len(self.prediction_quantiles) > 1:
+                return emb_outputs.flatten(start_dim=-2)
         else:
             quantiles = self._sample_quantiles(
                 sample_size=y_hat.shape, device=y_hat.device
             )
 
-        # Embed the quantiles and add to y_hat
-        emb_taus = self.quantile_layer(quantiles)
-        emb_inputs = y_hat.unsqueeze(-1) * (1.0 + emb_taus)
-        emb_outputs = self.output_layer(emb_inputs)
+            # Embed the quantiles and add to y_hat
+            emb_taus = self.quantile_layer(quantiles)
+            emb_inputs = y_hat.unsqueeze(-1) * (1.0 + emb_taus)
+            emb_outputs = self.output_layer(emb_inputs)
 
         # Domain map
         y_hat = emb_outputs.squeeze(-1).squeeze(-1)
@@ -957,7 +969,7 @@ class Tweedie(Distribution):
     **Parameters:**<br>
     `log_mu`: tensor, with log of means.<br>
     `rho`: float, Tweedie variance power (1,2). Fixed across all observations.<br>
-    `sigma2`: tensor, Tweedie variance. Currently fixed in 1.<br>
+    `sigma2`: float, Tweedie dispersion. Currently fixed in 1.<br>
 
     **References:**<br>
     - [Tweedie, M. C. K. (1984). An index which distinguishes between some important exponential families. Statistics: Applications and New Directions.
@@ -967,12 +979,12 @@ class Tweedie(Distribution):
     """
 
     def __init__(self, log_mu, rho, validate_args=None):
-        # TODO: add sigma2 dispersion
         # TODO add constraints
         # arg_constraints = {'log_mu': constraints.real, 'rho': constraints.positive}
         # support = constraints.real
         self.log_mu = log_mu
         self.rho = rho
+        self.sigma2 = 1.0
         assert rho > 1 and rho < 2, f"rho={rho} parameter needs to be between (1,2)."
 
         batch_shape = log_mu.size()
@@ -984,28 +996,31 @@ class Tweedie(Distribution):
 
     @property
     def variance(self):
-        return torch.ones_line(self.log_mu)  # TODO need to be assigned
+        return self.sigma2 * torch.exp(self.rho * self.log_mu)
+
+    @property
+    def zero_mass(self):
+        """Probability of a zero, the Poisson count of Gamma summands is zero."""
+        return torch.exp(-est_lambda(self.mean, self.rho) / self.sigma2)
 
     def sample(self, sample_shape=torch.Size()):
         shape = self._extended_shape(sample_shape)
         with torch.no_grad():
             mu = self.mean
-            rho = self.rho * torch.ones_like(mu)
-            sigma2 = 1  # TODO
+            rho = self.rho
+            sigma2 = self.sigma2
 
             rate = est_lambda(mu, rho) / sigma2  # rate for poisson
             alpha = est_alpha(rho)  # alpha for Gamma distribution
             beta = est_beta(mu, rho) / sigma2  # beta for Gamma distribution
 
-            # Expand for sample
-            rate = rate.expand(shape)
-            alpha = alpha.expand(shape)
-            beta = beta.expand(shape)
-
-            N = torch.poisson(rate)
-            gamma = torch.distributions.gamma.Gamma(N * alpha, beta)
-            samples = gamma.sample()
-            samples[N == 0] = 0
+            # Only the cells with positive counts need a Gamma sample,
+            # sample them on the compacted nonzero entries
+            N = torch.poisson(rate.expand(shape)).flatten()
+            nonzero = torch.nonzero(N, as_tuple=True)[0]
+            gamma = torch.distributions.gamma.Gamma(N[nonzero] * alpha, 1.0)
+            samples = torch.zeros_like(N).index_put_((nonzero,), gamma.sample())
+            samples = samples.view(shape) / beta
 
             return samples
 
@@ -1835,13 +1850,174 @@ def isqf_scale_decouple(output, loc=None, scale=None):
     return (spline_knots, spline_heights, beta_l, beta_r, qk_y, qk_x_repeat, loc, scale)
 
 # %% ../../nbs/losses.pytorch.ipynb 68
+def _betainc(a, b, x, max_iter: int = 300, eps: float = 1e-10):
+    """Regularized incomplete beta function $I_{x}(a,b)$, evaluated with the
+    continued fraction of Numerical Recipes (modified Lentz's method)."""
+    # The continued fraction converges fast for x < (a+1)/(a+b+2), use the
+    # symmetry I_{x}(a,b) = 1 - I_{1-x}(b,a) elsewhere
+    swap = x > (a + 1) / (a + b + 2)
+    a, b = torch.where(swap, b, a), torch.where(swap, a, b)
+    x = torch.where(swap, 1 - x, x)
+    tiny = 1e-300
+
+    def _clamp(z):
+        return torch.where(z.abs() < tiny, tiny, z)
+
+    c = torch.ones_like(x)
+    d = 1 / _clamp(1 - (a + b) * x / (a + 1))
+    h = d
+    for m in range(1, max_iter + 1):
+        aa = m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m))
+        d = 1 / _clamp(1 + aa * d)
+        c = _clamp(1 + aa / c)
+        h = h * d * c
+        aa = -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))
+        d = 1 / _clamp(1 + aa * d)
+        c = _clamp(1 + aa / c)
+        delta = d * c
+        h = h * delta
+        if torch.all((delta - 1).abs() < eps):
+            break
+
+    log_front = (
+        torch.lgamma(a + b)
+        - torch.lgamma(a)
+        - torch.lgamma(b)
+        + a * torch.log(x)
+        + b * torch.log1p(-x)
+    )
+    result = torch.exp(log_front) * h / a
+    return torch.where(swap, 1 - result, result)
+
+
+def _integer_icdf(cdf, q, mean, std, max_doublings: int = 64):
+    """Smallest integer $k \geq 0$ such that `cdf(k)` $\geq$ `q`, found with a
+    vectorized bisection over all the cells at once."""
+    # Bracket the quantiles, cdf(lo) < q <= cdf(hi)
+    lo = torch.full_like(q, -1.0)
+    hi = torch.ceil(mean + 10 * std + 10)
+    for _ in range(max_doublings):
+        below = cdf(hi) < q
+        if not torch.any(below):
+            break
+        hi = torch.where(below, 2 * hi + 1, hi)
+
+    while torch.any(hi - lo > 1):
+        mid = torch.floor((lo + hi) / 2)
+        above = cdf(mid) >= q
+        hi = torch.where(above, mid, hi)
+        lo = torch.where(above, lo, mid)
+    return hi
+
+
+def bernoulli_quantiles(distr, quantiles):
+    """Bernoulli closed-form mean and quantiles."""
+    probs = distr.probs.unsqueeze(-1)
+    quants = (quantiles > 1 - probs).to(probs.dtype)
+    return distr.probs, quants
+
+
+def normal_quantiles(distr, quantiles):
+    """Normal closed-form mean and quantiles."""
+    quants = distr.loc.unsqueeze(-1) + distr.scale.unsqueeze(-1) * torch.special.ndtri(
+        quantiles
+    )
+    return distr.loc, quants
+
+
+def student_quantiles(distr, quantiles, newton_steps: int = 2):
+    """StudentT mean and quantiles.
+
+    The standardized quantiles are approximated with Hill's (1970) algorithm 396
+    and refined with Newton steps on the exact CDF.
+    """
+    df = distr.df.unsqueeze(-1).double()
+    q = quantiles.double()
+
+    # Hill's approximation on the two-tailed probability
+    p = 2 * torch.minimum(q, 1 - q)
+    a = 1 / (df - 0.5)
+    b = 48 / (a * a)
+    c = ((20700 * a / b - 98) * a - 16) * a + 96.36
+    d = ((94.5 / (b + c) - 3) / b + 1) * torch.sqrt(a * math.pi / 2) * df
+    y = (d * p) ** (2 / df)
+
+    z = torch.special.ndtri(p / 2)
+    c_tail = c + torch.where(df < 5, 0.3 * (df - 4.5) * (z + 0.6), 0.0)
+    c_tail = (((0.05 * d * z - 5) * z - 7) * z - 2) * z + b + c_tail
+    y_tail = (
+        ((((0.4 * z**2 + 6.3) * z**2 + 36) * z**2 + 94.5) / c_tail - z**2 - 3) / b + 1
+    ) * z
+    y_tail = torch.expm1(a * y_tail**2)
+    y_center = (
+        (
+            1 / (((df + 6) / (df * y) - 0.089 * d - 0.822) * (df + 2) * 3)
+            + 0.5 / (df + 4)
+        )
+        * y
+        - 1
+    ) * (df + 1) / (df + 2) + 1 / y
+    y = torch.where(y > 0.05 + a, y_tail, y_center)
+    t = torch.sqrt(df * y)
+    t = torch.where(q < 0.5, -t, t)
+
+    standard = StudentT(df)
+    for _ in range(newton_steps):
+        tail = 0.5 * _betainc(df / 2, torch.full_like(t, 0.5), df / (df + t**2))
+        cdf = torch.where(t > 0, 1 - tail, tail)
+        t = t - (cdf - q) / torch.exp(standard.log_prob(t))
+    t = torch.where(q <= 0, -math.inf, torch.where(q >= 1, math.inf, t))
+
+    dtype = distr.loc.dtype
+    quants = distr.loc.unsqueeze(-1) + distr.scale.unsqueeze(-1) * t.to(dtype)
+    return distr.loc, quants
+
+
+def poisson_quantiles(distr, quantiles):
+    """Poisson closed-form mean and quantiles by numerical inversion of the CDF."""
+    rate = distr.rate.unsqueeze(-1).double()
+    q = quantiles.double().expand(rate.shape[:-1] + quantiles.shape)
+
+    def cdf(k):
+        return torch.special.gammaincc(k + 1, rate)
+
+    quants = _integer_icdf(cdf=cdf, q=q, mean=rate, std=torch.sqrt(rate))
+    return distr.rate, quants.to(distr.rate.dtype)
+
+
+def nbinomial_quantiles(distr, quantiles):
+    """Negative Binomial closed-form mean and quantiles by numerical inversion of the CDF."""
+    total_count = distr.total_count.unsqueeze(-1).double()
+    probs = distr.probs.unsqueeze(-1).double()
+    q = quantiles.double().expand(probs.shape[:-1] + quantiles.shape)
+
+    def cdf(k):
+        return _betainc(total_count, k + 1, 1 - probs)
+
+    mean = total_count * probs / (1 - probs)
+    std = torch.sqrt(mean / (1 - probs))
+    quants = _integer_icdf(cdf=cdf, q=q, mean=mean, std=std)
+    return distr.mean, quants.to(distr.probs.dtype)
+
+
+def tweedie_quantiles(distr, quantiles, num_samples):
+    """Tweedie closed-form mean. The quantiles within the zero mass are exactly zero,
+    the rest are estimated empirically from `num_samples` samples."""
+    samples = distr.sample(sample_shape=(num_samples,))
+    quants = torch.quantile(input=samples, q=quantiles, dim=0)  # [Q,B,H]
+    quants = torch.movedim(quants, 0, -1)
+    quants = torch.where(quantiles <= distr.zero_mass.unsqueeze(-1), 0.0, quants)
+    return distr.mean, quants
+
+# %% ../../nbs/losses.pytorch.ipynb 69
 class DistributionLoss(torch.nn.Module):
     """DistributionLoss
 
     This PyTorch module wraps the `torch.distribution` classes allowing it to
     interact with NeuralForecast models modularly. It shares the negative
     log-likelihood as the optimization objective and a sample method to
-    generate empirically the quantiles defined by the `level` list.
+    generate empirically the quantiles defined by the `level` list. When
+    available, the quantiles and mean are instead computed in closed form.
 
     Additionally, it implements a distribution transformation that factorizes the
     scale-dependent likelihood parameters into a base scale and a multiplier
@@ -1861,7 +2037,8 @@ class DistributionLoss(torch.nn.Module):
     `level`: float list [0,100], confidence levels for prediction intervals.<br>
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
     `num_samples`: int=500, number of samples for the empirical quantiles.<br>
-    `return_params`: bool=False, wether or not return the Distribution parameters.<br><br>
+    `return_params`: bool=False, wether or not return the Distribution parameters.<br>
+    `quantile_method`: str='analytic', 'analytic' computes the mean and quantiles in closed form (Bernoulli, Normal, Poisson, StudentT and NegativeBinomial; Tweedie's mean and zero mass), 'sample' estimates them from `num_samples` samples.<br><br>
 
     **References:**<br>
     - [PyTorch Probability Distributions Package: StudentT.](https://pytorch.org/docs/stable/distributions.html#studentt)<br>
@@ -1878,6 +2055,7 @@ class DistributionLoss(torch.nn.Module):
         quantiles=None,
         num_samples=1000,
         return_params=False,
+        quantile_method="analytic",
         **distribution_kwargs,
     ):
         super(DistributionLoss, self).__init__()
@@ -1937,15 +2115,32 @@ class DistributionLoss(torch.nn.Module):
             + ["-beta_l", "-beta_r"]
             + [f"-quantile_knot_{i + 1}" for i in range(num_qk)],
         )
+        analytic_quantiles = dict(
+            Bernoulli=bernoulli_quantiles,
+            Normal=normal_quantiles,
+            Poisson=poisson_quantiles,
+            StudentT=student_quantiles,
+            NegativeBinomial=nbinomial_quantiles,
+            Tweedie=partial(tweedie_quantiles, num_samples=num_samples),
+        )
         assert (
             distribution in available_distributions.keys()
         ), f"{distribution} not available"
+        assert quantile_method in [
+            "analytic",
+            "sample",
+        ], f"{quantile_method} quantile method not available"
         self.distribution = distribution
         self._base_distribution = available_distributions[distribution]
         self.domain_map = domain_maps[distribution]
         self.scale_decouple = scale_decouples[distribution]
         self.distribution_kwargs = distribution_kwargs
         self.num_samples = num_samples
+        self.quantile_method = quantile_method
+        # Distributions without closed-form quantiles fall back to sampling
+        self.analytic_quantiles = None
+        if quantile_method == "analytic":
+            self.analytic_quantiles = analytic_quantiles.get(distribution)
         self.param_names = param_names[distribution]
 
         # If True, predict_step will return Distribution's parameters
@@ -2016,6 +2211,28 @@ class DistributionLoss(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def get_quantiles(self, distr_args: torch.Tensor):
+        """
+        Compute the mean and the quantiles defined by `levels` of the estimated
+        Distribution. With `quantile_method='analytic'` they are evaluated in
+        closed form, otherwise they are estimated empirically with `sample`.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if self.analytic_quantiles is None:
+            _, sample_mean, quants = self.sample(distr_args=distr_args)
+            return sample_mean, quants
+
+        distr = self.get_distribution(distr_args=distr_args, **self.distribution_kwargs)
+        quantiles_device = self.quantiles.to(distr_args[0].device)
+        mean, quants = self.analytic_quantiles(distr, quantiles_device)
+        return mean.unsqueeze(-1), quants
+
     def __call__(
         self,
         y: torch.Tensor,
@@ -2049,7 +2266,7 @@ class DistributionLoss(torch.nn.Module):
         loss_weights = mask
         return weighted_average(loss_values, weights=loss_weights)
 
-# %% ../../nbs/losses.pytorch.ipynb 74
+# %% ../../nbs/losses.pytorch.ipynb 78
 class PMM(torch.nn.Module):
     """Poisson Mixture Mesh
 
@@ -2068,6 +2285,7 @@ class PMM(torch.nn.Module):
     `return_params`: bool=False, wether or not return the Distribution parameters.<br>
     `batch_correlation`: bool=False, wether or not model batch correlations.<br>
     `horizon_correlation`: bool=False, wether or not model horizon correlations.<br>
+    `quantile_method`: str='analytic', 'analytic' inverts the mixture's CDF with a vectorized bisection, 'sample' estimates the quantiles from `num_samples` samples.<br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2084,6 +2302,7 @@ class PMM(torch.nn.Module):
         return_params=False,
         batch_correlation=False,
         horizon_correlation=False,
+        quantile_method="analytic",
     ):
         super(PMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2098,6 +2317,11 @@ class PMM(torch.nn.Module):
         self.num_samples = num_samples
         self.batch_correlation = batch_correlation
         self.horizon_correlation = horizon_correlation
+        assert quantile_method in [
+            "analytic",
+            "sample",
+        ], f"{quantile_method} quantile method not available"
+        self.quantile_method = quantile_method
 
         # If True, predict_step will return Distribution's parameters
         self.return_params = return_params
@@ -2200,6 +2424,39 @@ class PMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def get_quantiles(self, distr_args):
+        """
+        Compute the mean and the quantiles defined by `levels` of the estimated
+        mixture. With `quantile_method='analytic'` the quantiles are the exact
+        inversion of the mixture's CDF over the integers, found by bisection for
+        all the [B,H] cells at once, otherwise they are estimated with `sample`.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if self.quantile_method == "sample":
+            _, sample_mean, quants = self.sample(distr_args=distr_args)
+            return sample_mean, quants
+
+        # Uniform weights, the mixture's CDF averages the components' CDFs
+        lambdas = distr_args[0].double().unsqueeze(-2)  # [B,H,1,K]
+        quantiles_device = self.quantiles.to(lambdas.device).double()
+        q = quantiles_device.expand(lambdas.shape[:2] + quantiles_device.shape)
+
+        def cdf(k):
+            return torch.special.gammaincc(k.unsqueeze(-1) + 1, lambdas).mean(-1)
+
+        mean = lambdas.mean(-1)
+        std = torch.sqrt(mean + lambdas.var(-1, unbiased=False))
+        quants = _integer_icdf(cdf=cdf, q=q, mean=mean, std=std)
+
+        dtype = distr_args[0].dtype
+        return mean.to(dtype), quants.to(dtype)
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -2249,7 +2506,7 @@ class PMM(torch.nn.Module):
 
         return self.neglog_likelihood(y=y, distr_args=distr_args, mask=mask)
 
-# %% ../../nbs/losses.pytorch.ipynb 82
+# %% ../../nbs/losses.pytorch.ipynb 87
 class GMM(torch.nn.Module):
     """Gaussian Mixture Mesh
 
@@ -2268,7 +2525,9 @@ class GMM(torch.nn.Module):
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
     `return_params`: bool=False, wether or not return the Distribution parameters.<br>
     `batch_correlation`: bool=False, wether or not model batch correlations.<br>
-    `horizon_correlation`: bool=False, wether or not model horizon correlations.<br><br>
+    `horizon_correlation`: bool=False, wether or not model horizon correlations.<br>
+    `quantile_method`: str='analytic', 'analytic' inverts the mixture's CDF with a vectorized bisection, 'sample' estimates the quantiles from `num_samples` samples.<br>
+    `tolerance`: float=1e-4, bisection stopping width relative to the mixture's standard deviation.<br><br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2285,6 +2544,8 @@ class GMM(torch.nn.Module):
         return_params=False,
         batch_correlation=False,
         horizon_correlation=False,
+        quantile_method="analytic",
+        tolerance=1e-4,
     ):
         super(GMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2299,6 +2560,12 @@ class GMM(torch.nn.Module):
         self.num_samples = num_samples
         self.batch_correlation = batch_correlation
         self.horizon_correlation = horizon_correlation
+        assert quantile_method in [
+            "analytic",
+            "sample",
+        ], f"{quantile_method} quantile method not available"
+        self.quantile_method = quantile_method
+        self.tolerance = tolerance
 
         # If True, predict_step will return Distribution's parameters
         self.return_params = return_params
@@ -2408,6 +2675,54 @@ class GMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def get_quantiles(self, distr_args):
+        """
+        Compute the mean and the quantiles defined by `levels` of the estimated
+        mixture. With `quantile_method='analytic'` the quantiles are found by
+        bisection on the mixture's CDF for all the [B,H] cells at once, until
+        the brackets are narrower than `tolerance` times the mixture's standard
+        deviation, otherwise they are estimated with `sample`.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if self.quantile_method == "sample":
+            _, sample_mean, quants = self.sample(distr_args=distr_args)
+            return sample_mean, quants
+
+        means, stds = distr_args
+        means = means.double().unsqueeze(-2)  # [B,H,1,K]
+        stds = stds.double().unsqueeze(-2)
+        quantiles_device = self.quantiles.to(means.device).double()
+        z = torch.special.ndtri(quantiles_device).unsqueeze(-1)  # [Q,1]
+
+        # Uniform weights, the mixture's CDF averages the components' CDFs,
+        # so its quantiles lie between the smallest and largest components' quantiles
+        components_quants = means + stds * z  # [B,H,Q,K]
+        lo = components_quants.min(-1).values
+        hi = components_quants.max(-1).values
+
+        mean = means.mean(-1)
+        std = torch.sqrt((stds**2 + means**2).mean(-1) - mean**2)
+        width = self.tolerance * std
+        q = quantiles_device.expand(lo.shape)
+        # Each step halves the brackets, cap the steps for degenerate mixtures
+        for _ in range(100):
+            if not torch.any(hi - lo > width):
+                break
+            mid = (lo + hi) / 2
+            above = torch.special.ndtr((mid.unsqueeze(-1) - means) / stds).mean(-1) >= q
+            hi = torch.where(above, mid, hi)
+            lo = torch.where(above, lo, mid)
+        quants = (lo + hi) / 2
+
+        dtype = distr_args[0].dtype
+        return mean.to(dtype), quants.to(dtype)
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -2456,7 +2771,7 @@ class GMM(torch.nn.Module):
 
         return self.neglog_likelihood(y=y, distr_args=distr_args, mask=mask)
 
-# %% ../../nbs/losses.pytorch.ipynb 90
+# %% ../../nbs/losses.pytorch.ipynb 96
 class NBMM(torch.nn.Module):
     """Negative Binomial Mixture Mesh
 
@@ -2473,7 +2788,8 @@ class NBMM(torch.nn.Module):
     `n_components`: int=10, the number of mixture components.<br>
     `level`: float list [0,100], confidence levels for prediction intervals.<br>
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
-    `return_params`: bool=False, wether or not return the Distribution parameters.<br><br>
+    `return_params`: bool=False, wether or not return the Distribution parameters.<br>
+    `quantile_method`: str='analytic', 'analytic' inverts the mixture's CDF with a vectorized bisection, 'sample' estimates the quantiles from `num_samples` samples.<br><br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2488,6 +2804,7 @@ class NBMM(torch.nn.Module):
         quantiles=None,
         num_samples=1000,
         return_params=False,
+        quantile_method="analytic",
     ):
         super(NBMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2500,6 +2817,11 @@ class NBMM(torch.nn.Module):
             qs = torch.Tensor(quantiles)
         self.quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.num_samples = num_samples
+        assert quantile_method in [
+            "analytic",
+            "sample",
+        ], f"{quantile_method} quantile method not available"
+        self.quantile_method = quantile_method
 
         # If True, predict_step will return Distribution's parameters
         self.return_params = return_params
@@ -2619,6 +2941,43 @@ class NBMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def get_quantiles(self, distr_args):
+        """
+        Compute the mean and the quantiles defined by `levels` of the estimated
+        mixture. With `quantile_method='analytic'` the quantiles are the exact
+        inversion of the mixture's CDF over the integers, found by bisection for
+        all the [B,H] cells at once, otherwise they are estimated with `sample`.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if self.quantile_method == "sample":
+            _, sample_mean, quants = self.sample(distr_args=distr_args)
+            return sample_mean, quants
+
+        # Uniform weights, the mixture's CDF averages the components' CDFs
+        total_count, probs = distr_args
+        total_count = total_count.double().unsqueeze(-2)  # [B,H,1,K]
+        probs = probs.double().unsqueeze(-2)
+        quantiles_device = self.quantiles.to(probs.device).double()
+        q = quantiles_device.expand(probs.shape[:2] + quantiles_device.shape)
+
+        def cdf(k):
+            return _betainc(total_count, k.unsqueeze(-1) + 1, 1 - probs).mean(-1)
+
+        means = total_count * probs / (1 - probs)
+        variances = means / (1 - probs)
+        mean = means.mean(-1)
+        std = torch.sqrt((variances + means**2).mean(-1) - mean**2)
+        quants = _integer_icdf(cdf=cdf, q=q, mean=mean, std=std)
+
+        dtype = distr_args[1].dtype
+        return mean.to(dtype), quants.to(dtype)
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -2670,7 +3029,7 @@ class NBMM(torch.nn.Module):
 
         return self.neglog_likelihood(y=y, distr_args=distr_args, mask=mask)
 
-# %% ../../nbs/losses.pytorch.ipynb 97
+# %% ../../nbs/losses.pytorch.ipynb 105
 class HuberLoss(BasePointLoss):
     """ Huber Loss
 
@@ -2722,7 +3081,7 @@ class HuberLoss(BasePointLoss):
         weights = self._compute_weights(y=y, mask=mask)
         return _weighted_mean(losses=losses, weights=weights)
 
-# %% ../../nbs/losses.pytorch.ipynb 102
+# %% ../../nbs/losses.pytorch.ipynb 110
 class TukeyLoss(torch.nn.Module):
     """ Tukey Loss
 
@@ -2810,7 +3169,7 @@ class TukeyLoss(torch.nn.Module):
         tukey_loss = (self.c**2 / 6) * torch.mean(tukey_loss)
         return tukey_loss
 
-# %% ../../nbs/losses.pytorch.ipynb 107
+# %% ../../nbs/losses.pytorch.ipynb 115
 class HuberQLoss(BasePointLoss):
     """Huberized Quantile Loss
 
@@ -2873,7 +3232,7 @@ class HuberQLoss(BasePointLoss):
         weights = self._compute_weights(y=y, mask=mask)
         return _weighted_mean(losses=losses, weights=weights)
 
-# %% ../../nbs/losses.pytorch.ipynb 112
+# %% ../../nbs/losses.pytorch.ipynb 120
 class HuberMQLoss(BasePointLoss):
     """Huberized Multi-Quantile loss
 
@@ -2987,7 +3346,7 @@ class HuberMQLoss(BasePointLoss):
 
         return _weighted_mean(losses=losses, weights=weights)
 
-# %% ../../nbs/losses.pytorch.ipynb 118
+# %% ../../nbs/losses.pytorch.ipynb 126
 class Accuracy(torch.nn.Module):
     """Accuracy
 
@@ -3034,7 +3393,7 @@ class Accuracy(torch.nn.Module):
         accuracy = torch.mean(measure)
         return accuracy
 
-# %% ../../nbs/losses.pytorch.ipynb 122
+# %% ../../nbs/losses.pytorch.ipynb 130
 class sCRPS(torch.nn.Module):
     """Scaled Continues Ranked Probability Score
 
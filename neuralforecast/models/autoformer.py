@@ -47,6 +47,7 @@ class AutoCorrelation(nn.Module):
         SpeedUp version of Autocorrelation (a batch-normalization style design)
         This is for the training phase.
         """
+        batch = values.shape[0]
         head = values.shape[1]
         channel = values.shape[2]
         length = values.shape[3]
@@ -54,21 +55,21 @@ class AutoCorrelation(nn.Module):
         top_k = int(self.factor * math.log(length))
         mean_value = torch.mean(torch.mean(corr, dim=1), dim=1)
         index = torch.topk(torch.mean(mean_value, dim=0), top_k, dim=-1)[1]
-        weights = torch.stack([mean_value[:, index[i]] for i in range(top_k)], dim=-1)
+        weights = mean_value[:, index]
         # update corr
         tmp_corr = torch.softmax(weights, dim=-1)
-        # aggregation
-        tmp_values = values
-        delays_agg = torch.zeros_like(values, dtype=torch.float, device=values.device)
-        for i in range(top_k):
-            pattern = torch.roll(tmp_values, -int(index[i]), -1)
-            delays_agg = delays_agg + pattern * (
-                tmp_corr[:, i]
-                .unsqueeze(1)
-                .unsqueeze(1)
-                .unsqueeze(1)
-                .repeat(1, head, channel, length)
-            )
+        # aggregation, rolling by each delay is a slice of the doubled sequence
+        tmp_values = values.repeat(1, 1, 1, 2).reshape(
+            batch, head * channel, 2 * length
+        )
+        tmp_delay = index.unsqueeze(-1) + torch.arange(length, device=values.device)
+        tmp_delay = tmp_delay.reshape(1, 1, top_k * length).expand(
+            batch, head * channel, -1
+        )
+        patterns = torch.gather(tmp_values, dim=-1, index=tmp_delay)
+        patterns = patterns.reshape(batch, head * channel, top_k, length)
+        delays_agg = torch.matmul(tmp_corr[:, None, None, :], patterns)
+        delays_agg = delays_agg.reshape(batch, head, channel, length)
         return delays_agg
 
     def time_delay_agg_inference(self, values, corr):
@@ -80,36 +81,24 @@ class AutoCorrelation(nn.Module):
         head = values.shape[1]
         channel = values.shape[2]
         length = values.shape[3]
-        # index init
-        init_index = (
-            torch.arange(length, device=values.device)
-            .unsqueeze(0)
-            .unsqueeze(0)
-            .unsqueeze(0)
-            .repeat(batch, head, channel, 1)
-        )
         # find top k
         top_k = int(self.factor * math.log(length))
         mean_value = torch.mean(torch.mean(corr, dim=1), dim=1)
-        weights = torch.topk(mean_value, top_k, dim=-1)[0]
-        delay = torch.topk(mean_value, top_k, dim=-1)[1]
+        weights, delay = torch.topk(mean_value, top_k, dim=-1)
         # update corr
         tmp_corr = torch.softmax(weights, dim=-1)
-        # aggregation
-        tmp_values = values.repeat(1, 1, 1, 2)
-        delays_agg = torch.zeros_like(values, dtype=torch.float, device=values.device)
-        for i in range(top_k):
-            tmp_delay = init_index + delay[:, i].unsqueeze(1).unsqueeze(1).unsqueeze(
-                1
-            ).repeat(1, head, channel, length)
-            pattern = torch.gather(tmp_values, dim=-1, index=tmp_delay)
-            delays_agg = delays_agg + pattern * (
-                tmp_corr[:, i]
-                .unsqueeze(1)
-                .unsqueeze(1)
-                .unsqueeze(1)
-                .repeat(1, head, channel, length)
-            )
+        # aggregation, all the delays are gathered at once from the doubled sequence
+        tmp_values = values.repeat(1, 1, 1, 2).reshape(
+            batch, head * channel, 2 * length
+        )
+        tmp_delay = delay.unsqueeze(-1) + torch.arange(length, device=values.device)
+        tmp_delay = tmp_delay.reshape(batch, 1, top_k * length).expand(
+            -1, head * channel, -1
+        )
+        patterns = torch.gather(tmp_values, dim=-1, index=tmp_delay)
+        patterns = patterns.reshape(batch, head * channel, top_k, length)
+        delays_agg = torch.matmul(tmp_corr[:, None, None, :], patterns)
+        delays_agg = delays_agg.reshape(batch, head, channel, length)
         return delays_agg
 
     def time_delay_agg_full(self, values, corr):
@@ -120,27 +109,18 @@ class AutoCorrelation(nn.Module):
         head = values.shape[1]
         channel = values.shape[2]
         length = values.shape[3]
-        # index init
-        init_index = (
-            torch.arange(length, device=values.device)
-            .unsqueeze(0)
-            .unsqueeze(0)
-            .unsqueeze(0)
-            .repeat(batch, head, channel, 1)
-        )
         # find top k
         top_k = int(self.factor * math.log(length))
-        weights = torch.topk(corr, top_k, dim=-1)[0]
-        delay = torch.topk(corr, top_k, dim=-1)[1]
+        weights, delay = torch.topk(corr, top_k, dim=-1)
         # update corr
         tmp_corr = torch.softmax(weights, dim=-1)
-        # aggregation
+        # aggregation, all the delays are gathered at once from the doubled sequence
         tmp_values = values.repeat(1, 1, 1, 2)
-        delays_agg = torch.zeros_like(values, dtype=torch.float, device=values.device)
-        for i in range(top_k):
-            tmp_delay = init_index + delay[..., i].unsqueeze(-1)
-            pattern = torch.gather(tmp_values, dim=-1, index=tmp_delay)
-            delays_agg = delays_agg + pattern * (tmp_corr[..., i].unsqueeze(-1))
+        tmp_delay = delay.unsqueeze(-1) + torch.arange(length, device=values.device)
+        tmp_delay = tmp_delay.reshape(batch, head, channel, top_k * length)
+        patterns = torch.gather(tmp_values, dim=-1, index=tmp_delay)
+        patterns = patterns.reshape(batch, head, channel, top_k, length)
+        delays_agg = torch.matmul(tmp_corr.unsqueeze(-2), patterns).squeeze(-2)
         return delays_agg
 
     def forward(self, queries, keys, values, attn_mask):
@@ -4,6 +4,8 @@
 __all__ = ['Decoder', 'DeepAR']
 
 # %% ../../nbs/models.deepar.ipynb 4
+import contextlib
+
 import numpy as np
 
 import torch
@@ -65,6 +67,8 @@ class DeepAR(BaseWindows):
     `decoder_hidden_layers`: int=0, number of decoder MLP hidden layers. Default: 0 for linear layer. <br>
     `decoder_hidden_size`: int=0, decoder MLP hidden size. Default: 0 for linear layer.<br>
     `trajectory_samples`: int=100, number of Monte Carlo trajectories during inference.<br>
+    `valid_trajectory_samples`: int=None, number of Monte Carlo trajectories during validation. If None uses `trajectory_samples`.<br>
+    `valid_seed`: int=None, if provided, the validation trajectories are drawn with this seed on a forked random state, so validation losses are comparable across checks and don't advance the training random state.<br>
     `stat_exog_list`: str list, static exogenous columns.<br>
     `hist_exog_list`: str list, historic exogenous columns.<br>
     `futr_exog_list`: str list, future exogenous columns.<br>
@@ -115,6 +119,8 @@ class DeepAR(BaseWindows):
         decoder_hidden_layers: int = 0,
         decoder_hidden_size: int = 0,
         trajectory_samples: int = 100,
+        valid_trajectory_samples: Optional[int] = None,
+        valid_seed: Optional[int] = None,
         futr_exog_list=None,
         hist_exog_list=None,
         stat_exog_list=None,
@@ -195,6 +201,10 @@ class DeepAR(BaseWindows):
 
         self.horizon_backup = self.h  # Used because h=0 during training
         self.trajectory_samples = trajectory_samples
+        if valid_trajectory_samples is None:
+            valid_trajectory_samples = trajectory_samples
+        self.valid_trajectory_samples = valid_trajectory_samples
+        self.valid_seed = valid_seed
 
         # LSTM
         self.encoder_n_layers = lstm_n_layers
@@ -311,38 +321,55 @@ class DeepAR(BaseWindows):
 
         valid_losses = []
         batch_sizes = []
-        for i in range(n_batches):
-            # Create and normalize windows [Ws, L+H, C]
-            w_idxs = np.arange(
-                i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
-            )
-            windows = self._create_windows(batch, step="val", w_idxs=w_idxs)
-            original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, 0])
-            windows = self._normalization(windows=windows, y_idx=y_idx)
-
-            # Parse windows
-            insample_y, insample_mask, _, outsample_mask, _, futr_exog, stat_exog = (
-                self._parse_windows(batch, windows)
-            )
-            windows_batch = dict(
-                insample_y=insample_y,
-                insample_mask=insample_mask,
-                futr_exog=futr_exog,
-                hist_exog=None,
-                stat_exog=stat_exog,
-                temporal_cols=batch["temporal_cols"],
-                y_idx=y_idx,
-            )
-
-            # Model Predictions
-            output_batch = self(windows_batch)
-            # Monte Carlo already returns y_hat with mean and quantiles
-            output_batch = output_batch[:, :, 1:]  # Remove mean
-            valid_loss_batch = self.valid_loss(
-                y=original_outsample_y, y_hat=output_batch, mask=outsample_mask
-            )
-            valid_losses.append(valid_loss_batch)
-            batch_sizes.append(len(output_batch))
+        # A fixed seed makes the validation losses comparable across checks
+        # and leaves the training random state untouched
+        rng_context = contextlib.nullcontext()
+        if self.valid_seed is not None:
+            devices = [self.device] if self.device.type == "cuda" else []
+            rng_context = torch.random.fork_rng(devices=devices)
+        with rng_context:
+            if self.valid_seed is not None:
+                torch.manual_seed(self.valid_seed)
+            for i in range(n_batches):
+                # Create and normalize windows [Ws, L+H, C]
+                w_idxs = np.arange(
+                    i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
+                )
+                windows = self._create_windows(batch, step="val", w_idxs=w_idxs)
+                original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, 0])
+                windows = self._normalization(windows=windows, y_idx=y_idx)
+
+                # Parse windows
+                (
+                    insample_y,
+                    insample_mask,
+                    _,
+                    outsample_mask,
+                    _,
+                    futr_exog,
+                    stat_exog,
+                ) = self._parse_windows(batch, windows)
+                windows_batch = dict(
+                    insample_y=insample_y,
+                    insample_mask=insample_mask,
+                    futr_exog=futr_exog,
+                    hist_exog=None,
+                    stat_exog=stat_exog,
+                    temporal_cols=batch["temporal_cols"],
+                    y_idx=y_idx,
+                )
+
+                # Model Predictions
+                output_batch = self(
+                    windows_batch, trajectory_samples=self.valid_trajectory_samples
+                )
+                # Monte Carlo already returns y_hat with mean and quantiles
+                output_batch = output_batch[:, :, 1:]  # Remove mean
+                valid_loss_batch = self.valid_loss(
+                    y=original_outsample_y, y_hat=output_batch, mask=outsample_mask
+                )
+                valid_losses.append(valid_loss_batch)
+                batch_sizes.append(len(output_batch))
 
         valid_loss = torch.stack(valid_losses)
         batch_sizes = torch.tensor(batch_sizes, device=valid_loss.device)
@@ -437,7 +464,7 @@ class DeepAR(BaseWindows):
         output = self.loss.domain_map(output)
         return output
 
-    def forward(self, windows_batch):
+    def forward(self, windows_batch, trajectory_samples=None):
 
         # Parse windows_batch
         encoder_input = windows_batch["insample_y"][:, :, None]  # <- [B,L,1]
@@ -464,11 +491,13 @@ class DeepAR(BaseWindows):
         c_n = h_c_tuple[1]  # [n_layers, B, lstm_hidden_state]
 
         # Vectorizes trajectory samples in batch dimension [1]
+        if trajectory_samples is None:
+            trajectory_samples = self.trajectory_samples
         h_n = torch.repeat_interleave(
-            h_n, self.trajectory_samples, 1
+            h_n, trajectory_samples, 1
         )  # [n_layers, B*trajectory_samples, rnn_hidden_state]
         c_n = torch.repeat_interleave(
-            c_n, self.trajectory_samples, 1
+            c_n, trajectory_samples, 1
         )  # [n_layers, B*trajectory_samples, rnn_hidden_state]
 
         # Scales for inverse normalization
@@ -476,14 +505,23 @@ class DeepAR(BaseWindows):
             self.scaler.x_scale[:, 0, [y_idx]].squeeze(-1).to(encoder_input.device)
         )
         y_loc = self.scaler.x_shift[:, 0, [y_idx]].squeeze(-1).to(encoder_input.device)
-        y_scale = torch.repeat_interleave(y_scale, self.trajectory_samples, 0)
-        y_loc = torch.repeat_interleave(y_loc, self.trajectory_samples, 0)
+        y_scale = torch.repeat_interleave(y_scale, trajectory_samples, 0)
+        y_loc = torch.repeat_interleave(y_loc, trajectory_samples, 0)
+
+        # Exogenous inputs of the forecasting window, expanded once for all the trajectories
+        if self.futr_exog_size > 0:
+            futr_exog_samples = torch.repeat_interleave(
+                futr_exog[:, input_size + 1 :, :], trajectory_samples, 0
+            )  # [B*n_samples, H-1, n_f]
+        if self.stat_exog_size > 0:
+            stat_exog_samples = torch.repeat_interleave(
+                stat_exog, trajectory_samples, 0
+            )[
+                :, None, :
+            ]  # [B*n_samples, 1, n_s]
 
         # Recursive strategy prediction
-        quantiles = self.loss.quantiles.to(encoder_input.device)
-        y_hat = torch.zeros(
-            batch_size, self.h, len(quantiles) + 1, device=encoder_input.device
-        )
+        trajectories = []
         for tau in range(self.h):
             # Decoder forward
             last_layer_h = h_n[-1]  # [B*trajectory_samples, lstm_hidden_state]
@@ -500,13 +538,8 @@ class DeepAR(BaseWindows):
                 distr_args[i] = distr_args[i].unsqueeze(-1)
             distr_args = tuple(distr_args)
             samples_tau, _, _ = self.loss.sample(distr_args=distr_args, num_samples=1)
-            samples_tau = samples_tau.reshape(batch_size, self.trajectory_samples)
-            sample_mean = torch.mean(samples_tau, dim=-1).to(encoder_input.device)
-            quants = torch.quantile(input=samples_tau, q=quantiles, dim=-1).to(
-                encoder_input.device
-            )
-            y_hat[:, tau, 0] = sample_mean
-            y_hat[:, tau, 1:] = quants.permute((1, 0))  # [Q, B] -> [B, Q]
+            samples_tau = samples_tau.reshape(batch_size, trajectory_samples)
+            trajectories.append(samples_tau)
 
             # Stop if already in the last step (no need to predict next step)
             if tau + 1 == self.h:
@@ -519,23 +552,27 @@ class DeepAR(BaseWindows):
 
             # Update input
             if self.futr_exog_size > 0:
-                futr_exog_tau = futr_exog[:, [input_size + tau + 1], :]  # [B, 1, n_f]
-                futr_exog_tau = torch.repeat_interleave(
-                    futr_exog_tau, self.trajectory_samples, 0
-                )  # [B*n_samples, 1, n_f]
+                futr_exog_tau = futr_exog_samples[:, [tau], :]  # [B*n_samples, 1, n_f]
                 encoder_input = torch.cat(
                     (encoder_input, futr_exog_tau), dim=2
                 )  # [B*n_samples, 1, 1+n_f]
             if self.stat_exog_size > 0:
-                stat_exog_tau = torch.repeat_interleave(
-                    stat_exog, self.trajectory_samples, 0
-                )  # [B*n_samples, n_s]
                 encoder_input = torch.cat(
-                    (encoder_input, stat_exog_tau[:, None, :]), dim=2
+                    (encoder_input, stat_exog_samples), dim=2
                 )  # [B*n_samples, 1, 1+n_f+n_s]
 
             _, h_c_tuple = self.hist_encoder(encoder_input, (h_n, c_n))
             h_n = h_c_tuple[0]  # [n_layers, B, rnn_hidden_state]
             c_n = h_c_tuple[1]  # [n_layers, B, rnn_hidden_state]
 
+        # Mean and quantiles over all the trajectories at once
+        trajectories = torch.stack(trajectories, dim=-1).to(
+            encoder_input.device
+        )  # [B, n_samples, H]
+        quantiles = self.loss.quantiles.to(encoder_input.device)
+        sample_mean = torch.mean(trajectories, dim=1, keepdim=True)  # [B, 1, H]
+        quants = torch.quantile(input=trajectories, q=quantiles, dim=1)  # [Q, B, H]
+        y_hat = torch.cat((sample_mean, quants.permute(1, 0, 2)), dim=1)  # [B, Q+1, H]
+        y_hat = y_hat.permute(0, 2, 1)  # [B, H, Q+1]
+
         return y_hat
@@ -4,6 +4,7 @@
 __all__ = ['get_bottomup_P', 'get_mintrace_ols_P', 'get_mintrace_wls_P', 'get_identity_P', 'HINT']
 
 # %% ../../nbs/models.hint.ipynb 5
+import warnings
 from typing import Optional
 
 import numpy as np
@@ -107,6 +108,171 @@ def get_identity_P(S: np.ndarray):
     pass
 
 # %% ../../nbs/models.hint.ipynb 12
+# Upper bound on the sample entries reconciled at once by `HINT.predict`
+_RECONCILIATION_CHUNK_ELEMENTS = 2**23
+
+
+def _to_sparse(M) -> torch.Tensor:
+    # Built from the nonzero entries of a numpy array, a scipy sparse matrix or a torch
+    # tensor, without a dense float64 copy of M
+    if isinstance(M, torch.Tensor):
+        return M.to_sparse_coo().double().coalesce()
+    if hasattr(M, "tocoo"):
+        M = M.tocoo()
+        rows, cols, values = M.row, M.col, M.data
+    else:
+        rows, cols = np.nonzero(M)
+        values = M[rows, cols]
+    return torch.sparse_coo_tensor(
+        indices=torch.from_numpy(np.vstack([rows, cols]).astype(np.int64)),
+        values=torch.from_numpy(values.astype(np.float64)),
+        size=M.shape,
+    ).coalesce()
+
+
+def _sparse_rows(M: torch.Tensor, start: int, end: int) -> torch.Tensor:
+    # Rows [start:end] of a coalesced sparse COO matrix
+    rows, cols = M.indices()
+    mask = (rows >= start) & (rows < end)
+    return torch.sparse_coo_tensor(
+        indices=torch.stack([rows[mask] - start, cols[mask]]),
+        values=M.values()[mask],
+        size=(end - start, M.shape[1]),
+    ).coalesce()
+
+
+def _sorted_quantiles(x: torch.Tensor, quantiles: torch.Tensor) -> torch.Tensor:
+    # Linear interpolation between order statistics, as the default `np.quantile`
+    # x: [..., num_samples] sorted along the last dimension
+    positions = quantiles * (x.shape[-1] - 1)
+    lower = positions.floor().long()
+    upper = positions.ceil().long()
+    weights = positions - lower
+    return x[..., lower] * (1 - weights) + x[..., upper] * weights
+
+
+class _MinTraceP:
+    """Matrix-free MinTrace reconciliation matrix.
+
+    Applies the MinTrace reconciliation matrix with diagonal $\mathbf{W}$ as `P @ x`,
+    through Equation 10 of Wickramasuriya et al.
+    $$\mathbf{P}\mathbf{x} = \mathbf{x}_{[b]} + \mathbf{W}_{[b]}\mathbf{A}^{\intercal}\mathbf{K}^{-1}(\mathbf{x}_{[a]} - \mathbf{A}\mathbf{x}_{[b]}),
+    \quad \mathbf{K} = \mathbf{W}_{[a]} + \mathbf{A}\mathbf{W}_{[b]}\mathbf{A}^{\intercal}$$
+    where $\mathbf{A}$ holds the aggregate rows of `S`. `P` is never materialized, the
+    aggregation matvecs are sparse and $\mathbf{K}$ is solved with a Cholesky factor for
+    up to `max_cholesky_size` aggregates, or Jacobi preconditioned conjugate gradients.
+
+    **Parameters:**<br>
+    `S`: Summing matrix of size (`base`, `bottom`), dense or sparse.<br>
+    `W`: Diagonal of the covariance matrix of size (`base`).<br>
+    `tol`: float, relative residual tolerance of the conjugate gradients.<br>
+    `max_iter`: int, maximum conjugate gradient iterations, defaults to `base - bottom`.<br>
+    `max_cholesky_size`: int, largest number of aggregates factorized with Cholesky.<br>
+    """
+
+    def __init__(
+        self,
+        S,
+        W,
+        tol: float = 1e-10,
+        max_iter: Optional[int] = None,
+        max_cholesky_size: int = 4096,
+    ):
+        S = _to_sparse(S)
+        n_hiers, n_bottom = S.shape
+        self.n_agg = n_hiers - n_bottom
+        self.shape = (n_bottom, n_hiers)
+        self.tol = tol
+        self.max_iter = self.n_agg if max_iter is None else max_iter
+
+        weights = torch.as_tensor(W, dtype=torch.float64)[:, None]
+        self.W_agg, self.W_bottom = weights[: self.n_agg], weights[self.n_agg :]
+        self.A = _sparse_rows(S, 0, self.n_agg)
+        self.At = self.A.t().coalesce()
+
+        # K = W_agg + A W_bottom A' is only formed densely when it is small
+        _, cols = self.A.indices()
+        self.K_diag = (
+            self.W_agg
+            + torch.sparse_coo_tensor(
+                self.A.indices(), self.A.values() ** 2, self.A.shape
+            )
+            @ self.W_bottom
+        )
+        self.K_cholesky = None
+        if self.n_agg <= max_cholesky_size:
+            A_scaled = torch.sparse_coo_tensor(
+                self.A.indices(), self.A.values() * self.W_bottom[cols, 0], self.A.shape
+            )
+            with warnings.catch_warnings(record=False):
+                # Sparse-sparse products go through beta sparse CSR kernels
+                warnings.filterwarnings(
+                    "ignore",
+                    message="Sparse CSR tensor support is in beta state",
+                    category=UserWarning,
+                )
+                K = torch.sparse.mm(A_scaled, self.At).to_dense()
+            K = K + torch.diag(self.W_agg[:, 0])
+            self.K_cholesky = torch.linalg.cholesky(K)
+
+    def _K_matvec(self, y):
+        return self.W_agg * y + self.A @ (self.W_bottom * (self.At @ y))
+
+    def _K_solve(self, e):
+        if self.K_cholesky is not None:
+            return torch.cholesky_solve(e, self.K_cholesky)
+
+        e_norm = torch.linalg.vector_norm(e, dim=0)
+        y = e / self.K_diag
+        r = e - self._K_matvec(y)
+        z = r / self.K_diag
+        p = z
+        rz = (r * z).sum(dim=0)
+        for _ in range(self.max_iter):
+            if (torch.linalg.vector_norm(r, dim=0) <= self.tol * e_norm).all():
+                break
+            Kp = self._K_matvec(p)
+            pKp = (p * Kp).sum(dim=0)
+            alpha = torch.where(pKp > 0, rz / pKp, torch.zeros_like(pKp))
+            y = y + alpha * p
+            r = r - alpha * Kp
+            z = r / self.K_diag
+            rz_new = (r * z).sum(dim=0)
+            beta = torch.where(rz > 0, rz_new / rz, torch.zeros_like(rz))
+            p = z + beta * p
+            rz = rz_new
+        return y
+
+    def __matmul__(self, x: torch.Tensor) -> torch.Tensor:
+        # x: [base, k] -> P @ x: [bottom, k]
+        x_agg, x_bottom = x[: self.n_agg], x[self.n_agg :]
+        y = self._K_solve(x_agg - self.A @ x_bottom)
+        return x_bottom + self.W_bottom * (self.At @ y)
+
+
+def _sparse_bottomup_P(S):
+    # Sparse counterpart of `get_bottomup_P`
+    S = _to_sparse(S)
+    n_agg = S.shape[0] - S.shape[1]
+    P = _sparse_rows(S, n_agg, S.shape[0]).t().coalesce()
+    return torch.sparse_coo_tensor(
+        indices=P.indices() + torch.tensor([[0], [n_agg]]),
+        values=P.values(),
+        size=(S.shape[1], S.shape[0]),
+    ).coalesce()
+
+
+def _sparse_mintrace_ols_P(S):
+    # Matrix-free counterpart of `get_mintrace_ols_P`
+    return _MinTraceP(S=S, W=np.ones(S.shape[0]))
+
+
+def _sparse_mintrace_wls_P(S):
+    # Matrix-free counterpart of `get_mintrace_wls_P`
+    S = _to_sparse(S)
+    return _MinTraceP(S=S, W=torch.sparse.sum(S, dim=1).to_dense())
+
+# %% ../../nbs/models.hint.ipynb 13
 class HINT:
     """HINT
 
@@ -130,7 +296,7 @@ class HINT:
     **Parameters:**<br>
     `h`: int, Forecast horizon. <br>
     `model`: NeuralForecast model, instantiated model class from [architecture collection](https://nixtla.github.io/neuralforecast/models.pytorch.html).<br>
-    `S`: np.ndarray, dumming matrix of size (`base`, `bottom`) see HierarchicalForecast's [aggregate method](https://nixtla.github.io/hierarchicalforecast/utils.html#aggregate).<br>
+    `S`: np.ndarray, scipy or torch sparse matrix, summing matrix of size (`base`, `bottom`) see HierarchicalForecast's [aggregate method](https://nixtla.github.io/hierarchicalforecast/utils.html#aggregate).<br>
     `reconciliation`: str, HINT's reconciliation method from ['BottomUp', 'MinTraceOLS', 'MinTraceWLS'].<br>
     `alias`: str, optional,  Custom name of the model.<br>
     """
@@ -160,24 +326,28 @@ class HINT:
         self.loss = model.loss
 
         available_reconciliations = dict(
-            BottomUp=get_bottomup_P,
-            MinTraceOLS=get_mintrace_ols_P,
-            MinTraceWLS=get_mintrace_wls_P,
+            BottomUp=_sparse_bottomup_P,
+            MinTraceOLS=_sparse_mintrace_ols_P,
+            MinTraceWLS=_sparse_mintrace_wls_P,
             Identity=get_identity_P,
         )
 
         if reconciliation not in available_reconciliations:
             raise Exception(f"Reconciliation {reconciliation} not available")
 
-        # Get SP matrix
+        # Get sparse S and P matrices, SP is never materialized
         self.reconciliation = reconciliation
         if reconciliation == "Identity":
-            self.SP = None
+            self.S_sparse = None
+            self.P_sparse = None
         else:
-            P = available_reconciliations[reconciliation](S=S)
-            self.SP = S @ P
+            self.S_sparse = _to_sparse(S)
+            self.P_sparse = available_reconciliations[reconciliation](S=self.S_sparse)
 
-        qs = torch.Tensor((np.arange(self.loss.num_samples) / self.loss.num_samples))
+        # Midpoint levels keep the simulated samples finite for closed-form quantiles
+        qs = torch.Tensor(
+            ((np.arange(self.loss.num_samples) + 0.5) / self.loss.num_samples)
+        )
         self.sample_quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.alias = alias
 
@@ -226,7 +396,9 @@ class HINT:
 
         After fitting a base model on the entire hierarchical dataset.
         HINT restores the hierarchical aggregation constraints using
-        bootstrapped sample reconciliation.
+        bootstrapped sample reconciliation. The base model predicts the samples of
+        all the windows at once, only their reconciliation with the sparse `S` and `P`
+        matrices is done in chunks of windows and horizons.
 
         **Parameters:**<br>
         `dataset`: NeuralForecast's `TimeSeriesDataset` see details [here](https://nixtla.github.io/neuralforecast/tsdataset.html)<br>
@@ -265,25 +437,31 @@ class HINT:
         self.model.loss.quantiles = quantiles_old
         self.model.loss.output_names = names_old
 
-        # Hack requires to break quantiles correlations between samples
-        idxs = np.random.choice(num_samples, size=samples.shape, replace=True)
-        aux_col_idx = np.arange(len(samples))[:, None] * num_samples
-        idxs = idxs + aux_col_idx
-        samples = samples.flatten()[idxs]
-        samples = samples.reshape(dataset.n_groups, -1, self.h, num_samples)
-
-        # Bootstrap Sample Reconciliation
+        # Bootstrap Sample Reconciliation, chunked over windows and horizons to bound
+        # the memory of the [n_series, chunk, num_samples] resampled and reconciled copies
+        samples = samples.reshape(dataset.n_groups, -1, num_samples)
+        n_series, n_steps, _ = samples.shape
+        chunk_size = max(1, _RECONCILIATION_CHUNK_ELEMENTS // (n_series * num_samples))
+        quantiles = self.model.loss.quantiles.detach().cpu().double()
         # Default output [mean, quantiles]
-        samples = np.einsum("ij, jwhp -> iwhp", self.SP, samples)
+        forecasts = np.empty((n_series, n_steps, 1 + len(quantiles)), dtype=np.float64)
+        for start in range(0, n_steps, chunk_size):
+            chunk = samples[:, start : start + chunk_size]
+
+            # Hack requires to break quantiles correlations between samples
+            idxs = np.random.choice(num_samples, size=chunk.shape, replace=True)
+            chunk = np.take_along_axis(chunk, idxs, axis=-1)
 
-        sample_mean = np.mean(samples, axis=-1, keepdims=True)
-        sample_mean = sample_mean.reshape(-1, 1)
+            chunk = torch.from_numpy(chunk).double().reshape(n_series, -1)
+            chunk = self.S_sparse @ (self.P_sparse @ chunk)
+            chunk = chunk.reshape(n_series, -1, num_samples)
 
-        forecasts = np.quantile(samples, self.model.loss.quantiles, axis=-1)
-        forecasts = forecasts.transpose(1, 2, 3, 0)  # [...,samples]
-        forecasts = forecasts.reshape(-1, len(self.model.loss.quantiles))
+            forecasts[:, start : start + chunk_size, 0] = chunk.mean(dim=-1).numpy()
+            forecasts[:, start : start + chunk_size, 1:] = _sorted_quantiles(
+                chunk.sort(dim=-1).values, quantiles
+            ).numpy()
 
-        forecasts = np.concatenate([sample_mean, forecasts], axis=-1)
+        forecasts = forecasts.reshape(-1, 1 + len(quantiles))
         return forecasts
 
     def set_test_size(self, test_size):
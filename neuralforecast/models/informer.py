@@ -58,11 +58,8 @@ class ProbMask:
 
     def __init__(self, B, H, L, index, scores, device="cpu"):
         _mask = torch.ones(L, scores.shape[-1], dtype=torch.bool, device=device).triu(1)
-        _mask_ex = _mask[None, None, :].expand(B, H, L, scores.shape[-1])
-        indicator = _mask_ex[
-            torch.arange(B)[:, None, None], torch.arange(H)[None, :, None], index, :
-        ].to(device)
-        self._mask = indicator.view(scores.shape).to(device)
+        indicator = _mask[index.to(device)]
+        self._mask = indicator.view(scores.shape)
 
     @property
     def mask(self):
@@ -74,6 +71,9 @@ class ProbAttention(nn.Module):
     ProbAttention
     """
 
+    # the keys scored by each query are sampled in every forward pass
+    random_forward = True
+
     def __init__(
         self,
         mask_flag=True,
@@ -94,23 +94,23 @@ class ProbAttention(nn.Module):
         B, H, L_K, E = K.shape
         _, _, L_Q, _ = Q.shape
 
-        # calculate the sampled Q_K
-        K_expand = K.unsqueeze(-3).expand(B, H, L_Q, L_K, E)
-
-        index_sample = torch.randint(
-            L_K, (L_Q, sample_k)
+        # calculate the sampled Q_K, gathering only the sampled keys of each query
+        index_sample = torch.randint(L_K, (L_Q, sample_k)).to(
+            K.device
         )  # real U = U_part(factor*ln(L_k))*L_q
-        K_sample = K_expand[:, :, torch.arange(L_Q).unsqueeze(1), index_sample, :]
-        Q_K_sample = torch.matmul(Q.unsqueeze(-2), K_sample.transpose(-2, -1)).squeeze()
+        K_sample = K[:, :, index_sample, :]  # [B, H, L_Q, sample_k, E]
+        Q_K_sample = torch.matmul(Q.unsqueeze(-2), K_sample.transpose(-2, -1)).squeeze(
+            -2
+        )
 
         # find the Top_k query with sparisty measurement
         M = Q_K_sample.max(-1)[0] - torch.div(Q_K_sample.sum(-1), L_K)
         M_top = M.topk(n_top, sorted=False)[1]
 
         # use the reduced Q to calculate Q_K
-        Q_reduce = Q[
-            torch.arange(B)[:, None, None], torch.arange(H)[None, :, None], M_top, :
-        ]  # factor*ln(L_q)
+        Q_reduce = torch.gather(
+            Q, 2, M_top.unsqueeze(-1).expand(-1, -1, -1, E)
+        )  # factor*ln(L_q)
         Q_K = torch.matmul(Q_reduce, K.transpose(-2, -1))  # factor*ln(L_q)*L_k
 
         return Q_K, M_top
@@ -1,12 +1,15 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/models.itransformer.ipynb.
 
 # %% auto 0
-__all__ = ['TriangularCausalMask', 'FullAttention', 'DataEmbedding_inverted', 'iTransformer']
+__all__ = ['TriangularCausalMask', 'FullAttention', 'LinearAttention', 'DataEmbedding_inverted', 'iTransformer']
 
 # %% ../../nbs/models.itransformer.ipynb 6
+from typing import Optional
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from torch.utils.checkpoint import checkpoint
 
 import numpy as np
 
@@ -42,6 +45,11 @@ class TriangularCausalMask:
 class FullAttention(nn.Module):
     """
     FullAttention
+
+    Uses `scaled_dot_product_attention`, which dispatches to fused memory-efficient kernels.
+    With `chunk_size`, queries are processed in blocks of `chunk_size` tokens, and during
+    training every block is recomputed in the backward pass, so at most a
+    [B, H, chunk_size, S] score matrix is held in memory whatever kernel is used.
     """
 
     def __init__(
@@ -51,33 +59,108 @@ class FullAttention(nn.Module):
         scale=None,
         attention_dropout=0.1,
         output_attention=False,
+        chunk_size=None,
     ):
         super(FullAttention, self).__init__()
         self.scale = scale
         self.mask_flag = mask_flag
         self.output_attention = output_attention
+        self.chunk_size = chunk_size
         self.dropout = nn.Dropout(attention_dropout)
 
+    def _attend(self, queries, keys, values, offset):
+        # queries: [B, H, l, E] starting at token offset, keys: [B, H, S, E], values: [B, H, S, D]
+        attn_mask = None
+        if self.mask_flag:
+            l, S = queries.shape[2], keys.shape[2]
+            positions = torch.arange(
+                offset, offset + l, device=queries.device
+            ).unsqueeze(1)
+            attn_mask = torch.arange(S, device=queries.device) <= positions
+        dropout_p = self.dropout.p if self.training else 0.0
+        return F.scaled_dot_product_attention(
+            queries, keys, values, attn_mask=attn_mask, dropout_p=dropout_p
+        )
+
     def forward(self, queries, keys, values, attn_mask, tau=None, delta=None):
         B, L, H, E = queries.shape
         _, S, _, D = values.shape
         scale = self.scale or 1.0 / sqrt(E)
 
-        scores = torch.einsum("blhe,bshe->bhls", queries, keys)
+        if self.output_attention or (self.mask_flag and attn_mask is not None):
+            scores = torch.einsum("blhe,bshe->bhls", queries, keys)
 
-        if self.mask_flag:
-            if attn_mask is None:
-                attn_mask = TriangularCausalMask(B, L, device=queries.device)
+            if self.mask_flag:
+                if attn_mask is None:
+                    attn_mask = TriangularCausalMask(B, L, device=queries.device)
+
+                scores.masked_fill_(attn_mask.mask, -np.inf)
 
-            scores.masked_fill_(attn_mask.mask, -np.inf)
+            A = self.dropout(torch.softmax(scale * scores, dim=-1))
+            V = torch.einsum("bhls,bshd->blhd", A, values)
 
-        A = self.dropout(torch.softmax(scale * scores, dim=-1))
-        V = torch.einsum("bhls,bshd->blhd", A, values)
+            if self.output_attention:
+                return (V.contiguous(), A)
+            else:
+                return (V.contiguous(), None)
 
-        if self.output_attention:
-            return (V.contiguous(), A)
+        # scaled_dot_product_attention scales by 1 / sqrt(E)
+        queries = queries.transpose(1, 2) * (scale * sqrt(E))
+        keys = keys.transpose(1, 2)
+        values = values.transpose(1, 2)
+        if self.chunk_size is None or L <= self.chunk_size:
+            V = self._attend(queries, keys, values, 0)
         else:
-            return (V.contiguous(), None)
+            V = []
+            for start in range(0, L, self.chunk_size):
+                queries_block = queries[:, :, start : start + self.chunk_size]
+                if torch.is_grad_enabled():
+                    V.append(
+                        checkpoint(
+                            self._attend,
+                            queries_block,
+                            keys,
+                            values,
+                            start,
+                            use_reentrant=False,
+                        )
+                    )
+                else:
+                    V.append(self._attend(queries_block, keys, values, start))
+            V = torch.cat(V, dim=2)
+
+        return (V.transpose(1, 2).contiguous(), None)
+
+
+class LinearAttention(nn.Module):
+    """
+    LinearAttention
+
+    Kernelized attention with the elu(x) + 1 feature map, softmax(QK')V is replaced by
+    phi(Q)(phi(K)'V) normalized by phi(Q)phi(K)'1, in O(L) time and memory instead of O(L * S).
+    """
+
+    def __init__(self, mask_flag=True, eps=1e-6):
+        super(LinearAttention, self).__init__()
+        self.mask_flag = mask_flag
+        self.eps = eps
+
+    def forward(self, queries, keys, values, attn_mask, tau=None, delta=None):
+        queries = F.elu(queries) + 1
+        keys = F.elu(keys) + 1
+
+        if self.mask_flag:
+            # Causal: every query only sees the prefix sums of keys and values
+            KV = torch.einsum("bshe,bshd->bshed", keys, values).cumsum(1)
+            V = torch.einsum("blhe,blhed->blhd", queries, KV)
+            Z = torch.einsum("blhe,blhe->blh", queries, keys.cumsum(1))
+        else:
+            KV = torch.einsum("bshe,bshd->bhed", keys, values)
+            V = torch.einsum("blhe,bhed->blhd", queries, KV)
+            Z = torch.einsum("blhe,bhe->blh", queries, keys.sum(1))
+        V = V / (Z.unsqueeze(-1) + self.eps)
+
+        return (V.contiguous(), None)
 
 # %% ../../nbs/models.itransformer.ipynb 11
 class DataEmbedding_inverted(nn.Module):
@@ -118,6 +201,8 @@ class iTransformer(BaseMultivariate):
     `d_layers`: int, number of decoder layers.<br>
     `d_ff`: int, dimension of fully-connected layer.<br>
     `factor`: int, attention factor.<br>
+    `attention`: str='full', attention between series, 'full' softmax attention or 'linear' attention, linear in `n_series`.<br>
+    `attention_chunk_size`: int, optional, number of series per query block of the 'full' attention, bounds its memory for large `n_series`.<br>
     `dropout`: float, dropout rate.<br>
     `use_norm`: bool, whether to normalize or not.<br>
     `loss`: PyTorch module, instantiated train loss class from [losses collection](https://nixtla.github.io/neuralforecast/losses.pytorch.html).<br>
@@ -164,6 +249,8 @@ class iTransformer(BaseMultivariate):
         d_layers: int = 1,
         d_ff: int = 2048,
         factor: int = 1,
+        attention: str = "full",
+        attention_chunk_size: Optional[int] = None,
         dropout: float = 0.1,
         use_norm: bool = True,
         loss=MAE(),
@@ -183,7 +270,7 @@ class iTransformer(BaseMultivariate):
         optimizer_kwargs=None,
         lr_scheduler=None,
         lr_scheduler_kwargs=None,
-        **trainer_kwargs
+        **trainer_kwargs,
     ):
 
         super(iTransformer, self).__init__(
@@ -210,7 +297,7 @@ class iTransformer(BaseMultivariate):
             optimizer_kwargs=optimizer_kwargs,
             lr_scheduler=lr_scheduler,
             lr_scheduler_kwargs=lr_scheduler_kwargs,
-            **trainer_kwargs
+            **trainer_kwargs,
         )
 
         self.enc_in = n_series
@@ -222,9 +309,14 @@ class iTransformer(BaseMultivariate):
         self.d_layers = d_layers
         self.d_ff = d_ff
         self.factor = factor
+        self.attention = attention
+        self.attention_chunk_size = attention_chunk_size
         self.dropout = dropout
         self.use_norm = use_norm
 
+        if attention not in ["full", "linear"]:
+            raise Exception(f"Check attention={attention}")
+
         # Architecture
         self.enc_embedding = DataEmbedding_inverted(
             input_size, self.hidden_size, self.dropout
@@ -234,8 +326,15 @@ class iTransformer(BaseMultivariate):
             [
                 TransEncoderLayer(
                     AttentionLayer(
-                        FullAttention(
-                            False, self.factor, attention_dropout=self.dropout
+                        (
+                            FullAttention(
+                                False,
+                                self.factor,
+                                attention_dropout=self.dropout,
+                                chunk_size=self.attention_chunk_size,
+                            )
+                            if self.attention == "full"
+                            else LinearAttention(False)
                         ),
                         self.hidden_size,
                         self.n_heads,
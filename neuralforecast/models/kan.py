@@ -50,6 +50,9 @@ class KANLinear(torch.nn.Module):
             .contiguous()
         )
         self.register_buffer("grid", grid)
+        # Knots padded for the local de Boor recursion, recomputed whenever the grid changes
+        self.register_buffer("grid_padded", None, persistent=False)
+        self.update_spline_cache()
 
         self.base_weight = torch.nn.Parameter(torch.Tensor(out_features, in_features))
         self.spline_weight = torch.nn.Parameter(
@@ -95,6 +98,29 @@ class KANLinear(torch.nn.Module):
                     self.spline_scaler, a=math.sqrt(5) * self.scale_spline
                 )
 
+    @torch.no_grad()
+    def update_spline_cache(self):
+        """
+        Cache the grid padded with `spline_order` knots on each side, shape (1, in_features, n_knots + 2 * spline_order),
+        so that the local de Boor recursion of `b_splines` can gather its knots without bounds checks.
+        """
+        k = self.spline_order
+        grid = self.grid
+        steps = torch.arange(1, k + 1, device=grid.device, dtype=grid.dtype)
+        grid_padded = torch.cat(
+            [
+                grid[:, :1] - (grid[:, 1:2] - grid[:, :1]) * steps.flip(0),
+                grid,
+                grid[:, -1:] + (grid[:, -1:] - grid[:, -2:-1]) * steps,
+            ],
+            dim=1,
+        )
+        self.grid_padded = grid_padded.unsqueeze(0)
+
+    def _load_from_state_dict(self, *args, **kwargs):
+        super()._load_from_state_dict(*args, **kwargs)
+        self.update_spline_cache()
+
     def b_splines(self, x: torch.Tensor):
         """
         Compute the B-spline bases for the given input tensor.
@@ -107,21 +133,41 @@ class KANLinear(torch.nn.Module):
         """
         assert x.dim() == 2 and x.size(1) == self.in_features
 
-        grid: torch.Tensor = (
-            self.grid
-        )  # (in_features, grid_size + 2 * spline_order + 1)
+        k = self.spline_order
+        batch = x.size(0)
+        n_knots = self.grid.size(1)
+
+        # Knot interval of every input, grid[:, m] <= x < grid[:, m + 1]
+        m = torch.searchsorted(self.grid, x.T.contiguous(), right=True).T - 1
+        inside = ((m >= 0) & (m < n_knots - 1)).to(x.dtype)
+        m = m.clamp(0, n_knots - 2).unsqueeze(-1)
+
+        # Only B_{m - k}, ..., B_m are nonzero at x, they are computed with de Boor's
+        # triangular scheme from the knots t_{m + 1 - k}, ..., t_{m + k}
+        offsets = torch.arange(1, 2 * k + 1, device=x.device)
+        knots = self.grid_padded.expand(batch, -1, -1).gather(2, m + offsets)
         x = x.unsqueeze(-1)
-        bases = ((x >= grid[:, :-1]) & (x < grid[:, 1:])).to(x.dtype)
-        for k in range(1, self.spline_order + 1):
-            bases = (
-                (x - grid[:, : -(k + 1)])
-                / (grid[:, k:-1] - grid[:, : -(k + 1)])
-                * bases[:, :, :-1]
-            ) + (
-                (grid[:, k + 1 :] - x)
-                / (grid[:, k + 1 :] - grid[:, 1:(-k)])
-                * bases[:, :, 1:]
-            )
+        left = x - knots[..., :k].flip(-1)  # left[..., j - 1] = x - t_{m + 1 - j}
+        right = knots[..., k:] - x  # right[..., j - 1] = t_{m + j} - x
+        local_bases = [inside]
+        for j in range(1, k + 1):
+            saved = 0
+            next_bases = []
+            for r in range(j):
+                # right + left is the knot span t_{m + 1 + r} - t_{m + 1 - j + r}
+                temp = local_bases[r] / (right[..., r] + left[..., j - r - 1])
+                next_bases.append(saved + right[..., r] * temp)
+                saved = left[..., j - r - 1] * temp
+            local_bases = next_bases + [saved]
+
+        # Scatter into the dense bases, with spline_order columns of margin on each side
+        bases = x.new_zeros(batch, self.in_features, self.grid_size + 3 * k)
+        bases = bases.scatter(
+            2,
+            m + torch.arange(k + 1, device=x.device),
+            torch.stack(local_bases, dim=-1),
+        )
+        bases = bases[..., k : self.grid_size + 2 * k]
 
         assert bases.size() == (
             x.size(0),
@@ -173,12 +219,15 @@ class KANLinear(torch.nn.Module):
     def forward(self, x: torch.Tensor):
         assert x.dim() == 2 and x.size(1) == self.in_features
 
-        base_output = F.linear(self.base_activation(x), self.base_weight)
-        spline_output = F.linear(
-            self.b_splines(x).view(x.size(0), -1),
-            self.scaled_spline_weight.view(self.out_features, -1),
+        # Single linear over the concatenated base and spline features
+        features = torch.cat(
+            [self.base_activation(x), self.b_splines(x).view(x.size(0), -1)], dim=1
+        )
+        weight = torch.cat(
+            [self.base_weight, self.scaled_spline_weight.view(self.out_features, -1)],
+            dim=1,
         )
-        return base_output + spline_output
+        return F.linear(features, weight)
 
     @torch.no_grad()
     def update_grid(self, x: torch.Tensor, margin=0.01):
@@ -227,6 +276,7 @@ class KANLinear(torch.nn.Module):
         )
 
         self.grid.copy_(grid.T)
+        self.update_spline_cache()
         self.spline_weight.data.copy_(self.curve2coeff(x, unreduced_spline_output))
 
     def regularization_loss(self, regularize_activation=1.0, regularize_entropy=1.0):
@@ -63,12 +63,12 @@ class STAD(nn.Module):
             indices = torch.multinomial(ratio, 1)
             indices = indices.view(batch_size, -1, 1).permute(0, 2, 1)
             combined_mean = torch.gather(combined_mean, 1, indices)
-            combined_mean = combined_mean.repeat(1, channels, 1)
+            combined_mean = combined_mean.expand(-1, channels, -1)
         else:
             weight = F.softmax(combined_mean, dim=1)
             combined_mean = torch.sum(
                 combined_mean * weight, dim=1, keepdim=True
-            ).repeat(1, channels, 1)
+            ).expand(-1, channels, -1)
 
         # mlp fusion
         combined_mean_cat = torch.cat([input, combined_mean], -1)
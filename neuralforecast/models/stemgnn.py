@@ -4,6 +4,8 @@
 __all__ = ['GLU', 'StockBlockLayer', 'StemGNN']
 
 # %% ../../nbs/models.stemgnn.ipynb 6
+from typing import Optional
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
@@ -119,10 +121,30 @@ class StockBlockLayer(nn.Module):
         )
         return iffted
 
+    def sparse_cheb_conv(self, x, laplacian):
+        """
+        Multiply x by the Chebyshev polynomials of a sparse laplacian without forming them.
+        :param x: input, [batch, 1, 1, N, time_step].
+        :param laplacian: sparse graph laplacian, [N, N].
+        :return: [batch, K, 1, N, time_step], the same as the dense multi order laplacian product.
+        """
+        batch_size, _, _, node_cnt, time_step = x.size()
+        x = x.reshape(batch_size, node_cnt, time_step).permute(1, 0, 2)
+        x = x.reshape(node_cnt, batch_size * time_step)
+        first = torch.zeros_like(x)
+        second = torch.sparse.mm(laplacian, x)
+        third = 2 * torch.sparse.mm(laplacian, second) - first
+        forth = 2 * torch.sparse.mm(laplacian, third) - second
+        gfted = torch.stack([first, second, third, forth], dim=0)
+        gfted = gfted.reshape(-1, node_cnt, batch_size, time_step).permute(2, 0, 1, 3)
+        return gfted.unsqueeze(2)
+
     def forward(self, x, mul_L):
-        mul_L = mul_L.unsqueeze(1)
         x = x.unsqueeze(1)
-        gfted = torch.matmul(mul_L, x)
+        if mul_L.is_sparse:
+            gfted = self.sparse_cheb_conv(x, mul_L)
+        else:
+            gfted = torch.matmul(mul_L.unsqueeze(1), x)
         gconv_input = self.spe_seq_cell(gfted).unsqueeze(2)
         igfted = torch.matmul(gconv_input, self.weight)
         igfted = torch.sum(igfted, dim=1)
@@ -155,6 +177,8 @@ class StemGNN(BaseMultivariate):
     `multi_layer`: int=5, multiplier for FC hidden size on StemGNN blocks.<br>
     `dropout_rate`: float=0.5, dropout rate.<br>
     `leaky_rate`: float=0.2, alpha for LeakyReLU layer on Latent Correlation layer.<br>
+    `top_k`: int, optional, if set, the graph is sparse, for panels of thousands of series. Its nodes are the series, described by their GRU outputs, instead of the GRU hidden units of the dense graph, and every series keeps only its `top_k` largest attention weights per window. The two graphs differ even with `top_k=n_series`.<br>
+    `gru_hidden_size`: int, optional, hidden size of the Latent Correlation GRU, defaults to `n_series`. Only `top_k` graphs support other sizes.<br>
     `loss`: PyTorch module, instantiated train loss class from [losses collection](https://nixtla.github.io/neuralforecast/losses.pytorch.html).<br>
     `valid_loss`: PyTorch module=`loss`, instantiated valid loss class from [losses collection](https://nixtla.github.io/neuralforecast/losses.pytorch.html).<br>
     `max_steps`: int=1000, maximum number of training steps.<br>
@@ -194,6 +218,8 @@ class StemGNN(BaseMultivariate):
         multi_layer: int = 5,
         dropout_rate: float = 0.5,
         leaky_rate: float = 0.2,
+        top_k: Optional[int] = None,
+        gru_hidden_size: Optional[int] = None,
         loss=MAE(),
         valid_loss=None,
         max_steps: int = 1000,
@@ -244,19 +270,27 @@ class StemGNN(BaseMultivariate):
         # Quick fix for now, fix the model later.
         if n_stacks != 2:
             raise Exception("StemGNN currently only supports n_stacks=2.")
+        if gru_hidden_size is None:
+            gru_hidden_size = n_series
+        if top_k is None and gru_hidden_size != n_series:
+            raise Exception(
+                "StemGNN only supports gru_hidden_size=n_series without top_k."
+            )
 
         self.unit = n_series
         self.stack_cnt = n_stacks
         self.alpha = leaky_rate
+        self.top_k = top_k
+        self.gru_hidden_size = gru_hidden_size
         self.time_step = input_size
         self.horizon = h
         self.h = h
 
-        self.weight_key = nn.Parameter(torch.zeros(size=(self.unit, 1)))
+        self.weight_key = nn.Parameter(torch.zeros(size=(self.gru_hidden_size, 1)))
         nn.init.xavier_uniform_(self.weight_key.data, gain=1.414)
-        self.weight_query = nn.Parameter(torch.zeros(size=(self.unit, 1)))
+        self.weight_query = nn.Parameter(torch.zeros(size=(self.gru_hidden_size, 1)))
         nn.init.xavier_uniform_(self.weight_query.data, gain=1.414)
-        self.GRU = nn.GRU(self.time_step, self.unit)
+        self.GRU = nn.GRU(self.time_step, self.gru_hidden_size)
         self.multi_layer = multi_layer
         self.stock_block = nn.ModuleList()
         self.stock_block.extend(
@@ -320,6 +354,9 @@ class StemGNN(BaseMultivariate):
     def latent_correlation_layer(self, x):
         input, _ = self.GRU(x.permute(2, 0, 1).contiguous())
         input = input.permute(1, 0, 2).contiguous()
+        if self.top_k is not None:
+            # The nodes of the sparse graph are the series, those of the dense one the GRU hidden units
+            return self.sparse_latent_correlation_layer(input)
         attention = self.self_graph_attention(input)
         attention = torch.mean(attention, dim=0)
         degree = torch.sum(attention, dim=1)
@@ -346,6 +383,77 @@ class StemGNN(BaseMultivariate):
         attention = self.dropout(attention)
         return attention
 
+    def sparse_latent_correlation_layer(self, input):
+        """
+        Sparse version of the latent correlation layer, only the top_k attention weights are kept.
+        :param input: GRU outputs, [batch, N, gru_hidden_size].
+        :return: sparse graph laplacian [N, N] and sparse symmetric attention [N, N].
+        """
+        attention = self.sparse_graph_attention(input)
+        N = attention.size(0)
+        indices = attention.indices()
+        values = attention.values()
+        degree = values.new_zeros(N).index_add(0, indices[0], values)
+        # laplacian is sym or not
+        indices = torch.cat([indices, indices.flip(0)], dim=1)
+        values = 0.5 * torch.cat([values, values])
+        attention = torch.sparse_coo_tensor(indices, values, (N, N))
+        degree_hat = 1 / (torch.sqrt(degree) + 1e-7)
+        diagonal = torch.arange(N, device=indices.device)
+        laplacian = torch.sparse_coo_tensor(
+            torch.cat([indices, diagonal.expand(2, -1)], dim=1),
+            torch.cat(
+                [
+                    -degree_hat[indices[0]] * values * degree_hat[indices[1]],
+                    degree * degree_hat**2,
+                ]
+            ),
+            (N, N),
+        ).coalesce()
+        return laplacian, attention
+
+    def sparse_graph_attention(self, input):
+        """
+        Batch mean of the attention of every window restricted to the top_k weights of each row.
+        :param input: GRU outputs, [batch, N, gru_hidden_size].
+        :return: sparse attention [N, N] with at most batch * top_k nonzeros per row.
+        """
+        bat, N, fea = input.size()
+        k = min(self.top_k, N)
+        key = torch.matmul(input, self.weight_key).squeeze(2)
+        query = torch.matmul(input, self.weight_query).squeeze(2)
+
+        # The scores leakyrelu(key_i + query_j) increase with query_j, so the top_k columns of every row
+        # are the top_k queries and the softmax normalizer follows from cumulative sums of the sorted queries:
+        # the scores are key_i + query_j above -key_i and alpha * (key_i + query_j) below.
+        sorted_query = torch.sort(query, dim=1).values
+        no_terms = query.new_full((bat, 1), -float("inf"))
+        log_suffix = torch.cat(
+            [torch.logcumsumexp(sorted_query.flip(1), dim=1).flip(1), no_terms], dim=1
+        )
+        log_prefix = torch.cat(
+            [no_terms, torch.logcumsumexp(self.alpha * sorted_query, dim=1)], dim=1
+        )
+        split = torch.searchsorted(sorted_query.detach(), -key.detach(), right=True)
+        log_norm = torch.logaddexp(
+            key + log_suffix.gather(1, split),
+            self.alpha * key + log_prefix.gather(1, split),
+        )
+
+        top_query, top_columns = torch.topk(query, k, dim=1)
+        data = self.leakyrelu(key.unsqueeze(2) + top_query.unsqueeze(1))
+        attention = torch.exp(data - log_norm.unsqueeze(2))
+        attention = self.dropout(attention)
+
+        rows = torch.arange(N, device=input.device).view(1, N, 1).expand(bat, N, k)
+        columns = top_columns.unsqueeze(1).expand(bat, N, k)
+        attention = torch.sparse_coo_tensor(
+            torch.stack([rows.reshape(-1), columns.reshape(-1)]),
+            attention.reshape(-1) / bat,
+            (N, N),
+        ).coalesce()
+        return attention
+
     def graph_fft(self, input, eigenvectors):
         return torch.matmul(eigenvectors, input)
 
@@ -5,7 +5,10 @@ __all__ = ['ReplicationPad1d', 'TokenEmbedding', 'PatchEmbedding', 'FlattenHead'
 
 # %% ../../nbs/models.timellm.ipynb 6
 import math
-from typing import Optional
+import weakref
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Dict, List, Optional
 
 import torch
 import torch.nn as nn
@@ -242,6 +245,30 @@ class Normalize(nn.Module):
             x = x + self.mean
         return x
 
+
+_PRETRAINED_LLMS: "weakref.WeakValueDictionary[str, nn.Module]" = (
+    weakref.WeakValueDictionary()
+)
+_PROMPT_CACHE_SIZE = 100_000
+
+
+def _load_pretrained_llm(model_name):
+    """
+    Loads the config, frozen model and tokenizer of a pretrained LLM.
+    The model is cached while it's alive, so that every TimeLLM instance using
+    the same `model_name` (e.g. several loaded checkpoints) shares the backbone.
+    It is released once no instance references it.
+    """
+    llm = _PRETRAINED_LLMS.get(model_name)
+    if llm is None:
+        llm_config = AutoConfig.from_pretrained(model_name)
+        llm = AutoModel.from_pretrained(model_name, config=llm_config)
+        for param in llm.parameters():
+            param.requires_grad = False
+        _PRETRAINED_LLMS[model_name] = llm
+    llm_tokenizer = AutoTokenizer.from_pretrained(model_name)
+    return llm.config, llm, llm_tokenizer
+
 # %% ../../nbs/models.timellm.ipynb 11
 class TimeLLM(BaseWindows):
     """TimeLLM
@@ -263,13 +290,14 @@ class TimeLLM(BaseWindows):
     `n_heads`: int=8, number of heads in attention layer.<br>
     `enc_in`: int=7, encoder input size.<br>
     `dec_in`: int=7, decoder input size.<br>
-    `llm` = None, Path to pretrained LLM model to use. If not specified, it will use GPT-2 from https://huggingface.co/openai-community/gpt2"<br>
+    `llm` = None, Path to pretrained LLM model to use. If not specified, it will use GPT-2 from https://huggingface.co/openai-community/gpt2". The frozen LLM weights are not saved with the model, they are reloaded from `llm` and shared between instances.<br>
     `llm_config` = Deprecated, configuration of LLM. If not specified, it will use the configuration of GPT-2 from https://huggingface.co/openai-community/gpt2"<br>
     `llm_tokenizer` = Deprecated, tokenizer of LLM. If not specified, it will use the GPT-2 tokenizer from https://huggingface.co/openai-community/gpt2"<br>
     `llm_num_hidden_layers` = 32, hidden layers in LLM
     `llm_output_attention`: bool = True, whether to output attention in encoder.<br>
     `llm_output_hidden_states`: bool = True, whether to output hidden states.<br>
     `prompt_prefix`: str=None, prompt to inform the LLM about the dataset.<br>
+    `prompt_decimals`: int=None, decimals the input statistics are rounded to in the prompt, which allows reusing tokenized prompts of similar windows. Rounding changes the prompts, and thus the forecasts, with respect to the default unrounded statistics.<br>
     `dropout`: float=0.1, dropout rate.<br>
     `stat_exog_list`: str list, static exogenous columns.<br>
     `hist_exog_list`: str list, historic exogenous columns.<br>
@@ -328,6 +356,7 @@ class TimeLLM(BaseWindows):
         llm_output_attention: bool = True,
         llm_output_hidden_states: bool = True,
         prompt_prefix: Optional[str] = None,
+        prompt_decimals: Optional[int] = None,
         dropout: float = 0.1,
         stat_exog_list=None,
         hist_exog_list=None,
@@ -418,22 +447,26 @@ class TimeLLM(BaseWindows):
             )
 
         try:
-            self.llm_config = AutoConfig.from_pretrained(model_name)
-            self.llm = AutoModel.from_pretrained(model_name, config=self.llm_config)
-            self.llm_tokenizer = AutoTokenizer.from_pretrained(model_name)
+            self.llm_config, self.llm, self.llm_tokenizer = _load_pretrained_llm(
+                model_name
+            )
             print(f"Successfully loaded model: {model_name}")
         except EnvironmentError:
             print(
                 f"Failed to load {model_name}. Loading the default model ({DEFAULT_MODEL})..."
             )
-            self.llm_config = AutoConfig.from_pretrained(DEFAULT_MODEL)
-            self.llm = AutoModel.from_pretrained(DEFAULT_MODEL, config=self.llm_config)
-            self.llm_tokenizer = AutoTokenizer.from_pretrained(DEFAULT_MODEL)
+            self.llm_config, self.llm, self.llm_tokenizer = _load_pretrained_llm(
+                DEFAULT_MODEL
+            )
 
         self.llm_num_hidden_layers = llm_num_hidden_layers
         self.llm_output_attention = llm_output_attention
         self.llm_output_hidden_states = llm_output_hidden_states
         self.prompt_prefix = prompt_prefix
+        self.prompt_decimals = prompt_decimals
+        self._prompt_cache: Dict[tuple, List[int]] = {}
+        self._source_embeddings = None
+        self._source_embeddings_key = None
 
         if self.llm_tokenizer.eos_token:
             self.llm_tokenizer.pad_token = self.llm_tokenizer.eos_token
@@ -442,9 +475,6 @@ class TimeLLM(BaseWindows):
             self.llm_tokenizer.add_special_tokens({"pad_token": pad_token})
             self.llm_tokenizer.pad_token = pad_token
 
-        for param in self.llm.parameters():
-            param.requires_grad = False
-
         self.patch_embedding = PatchEmbedding(
             self.d_model, self.patch_len, self.stride, self.dropout
         )
@@ -467,6 +497,61 @@ class TimeLLM(BaseWindows):
 
         self.normalize_layers = Normalize(self.enc_in, affine=False)
 
+    def __deepcopy__(self, memo):
+        # Copies (e.g. the ones made by NeuralForecast.fit) share the frozen LLM
+        for obj in (
+            self.llm,
+            self.word_embeddings,
+            self.llm_config,
+            self.llm_tokenizer,
+        ):
+            memo[id(obj)] = obj
+        copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copy
+        for key, value in self.__dict__.items():
+            if key in ("_source_embeddings", "_source_embeddings_key"):
+                # the copy recomputes its cached embeddings
+                value = None
+            copy.__dict__[key] = deepcopy(value, memo)
+        return copy
+
+    def _is_llm_key(self, key):
+        return key.startswith("llm.") or key == "word_embeddings"
+
+    def state_dict(self, *args, **kwargs):
+        # The frozen LLM is rehydrated from `llm` when loading,
+        # so only the trainable parameters are stored.
+        state_dict = super().state_dict(*args, **kwargs)
+        prefix = kwargs.get("prefix", "")
+        llm_keys = [
+            key
+            for key in state_dict
+            if key.startswith(prefix) and self._is_llm_key(key[len(prefix) :])
+        ]
+        for key in llm_keys:
+            del state_dict[key]
+        return state_dict
+
+    def load_state_dict(self, state_dict, strict=True, **kwargs):
+        # The LLM was already loaded in __init__, checkpoints created before it was
+        # excluded from the state_dict may still contain it, so we skip those keys.
+        metadata = getattr(state_dict, "_metadata", None)
+        state_dict = OrderedDict(
+            (key, value)
+            for key, value in state_dict.items()
+            if not self._is_llm_key(key)
+        )
+        if metadata is not None:
+            state_dict._metadata = metadata
+        result = super().load_state_dict(state_dict, strict=False, **kwargs)
+        missing_keys = [key for key in result.missing_keys if not self._is_llm_key(key)]
+        if strict and (missing_keys or result.unexpected_keys):
+            raise RuntimeError(
+                f"Error(s) in loading state_dict for {type(self).__name__}. "
+                f"Missing keys: {missing_keys}. Unexpected keys: {result.unexpected_keys}."
+            )
+        return result._replace(missing_keys=missing_keys)
+
     def forecast(self, x_enc):
 
         x_enc = self.normalize_layers(x_enc, "norm")
@@ -474,43 +559,14 @@ class TimeLLM(BaseWindows):
         B, T, N = x_enc.size()
         x_enc = x_enc.permute(0, 2, 1).contiguous().reshape(B * N, T, 1)
 
-        min_values = torch.min(x_enc, dim=1)[0]
-        max_values = torch.max(x_enc, dim=1)[0]
-        medians = torch.median(x_enc, dim=1).values
-        lags = self.calcute_lags(x_enc)
-        trends = x_enc.diff(dim=1).sum(dim=1)
-
-        prompt = []
-        for b in range(x_enc.shape[0]):
-            min_values_str = str(min_values[b].tolist()[0])
-            max_values_str = str(max_values[b].tolist()[0])
-            median_values_str = str(medians[b].tolist()[0])
-            lags_values_str = str(lags[b].tolist())
-            prompt_ = (
-                f"<|start_prompt|>{self.prompt_prefix}"
-                f"Task description: forecast the next {str(self.h)} steps given the previous {str(self.input_size)} steps information; "
-                "Input statistics: "
-                f"min value {min_values_str}, "
-                f"max value {max_values_str}, "
-                f"median value {median_values_str}, "
-                f"the trend of input is {'upward' if trends[b] > 0 else 'downward'}, "
-                f"top 5 lags are : {lags_values_str}<|<end_prompt>|>"
-            )
-
-            prompt.append(prompt_)
-
+        prompt = self.get_prompt_ids(x_enc)
         x_enc = x_enc.reshape(B, N, T).permute(0, 2, 1).contiguous()
 
-        prompt = self.llm_tokenizer(
-            prompt, return_tensors="pt", padding=True, truncation=True, max_length=2048
-        ).input_ids
         prompt_embeddings = self.llm.get_input_embeddings()(
-            prompt.to(x_enc.device)
+            prompt
         )  # (batch, prompt_token, dim)
 
-        source_embeddings = self.mapping_layer(
-            self.word_embeddings.permute(1, 0)
-        ).permute(1, 0)
+        source_embeddings = self.get_source_embeddings()
 
         x_enc = x_enc.permute(0, 2, 1).contiguous()
         enc_out, n_vars = self.patch_embedding(x_enc.to(torch.float32))
@@ -533,6 +589,87 @@ class TimeLLM(BaseWindows):
 
         return dec_out
 
+    def get_prompt_ids(self, x_enc):
+        min_values = torch.min(x_enc, dim=1)[0]
+        max_values = torch.max(x_enc, dim=1)[0]
+        medians = torch.median(x_enc, dim=1).values
+        lags = self.calcute_lags(x_enc)
+        trends = x_enc.diff(dim=1).sum(dim=1)
+
+        # Windows with the same (rounded) statistics share their prompt,
+        # so only the unique ones are formatted and tokenized
+        stats = torch.cat([min_values, max_values, medians], dim=1)
+        if self.prompt_decimals is not None:
+            stats = torch.round(stats, decimals=self.prompt_decimals)
+        keys = torch.cat(
+            [stats, (trends > 0).to(stats.dtype), lags.to(stats.dtype)], dim=1
+        )
+        unique_keys, inverse = torch.unique(keys, dim=0, return_inverse=True)
+        unique_keys = [tuple(key) for key in unique_keys.cpu().tolist()]
+
+        if len(self._prompt_cache) > _PROMPT_CACHE_SIZE:
+            self._prompt_cache.clear()
+        missing_keys = [key for key in unique_keys if key not in self._prompt_cache]
+        if missing_keys:
+            prompts = [self._format_prompt(key) for key in missing_keys]
+            input_ids = self.llm_tokenizer(
+                prompts, truncation=True, max_length=2048
+            ).input_ids
+            self._prompt_cache.update(zip(missing_keys, input_ids))
+
+        # Pad the unique prompts like the tokenizer would and expand them to every window
+        input_ids = [self._prompt_cache[key] for key in unique_keys]
+        max_length = max(len(ids) for ids in input_ids)
+        prompt = torch.full(
+            (len(input_ids), max_length),
+            self.llm_tokenizer.pad_token_id,
+            dtype=torch.long,
+        )
+        for i, ids in enumerate(input_ids):
+            if self.llm_tokenizer.padding_side == "left":
+                prompt[i, max_length - len(ids) :] = torch.tensor(ids)
+            else:
+                prompt[i, : len(ids)] = torch.tensor(ids)
+        return prompt.to(x_enc.device)[inverse]
+
+    def _format_prompt(self, key):
+        min_value, max_value, median_value, trend = key[:4]
+        if self.prompt_decimals is not None:
+            min_value, max_value, median_value = (
+                f"{value:.{self.prompt_decimals}f}"
+                for value in (min_value, max_value, median_value)
+            )
+        lags = [int(lag) for lag in key[4:]]
+        return (
+            f"<|start_prompt|>{self.prompt_prefix}"
+            f"Task description: forecast the next {str(self.h)} steps given the previous {str(self.input_size)} steps information; "
+            "Input statistics: "
+            f"min value {min_value}, "
+            f"max value {max_value}, "
+            f"median value {median_value}, "
+            f"the trend of input is {'upward' if trend > 0 else 'downward'}, "
+            f"top 5 lags are : {lags}<|<end_prompt>|>"
+        )
+
+    def get_source_embeddings(self):
+        if torch.is_grad_enabled():
+            return self.mapping_layer(self.word_embeddings.permute(1, 0)).permute(1, 0)
+
+        # Without gradients the embeddings only change after an optimizer step
+        # (or after moving the model), which is tracked by the parameters' versions
+        params = (
+            self.mapping_layer.weight,
+            self.mapping_layer.bias,
+            self.word_embeddings,
+        )
+        key = tuple((p.data_ptr(), p._version) for p in params)
+        if key != self._source_embeddings_key:
+            self._source_embeddings = self.mapping_layer(
+                self.word_embeddings.permute(1, 0)
+            ).permute(1, 0)
+            self._source_embeddings_key = key
+        return self._source_embeddings
+
     def calcute_lags(self, x_enc):
         q_fft = torch.fft.rfft(x_enc.permute(0, 2, 1).contiguous(), dim=-1)
         k_fft = torch.fft.rfft(x_enc.permute(0, 2, 1).contiguous(), dim=-1)
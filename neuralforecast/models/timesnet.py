@@ -55,12 +55,13 @@ def FFT_for_Period(x, k=2):
     # [B, T, C]
     xf = torch.fft.rfft(x, dim=1)
     # find period by amplitudes
-    frequency_list = abs(xf).mean(0).mean(-1)
+    amplitudes = abs(xf)
+    frequency_list = amplitudes.mean(0).mean(-1)
     frequency_list[0] = 0
     _, top_list = torch.topk(frequency_list, k)
-    top_list = top_list.detach().cpu().numpy()
+    # periods stay on the input's device to avoid a synchronization
     period = x.shape[1] // top_list
-    return period, abs(xf).mean(-1)[:, top_list]
+    return period, amplitudes.mean(-1)[:, top_list]
 
 
 class TimesBlock(nn.Module):
@@ -83,10 +84,17 @@ class TimesBlock(nn.Module):
     def forward(self, x):
         B, T, N = x.size()
         period_list, period_weight = FFT_for_Period(x, self.k)
+        period_weight = F.softmax(period_weight, dim=1)
+
+        # repeated periods have the same 2D variation, so the conv runs once
+        # per unique period and their aggregation weights are added together
+        periods, inverse = torch.unique(period_list, return_inverse=True)
+        period_weight = torch.zeros(
+            B, len(periods), dtype=period_weight.dtype, device=period_weight.device
+        ).index_add_(1, inverse, period_weight)
 
         res = []
-        for i in range(self.k):
-            period = period_list[i]
+        for period in periods.tolist():
             # padding
             if (self.input_size + self.h) % period != 0:
                 length = (((self.input_size + self.h) // period) + 1) * period
@@ -111,9 +119,7 @@ class TimesBlock(nn.Module):
             res.append(out[:, : (self.input_size + self.h), :])
         res = torch.stack(res, dim=-1)
         # adaptive aggregation
-        period_weight = F.softmax(period_weight, dim=1)
-        period_weight = period_weight.unsqueeze(1).unsqueeze(1).repeat(1, T, N, 1)
-        res = torch.sum(res * period_weight, -1)
+        res = torch.sum(res * period_weight[:, None, None, :], -1)
         # residual connection
         res = res + x
         return res
@@ -2,10 +2,11 @@
 
 # %% auto 0
 __all__ = ['TimeSeriesLoader', 'BaseTimeSeriesDataset', 'TimeSeriesDataset', 'LocalFilesTimeSeriesDataset',
-           'TimeSeriesDataModule']
+           'ParquetTimeSeriesDataset', 'TimeSeriesDataModule']
 
 # %% ../nbs/tsdataset.ipynb 4
 import warnings
+from copy import copy
 from collections.abc import Mapping
 from pathlib import Path
 from typing import List, Optional, Sequence, Union
@@ -15,7 +16,7 @@ import pandas as pd
 import pytorch_lightning as pl
 import torch
 import utilsforecast.processing as ufp
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import Dataset, DataLoader, IterableDataset, get_worker_info
 from utilsforecast.compat import DataFrame, pl_Series
 
 # %% ../nbs/tsdataset.ipynb 5
@@ -233,6 +234,32 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         )
         return dataset
 
+    def _align_rows(
+        self, df: Optional[DataFrame], rows: Optional[np.ndarray], h: int
+    ) -> "TimeSeriesDataset":
+        """
+        Future dataset with the `h` rows of each serie, taken from the `rows` of `df`, which
+        are already located by the caller. If `rows` is None, `df` holds them in order.
+        """
+        n_rows = self.n_groups * h
+        # missing columns are nulls and the available_mask is ones, as in `align`
+        temporal = np.full((n_rows, len(self.temporal_cols)), np.nan, dtype=np.float32)
+        for j, col in enumerate(self.temporal_cols):
+            if col == "available_mask":
+                temporal[:, j] = 1.0
+            elif df is not None and col in df.columns:
+                values = df[col].to_numpy()
+                temporal[:, j] = values if rows is None else values[rows]
+        return TimeSeriesDataset(
+            temporal=temporal,
+            temporal_cols=self.temporal_cols.copy(),
+            indptr=np.arange(0, n_rows + 1, h, dtype=np.int32),
+            max_size=h,
+            min_size=h,
+            y_idx=self.y_idx,
+            sorted=self.sorted,
+        )
+
     def append(self, futr_dataset: "TimeSeriesDataset") -> "TimeSeriesDataset":
         """Add future observations to the dataset. Returns a copy"""
         if self.indptr.size != futr_dataset.indptr.size:
@@ -248,16 +275,17 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         new_min_size = np.min(new_sizes)
         new_max_size = np.max(new_sizes)
 
-        for i in range(self.n_groups):
-            curr_slice = slice(self.indptr[i], self.indptr[i + 1])
-            curr_size = curr_slice.stop - curr_slice.start
-            futr_slice = slice(futr_dataset.indptr[i], futr_dataset.indptr[i + 1])
-            new_temporal[new_indptr[i] : new_indptr[i] + curr_size] = self.temporal[
-                curr_slice
-            ]
-            new_temporal[new_indptr[i] + curr_size : new_indptr[i + 1]] = (
-                futr_dataset.temporal[futr_slice]
-            )
+        # each serie is followed by its future rows
+        sizes = np.diff(self.indptr)
+        futr_sizes = np.diff(futr_dataset.indptr)
+        curr_idxs = np.repeat(new_indptr[:-1] - self.indptr[:-1], sizes) + np.arange(
+            len_temporal
+        )
+        futr_idxs = np.repeat(
+            new_indptr[:-1] + sizes - futr_dataset.indptr[:-1], futr_sizes
+        ) + np.arange(len_futr)
+        new_temporal[torch.from_numpy(curr_idxs)] = self.temporal
+        new_temporal[torch.from_numpy(futr_idxs)] = futr_dataset.temporal
 
         # Define new dataset
         return TimeSeriesDataset(
@@ -282,41 +310,53 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         return dataset.append(futr_dataset)
 
     @staticmethod
-    def trim_dataset(dataset, left_trim: int = 0, right_trim: int = 0):
+    def _trim_indices(
+        indptr,
+        left_trim: Union[int, np.ndarray] = 0,
+        right_trim: Union[int, np.ndarray] = 0,
+    ):
+        """
+        Positions of the rows kept by `trim_dataset` and the new indptr.
+        """
+        sizes = np.diff(indptr) - left_trim - right_trim
+        new_indptr = np.append(0, sizes.cumsum()).astype(np.int32)
+        offsets = np.repeat(indptr[:-1] + left_trim - new_indptr[:-1], sizes)
+        idxs = offsets + np.arange(new_indptr[-1])
+        return idxs, new_indptr
+
+    @staticmethod
+    def trim_dataset(
+        dataset,
+        left_trim: Union[int, np.ndarray] = 0,
+        right_trim: Union[int, np.ndarray] = 0,
+    ):
         """
         Trim temporal information from a dataset.
         Returns temporal indexes [t+left:t-right] for all series.
+        The trims can also be arrays with a value for each serie.
         """
-        if dataset.min_size <= left_trim + right_trim:
+        sizes = np.diff(dataset.indptr)
+        if (sizes <= left_trim + right_trim).any():
             raise Exception(
                 f"left_trim + right_trim ({left_trim} + {right_trim}) \
                                 must be lower than the shorter time series ({dataset.min_size})"
             )
 
-        # Define and fill new temporal with trimmed information
-        len_temporal, col_temporal = dataset.temporal.shape
-        total_trim = (left_trim + right_trim) * dataset.n_groups
-        new_temporal = torch.zeros(size=(len_temporal - total_trim, col_temporal))
-        new_indptr = [0]
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = series_length - left_trim - right_trim
-            new_temporal[acum : (acum + new_length), :] = dataset.temporal[
-                dataset.indptr[i] + left_trim : dataset.indptr[i + 1] - right_trim, :
-            ]
-            acum += new_length
-            new_indptr.append(acum)
-
-        new_max_size = dataset.max_size - left_trim - right_trim
-        new_min_size = dataset.min_size - left_trim - right_trim
+        # Gather the kept rows of all series at once
+        idxs, new_indptr = TimeSeriesDataset._trim_indices(
+            dataset.indptr, left_trim, right_trim
+        )
+        new_temporal = dataset.temporal[idxs]
+
+        new_sizes = np.diff(new_indptr)
+        new_max_size = new_sizes.max()
+        new_min_size = new_sizes.min()
 
         # Define new dataset
         updated_dataset = TimeSeriesDataset(
             temporal=new_temporal,
             temporal_cols=dataset.temporal_cols.copy(),
-            indptr=np.array(new_indptr, dtype=np.int32),
+            indptr=new_indptr,
             max_size=new_max_size,
             min_size=new_min_size,
             y_idx=dataset.y_idx,
@@ -327,6 +367,48 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
 
         return updated_dataset
 
+    @staticmethod
+    def _slice_series(dataset, start: int, end: int):
+        """
+        Dataset with the series [start:end] of `dataset`.
+        """
+        indptr = dataset.indptr[start : end + 1]
+        sizes = np.diff(indptr)
+        return TimeSeriesDataset(
+            temporal=dataset.temporal[indptr[0] : indptr[-1]],
+            temporal_cols=dataset.temporal_cols,
+            indptr=indptr - indptr[0],
+            max_size=sizes.max(),
+            min_size=sizes.min(),
+            y_idx=dataset.y_idx,
+            static=None if dataset.static is None else dataset.static[start:end],
+            static_cols=dataset.static_cols,
+            sorted=dataset.sorted,
+        )
+
+    @staticmethod
+    def _select_series(dataset, mask: np.ndarray):
+        """
+        Dataset with the series of `dataset` selected by the boolean `mask` and the positions of their rows.
+        """
+        sizes = np.diff(dataset.indptr)[mask]
+        indptr = np.append(0, sizes.cumsum()).astype(np.int32)
+        offsets = np.repeat(dataset.indptr[:-1][mask] - indptr[:-1], sizes)
+        idxs = offsets + np.arange(indptr[-1])
+        series_idxs = np.flatnonzero(mask)
+        selected = TimeSeriesDataset(
+            temporal=dataset.temporal[idxs],
+            temporal_cols=dataset.temporal_cols,
+            indptr=indptr,
+            max_size=sizes.max(),
+            min_size=sizes.min(),
+            y_idx=dataset.y_idx,
+            static=None if dataset.static is None else dataset.static[series_idxs],
+            static_cols=dataset.static_cols,
+            sorted=dataset.sorted,
+        )
+        return selected, idxs
+
     @staticmethod
     def from_df(
         df,
@@ -578,7 +660,251 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         )
         return dataset
 
-# %% ../nbs/tsdataset.ipynb 13
+# %% ../nbs/tsdataset.ipynb 11
+class ParquetTimeSeriesDataset(BaseTimeSeriesDataset, IterableDataset):
+    """Streams the series of a parquet dataset that doesn't fit in memory.
+
+    The parquet files are read one row group at a time and every row group is split into a
+    CSR block of complete series, the rows of a series that continues in the next row group are
+    carried over. When shuffling, the files are visited in a random order and the series go
+    through a shuffle window of `shuffle_window` series. Only a row group, the carried rows and
+    the shuffle window are held in memory.
+
+    The rows must be sorted by id and time within each file and every serie must be contained
+    in a single file. Use `ParquetTimeSeriesDataset.from_parquet` to build it.
+    """
+
+    def __init__(
+        self,
+        source,
+        temporal_cols,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        last_times,
+        indices,
+        fragment_offsets,
+        max_size: int,
+        min_size: int,
+        y_idx: int,
+        static=None,
+        static_cols=None,
+        sorted=False,
+        shuffle: bool = False,
+        shuffle_window: int = 1_024,
+    ):
+        super().__init__(
+            temporal_cols=temporal_cols,
+            max_size=max_size,
+            min_size=min_size,
+            y_idx=y_idx,
+            static=static,
+            static_cols=static_cols,
+            sorted=sorted,
+        )
+        # pyarrow dataset, keeps the list of files in a fixed order
+        self.source = source
+        self.id_col = id_col
+        self.time_col = time_col
+        self.target_col = target_col
+        # array with the last time for each timeseries
+        self.last_times = last_times
+        self.indices = indices
+        # position of the first serie of each file in `indices`
+        self.fragment_offsets = fragment_offsets
+        self.n_groups = len(indices)
+        self.shuffle = shuffle
+        self.shuffle_window = shuffle_window
+
+    def _with_shuffle(self, shuffle: bool) -> "ParquetTimeSeriesDataset":
+        dataset = copy(self)
+        dataset.shuffle = shuffle
+        return dataset
+
+    @staticmethod
+    def _iter_blocks(fragment, columns, schema, id_col):
+        # CSR blocks (table, indptr) with the complete series of each row group
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        carry = None
+        for row_group in fragment.split_by_row_group():
+            table = row_group.to_table(columns=columns, schema=schema)
+            if carry is not None:
+                table = pa.concat_tables([carry, table])
+            n_rows = table.num_rows
+            if n_rows == 0:
+                continue
+            ids = table[id_col]
+            changes = pc.not_equal(ids.slice(1), ids.slice(0, n_rows - 1)).to_numpy()
+            indptr = np.hstack([0, np.flatnonzero(changes) + 1, n_rows])
+            carry = table.slice(indptr[-2])
+            if indptr.size > 2:
+                yield table.slice(0, indptr[-2]), indptr[:-1]
+        if carry is not None:
+            yield carry, np.array([0, carry.num_rows])
+
+    def _iter_items(self, fragment_idxs):
+        import pyarrow as pa
+
+        stored_cols = [
+            col for col in self.temporal_cols if col in self.source.schema.names
+        ]
+        fragments = list(self.source.get_fragments())
+        for fragment_idx in fragment_idxs:
+            serie = self.fragment_offsets[fragment_idx]
+            blocks = self._iter_blocks(
+                fragments[fragment_idx],
+                columns=[self.id_col, *stored_cols],
+                schema=self.source.schema,
+                id_col=self.id_col,
+            )
+            for table, indptr in blocks:
+                # the available_mask defaults to ones when it isn't stored
+                data = np.ones(
+                    (table.num_rows, len(self.temporal_cols)), dtype=np.float32
+                )
+                for j, col in enumerate(self.temporal_cols):
+                    if col not in stored_cols:
+                        continue
+                    values = table[col]
+                    if pa.types.is_dictionary(values.type):
+                        values = values.cast(values.type.value_type)
+                    data[:, j] = values.to_numpy()
+                for start, end in zip(indptr[:-1], indptr[1:]):
+                    yield serie, data[start:end].T.copy()
+                    serie += 1
+
+    def _shuffle_items(self, items, rng):
+        # Keeps a window of series and yields a random one each time a new one comes in
+        window = []
+        for item in items:
+            window.append(item)
+            if len(window) == self.shuffle_window:
+                i = rng.integers(len(window))
+                window[i], window[-1] = window[-1], window[i]
+                yield window.pop()
+        rng.shuffle(window)
+        yield from window
+
+    def __iter__(self):
+        fragment_idxs = np.arange(len(self.fragment_offsets))
+        worker_info = get_worker_info()
+        if worker_info is not None:
+            fragment_idxs = fragment_idxs[worker_info.id :: worker_info.num_workers]
+        if self.shuffle:
+            # seeded from torch, which is seeded by the model and for each loader worker
+            rng = np.random.default_rng(
+                torch.empty((), dtype=torch.int64).random_().item()
+            )
+            rng.shuffle(fragment_idxs)
+            items = self._shuffle_items(self._iter_items(fragment_idxs), rng)
+        else:
+            items = self._iter_items(fragment_idxs)
+        for serie, data in items:
+            # Pad the temporal data to the left
+            temporal = torch.zeros(
+                size=(len(self.temporal_cols), self.max_size), dtype=torch.float32
+            )
+            temporal[:, -data.shape[1] :] = torch.from_numpy(data)
+            yield dict(
+                temporal=temporal,
+                temporal_cols=self.temporal_cols,
+                static=None if self.static is None else self.static[serie, :],
+                static_cols=self.static_cols,
+                y_idx=self.y_idx,
+            )
+
+    @staticmethod
+    def from_parquet(
+        path,
+        static_df=None,
+        sort_df=False,
+        exogs=[],
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        shuffle_window=1_024,
+    ):
+        """We expect path to be a parquet file or a directory with parquet files, optionally hive partitioned.
+        Within each file the rows should be sorted by id and time and each serie should be contained in a single file.
+        A first pass over the id and time columns gets the sizes and last times of the series.
+        Static df should be a pandas or polars DataFrame with the same ids as the files.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as pa_ds
+
+        source = pa_ds.dataset(path, format="parquet", partitioning="hive")
+        missing_cols = {id_col, time_col, target_col, *exogs} - set(source.schema.names)
+        if missing_cols:
+            raise ValueError(
+                f"Columns: {missing_cols} not found in the dataset: {path}."
+            )
+        if "available_mask" in source.schema.names:
+            temporal_cols = pd.Index([target_col, "available_mask", *exogs])
+        else:
+            temporal_cols = pd.Index([target_col, *exogs, "available_mask"])
+
+        sizes = []
+        ids = []
+        last_times = []
+        fragment_offsets = []
+        for fragment in source.get_fragments():
+            fragment_offsets.append(len(sizes))
+            blocks = ParquetTimeSeriesDataset._iter_blocks(
+                fragment,
+                columns=[id_col, time_col],
+                schema=source.schema,
+                id_col=id_col,
+            )
+            for table, indptr in blocks:
+                sizes.extend(np.diff(indptr).tolist())
+                ids.append(table[id_col].take(indptr[:-1]))
+                last_times.append(table[time_col].take(indptr[1:] - 1))
+        if not sizes:
+            raise ValueError(f"The dataset: {path} has no rows.")
+        ids = pa.chunked_array(ids).to_pandas().rename(id_col)
+        if not ids.is_unique:
+            raise ValueError(
+                "Each serie must be sorted and contained in a single file, "
+                f"found duplicated ids: {ids[ids.duplicated()].unique()[:5].tolist()}."
+            )
+        last_times = pd.Index(pa.chunked_array(last_times).to_pandas(), name=time_col)
+
+        static, static_cols = TimeSeriesDataset._extract_static_features(
+            static_df, sort_df, id_col
+        )
+        if static is not None:
+            # align the static features with the series in the files
+            static_ids = static_df[id_col]
+            if sort_df:
+                static_ids = ufp.sort(static_df, by=id_col)[id_col]
+            static_idxs = pd.Index(static_ids.to_numpy()).get_indexer(ids)
+            if (static_idxs == -1).any():
+                raise ValueError(
+                    f"Static features not found for ids: {ids[static_idxs == -1].tolist()[:5]}."
+                )
+            static = static[static_idxs]
+
+        return ParquetTimeSeriesDataset(
+            source=source,
+            temporal_cols=temporal_cols,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            last_times=last_times,
+            indices=ids,
+            fragment_offsets=np.array(fragment_offsets),
+            max_size=max(sizes),
+            min_size=min(sizes),
+            y_idx=0,
+            static=static,
+            static_cols=static_cols,
+            sorted=sort_df,
+            shuffle_window=shuffle_window,
+        )
+
+# %% ../nbs/tsdataset.ipynb 15
 class TimeSeriesDataModule(pl.LightningDataModule):
 
     def __init__(
@@ -598,36 +924,45 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         self.drop_last = drop_last
         self.shuffle_train = shuffle_train
 
+    def _loader_dataset(self, shuffle):
+        # Iterable datasets can't be sampled by the loader, they shuffle their own series
+        if isinstance(self.dataset, IterableDataset):
+            return self.dataset._with_shuffle(shuffle), False
+        return self.dataset, shuffle
+
     def train_dataloader(self):
+        dataset, shuffle = self._loader_dataset(self.shuffle_train)
         loader = TimeSeriesLoader(
-            self.dataset,
+            dataset,
             batch_size=self.batch_size,
             num_workers=self.num_workers,
-            shuffle=self.shuffle_train,
+            shuffle=shuffle,
             drop_last=self.drop_last,
         )
         return loader
 
     def val_dataloader(self):
+        dataset, shuffle = self._loader_dataset(False)
         loader = TimeSeriesLoader(
-            self.dataset,
+            dataset,
             batch_size=self.valid_batch_size,
             num_workers=self.num_workers,
-            shuffle=False,
+            shuffle=shuffle,
             drop_last=self.drop_last,
         )
         return loader
 
     def predict_dataloader(self):
+        dataset, shuffle = self._loader_dataset(False)
         loader = TimeSeriesLoader(
-            self.dataset,
+            dataset,
             batch_size=self.valid_batch_size,
             num_workers=self.num_workers,
-            shuffle=False,
+            shuffle=shuffle,
         )
         return loader
 
-# %% ../nbs/tsdataset.ipynb 27
+# %% ../nbs/tsdataset.ipynb 31
 class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
     def __init__(
         self,
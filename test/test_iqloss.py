@@ -78,6 +78,12 @@ forecasts_q10 = fcst.predict(futr_df=Y_test_df, quantile=0.1)
 forecasts_q50 = fcst.predict(futr_df=Y_test_df, quantile=0.5)
 forecasts_q90 = fcst.predict(futr_df=Y_test_df, quantile=0.9)
 
+#%% Test IQLoss prediction of several quantiles in a single pass
+forecasts_multi = fcst.predict(futr_df=Y_test_df, quantile=[0.1, 0.5, 0.9])
+for forecasts_q, q in zip([forecasts_q10, forecasts_q50, forecasts_q90], [0.1, 0.5, 0.9]):
+    for model in ['NBEATSx', 'NHITS', 'TSMixerx', 'LSTM', 'BiTCN']:
+        pd.testing.assert_series_equal(forecasts_multi[f'{model}_ql{q}'], forecasts_q[f'{model}_ql{q}'], atol=1e-3, rtol=1e-5)
+
 #%% Plot quantile predictions
 forecasts = forecasts_q50.reset_index()
 forecasts = forecasts.merge(forecasts_q10.reset_index())